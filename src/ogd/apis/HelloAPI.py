@@ -19,6 +19,7 @@ from ogd.apis.configs.ServerConfig import ServerConfig
 from ogd.apis.models.enums.ResponseStatus import ResponseStatus
 from ogd.apis.models.enums.RESTType import RESTType
 from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.utils.ConditionalResponse import ConditionalResponse
 
 class HelloAPI:
     @staticmethod
@@ -29,12 +30,14 @@ class HelloAPI:
         api.add_resource(HelloAPI.Version, '/version')
 
         HelloAPI.server_config = server_config
+        HelloAPI.version_response = APIResponse(
+            req_type = RESTType.GET,
+            val      = { "version" : str(server_config.Version) },
+            msg      = f"Successfully retrieved API version.",
+            status   = ResponseStatus.OK).Freeze()
 
     class Version(Resource):
         def get(self):
-            ret_val = APIResponse(
-                req_type = RESTType.GET,
-                val      = { "version" : str(HelloAPI.server_config.Version) },
-                msg      = f"Successfully retrieved API version.",
-                status   = ResponseStatus.OK)
-            return ret_val.AsDict
+            # The version is fixed once the API is registered, so the response is built and frozen then, and only encoded once.
+            # Clients that already have it are answered with NOT_MODIFIED.
+            return ConditionalResponse.Respond(build=lambda: HelloAPI.version_response)
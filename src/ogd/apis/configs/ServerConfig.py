@@ -17,24 +17,35 @@ from ogd.common.utils.typing import JSONMap, Map
 from ogd.common.utils.Logger import Logger
 
 # import local files
+from ogd.apis.models.enums.JSONBackend import JSONBackend
 
 class ServerConfig(Config):
-    _DEFAULT_DEBUG_LEVEL : Final[int] = logging.INFO
-    _DEFAULT_VERSION     : Final[str] = "UNKNOWN VERSION"
+    _DEFAULT_DEBUG_LEVEL       : Final[int]         = logging.INFO
+    _DEFAULT_VERSION           : Final[str]         = "UNKNOWN VERSION"
+    _DEFAULT_JSON_BACKEND      : Final[JSONBackend] = JSONBackend.STDLIB
+    _DEFAULT_COMPRESS_MIN_SIZE : Final[int]         = 1024
+    _DEFAULT_COMPRESS_LEVEL    : Final[int]         = 6
 
     # *** BUILT-INS & PROPERTIES ***
 
     def __init__(self, name:str,
                  debug_level:Optional[int], version:Optional[SemanticVersion],
-                 other_elements:Optional[Map]=None):
+                 other_elements:Optional[Map]=None, json_backend:Optional[JSONBackend]=None,
+                 compress_min_size:Optional[int]=None, compress_level:Optional[int]=None):
 
         unparsed_elements : Map = other_elements or {}
 
-        self._dbg_level : int
-        self._version   : SemanticVersion
+        self._dbg_level    : int
+        self._version      : SemanticVersion
+        self._json_backend : JSONBackend
+        self._compress_min : int
+        self._compress_lvl : int
 
-        self._version   = version     if version     is not None else self._parseVersion(unparsed_elements=unparsed_elements, schema_name=name)
-        self._dbg_level = debug_level if debug_level is not None else self._parseDebugLevel(unparsed_elements=unparsed_elements, schema_name=name)
+        self._version      = version           if version           is not None else self._parseVersion(unparsed_elements=unparsed_elements, schema_name=name)
+        self._dbg_level    = debug_level       if debug_level       is not None else self._parseDebugLevel(unparsed_elements=unparsed_elements, schema_name=name)
+        self._json_backend = json_backend      if json_backend      is not None else self._parseJSONBackend(unparsed_elements=unparsed_elements, schema_name=name)
+        self._compress_min = compress_min_size if compress_min_size is not None else self._parseCompressMinSize(unparsed_elements=unparsed_elements, schema_name=name)
+        self._compress_lvl = compress_level    if compress_level    is not None else self._parseCompressLevel(unparsed_elements=unparsed_elements, schema_name=name)
 
         super().__init__(name=name, other_elements=other_elements)
 
@@ -46,6 +57,33 @@ class ServerConfig(Config):
     def Version(self) -> SemanticVersion:
         return self._version
 
+    @property
+    def SerializerBackend(self) -> JSONBackend:
+        """Property for the library the server should use to encode and decode JSON, applied by `APIUtils.configure_app`.
+
+        :return: The configured JSON backend.
+        :rtype: JSONBackend
+        """
+        return self._json_backend
+
+    @property
+    def CompressMinSize(self) -> int:
+        """Property for the size, in bytes, under which response bodies are sent uncompressed, applied by `APIUtils.configure_app`.
+
+        :return: The minimum size of a body to compress.
+        :rtype: int
+        """
+        return self._compress_min
+
+    @property
+    def CompressLevel(self) -> int:
+        """Property for the gzip level to compress response bodies with, from 1 to 9, or 0 if responses should not be compressed.
+
+        :return: The configured compression level.
+        :rtype: int
+        """
+        return self._compress_lvl
+
     # *** IMPLEMENT ABSTRACT FUNCTIONS ***
 
     @property
@@ -59,7 +97,10 @@ class ServerConfig(Config):
     def AsDict(self) -> JSONMap:
         return {
             "API_VERSION": str(self.Version),
-            "DEBUG_LEVEL": self.DebugLevel
+            "DEBUG_LEVEL": self.DebugLevel,
+            "JSON_BACKEND": str(self.SerializerBackend),
+            "COMPRESS_MIN_SIZE": self.CompressMinSize,
+            "COMPRESS_LEVEL": self.CompressLevel
         }
 
     @classmethod
@@ -135,3 +176,63 @@ class ServerConfig(Config):
             Logger.Log(f"Config version was unexpected type {type(raw_version)}, defaulting to SemanticVersion(str(version))={ret_val}.", logging.WARN)
 
         return ret_val
+
+    @staticmethod
+    def _parseJSONBackend(unparsed_elements:Map, schema_name:Optional[str]=None) -> JSONBackend:
+        ret_val : JSONBackend
+
+        raw_backend = ServerConfig.ParseElement(
+            unparsed_elements=unparsed_elements,
+            valid_keys=["JSON_BACKEND"],
+            to_type=str,
+            default_value=str(ServerConfig._DEFAULT_JSON_BACKEND),
+            remove_target=True,
+            schema_name=schema_name
+        )
+        try:
+            ret_val = JSONBackend[str(raw_backend).upper()]
+        except KeyError:
+            ret_val = ServerConfig._DEFAULT_JSON_BACKEND
+            Logger.Log(f"Config JSON backend had unexpected value {raw_backend}, defaulting to {ret_val}.", logging.WARNING)
+
+        return ret_val
+
+    @staticmethod
+    def _parseCompressMinSize(unparsed_elements:Map, schema_name:Optional[str]=None) -> int:
+        ret_val : int
+
+        raw_size = ServerConfig.ParseElement(
+            unparsed_elements=unparsed_elements,
+            valid_keys=["COMPRESS_MIN_SIZE"],
+            to_type=int,
+            default_value=ServerConfig._DEFAULT_COMPRESS_MIN_SIZE,
+            remove_target=True,
+            schema_name=schema_name
+        )
+        if isinstance(raw_size, int) and raw_size >= 0:
+            ret_val = raw_size
+        else:
+            ret_val = ServerConfig._DEFAULT_COMPRESS_MIN_SIZE
+            Logger.Log(f"Config compression minimum size had unexpected value {raw_size}, defaulting to {ret_val}.", logging.WARNING)
+
+        return ret_val
+
+    @staticmethod
+    def _parseCompressLevel(unparsed_elements:Map, schema_name:Optional[str]=None) -> int:
+        ret_val : int
+
+        raw_level = ServerConfig.ParseElement(
+            unparsed_elements=unparsed_elements,
+            valid_keys=["COMPRESS_LEVEL"],
+            to_type=int,
+            default_value=ServerConfig._DEFAULT_COMPRESS_LEVEL,
+            remove_target=True,
+            schema_name=schema_name
+        )
+        if isinstance(raw_level, int) and 0 <= raw_level <= 9:
+            ret_val = raw_level
+        else:
+            ret_val = ServerConfig._DEFAULT_COMPRESS_LEVEL
+            Logger.Log(f"Config compression level had value {raw_level}, but gzip levels are from 0 to 9, defaulting to {ret_val}.", logging.WARNING)
+
+        return ret_val
@@ -1,32 +1,100 @@
+import asyncio
+import copy
+import gzip
 import logging
-from typing import Any, Dict, Optional
-from urllib.parse import urlparse, urlunparse, ParseResult
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from typing import Any, Dict, Final, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import urlencode, urlparse, urlunparse, ParseResult
 
 import requests
 from flask import current_app
+from ogd.common.utils.Logger import Logger
 
+from ogd.apis.models.enums.BatchMode import BatchMode
+from ogd.apis.models.enums.BodyEncoding import BodyEncoding
+from ogd.apis.models.enums.LatencyPhase import LatencyPhase
 from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.enums.ResponseEncoding import ResponseEncoding
 from ogd.apis.models.enums.ResponseStatus import ResponseStatus
 from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.models.APIResponseStream import APIResponseStream
+from ogd.apis.models.ChunkedUpload import ChunkedUpload
+from ogd.apis.models.RequestTimings import RequestTimings
+from ogd.apis.utils.CircuitBreaker import CircuitBreaker
+from ogd.apis.utils.EndpointGroup import EndpointGroup
+from ogd.apis.utils.HedgePolicy import HedgePolicy
+from ogd.apis.utils.JSONSerializer import JSONSerializer
+from ogd.apis.utils.LatencyRecorder import LatencyRecorder
+from ogd.apis.utils.RateLimiter import RateLimiter
+from ogd.apis.utils.RequestCoalescer import RequestCoalescer
+from ogd.apis.utils.ResponseCodec import ResponseCodec
+from ogd.apis.utils.ResponseCache import ResponseCache
+from ogd.apis.utils.RetryPolicy import RetryPolicy
+from ogd.apis.utils.SessionPool import SessionPool
+from ogd.apis.utils.Transport import Transport
 
 class APIRequest:
-    def __init__(self, url:str, request_type:str | RESTType, params:Optional[Dict[str, Any]]=None, body:Optional[Dict[str, Any]]=None, timeout:int=1):
+    _ACCEPT_ENCODING : Final[str] = "gzip, deflate"
+    _COMPRESS_LEVEL  : Final[int] = 6
+
+    def __init__(self, url:str, request_type:str | RESTType, params:Optional[Dict[str, Any]]=None, body:Optional[Any]=None, timeout:int=1,
+                 session_pool:Optional[SessionPool]=None, retry_policy:Optional[RetryPolicy]=None,
+                 circuit_breaker:Optional[CircuitBreaker]=None, cache:Optional[ResponseCache]=None,
+                 coalescer:Optional[RequestCoalescer]=None, latency_recorder:Optional[LatencyRecorder]=None,
+                 hedge_policy:Optional[HedgePolicy]=None, body_encoding:BodyEncoding=BodyEncoding.FORM,
+                 compress_threshold:Optional[int]=None, rate_limiter:Optional[RateLimiter]=None,
+                 endpoint_group:Optional[EndpointGroup]=None, transport:Optional[Transport]=None,
+                 response_encoding:ResponseEncoding=ResponseEncoding.JSON):
         """Utility function to make it easier to send requests to a remote server during unit testing.
 
         This function does some basic sanity checking of the target URL,
         maps the request type to the appropriate `requests` function call,
         and performs basic error handling to notify what error occurred.
 
-        :param url: The target URL for the web request
+        :param url: The target URL for the web request, or the endpoint relative to the base URLs of `endpoint_group`, if given.
         :type url: str
         :param request: Whether to perform a "GET", "POST", or "PUT" request
         :type request: str
         :param params: A mapping of request parameter names to values. Defaults to {}
         :type params: Dict[str, Any], optional
         :param body: The body of the request to send. Defaults to None
-        :type body: Dict[str, Any], optional
-        :param logger: A logger to use for debug/error outputs. Defaults to None
-        :type logger: logging.Logger, optional
+            A dict, or a list of key/value pairs for form data, is encoded according to `body_encoding`, while `str` and `bytes` are sent as-is.
+            A file object, memory-mapped file, or generator of chunks is uploaded a chunk at a time, as a `ChunkedUpload`.
+        :type body: Dict[str, Any] | List[Tuple[str, Any]] | str | bytes | IO | mmap.mmap | Iterator[bytes] | ChunkedUpload, optional
+        :param timeout: The number of seconds to wait for the server to respond. Defaults to 1
+        :type timeout: int, optional
+        :param session_pool: The pool of keep-alive sessions to send the request through. Defaults to None, in which case the shared `SessionPool.Default()` is used.
+        :type session_pool: SessionPool, optional
+        :param retry_policy: The policy for retrying timed-out or turned-away attempts. Defaults to None, in which case `RetryPolicy.Default()` is used.
+        :type retry_policy: RetryPolicy, optional
+        :param circuit_breaker: The breaker tracking failures of the target host. Defaults to None, in which case the shared `CircuitBreaker.Default()` is used.
+        :type circuit_breaker: CircuitBreaker, optional
+        :param cache: A cache to answer GET requests from, and store their responses in. Defaults to None, in which case responses are not cached.
+        :type cache: ResponseCache, optional
+        :param coalescer: A coalescer for sharing one upstream call between identical, concurrent GET requests. Defaults to None, in which case requests are not coalesced.
+        :type coalescer: RequestCoalescer, optional
+        :param latency_recorder: The recorder to add the request's per-phase timings to. Defaults to None, in which case the shared `LatencyRecorder.Default()` is used.
+        :type latency_recorder: LatencyRecorder, optional
+        :param hedge_policy: A policy for sending a duplicate of a slow GET request, and using whichever response arrives first. Defaults to None, in which case requests are not hedged.
+        :type hedge_policy: HedgePolicy, optional
+        :param body_encoding: Whether to send the body as form data or as JSON. Defaults to BodyEncoding.FORM
+        :type body_encoding: BodyEncoding, optional
+        :param compress_threshold: The size, in bytes, above which the encoded body is gzipped before sending. Defaults to None, in which case bodies are never compressed.
+            Only use this with servers that accept `Content-Encoding: gzip` request bodies.
+        :type compress_threshold: int, optional
+        :param rate_limiter: A limiter to take a token from for the target host before each attempt. Defaults to None, in which case the request is not rate-limited.
+        :type rate_limiter: RateLimiter, optional
+        :param endpoint_group: A group of replicas to balance the request across, in which case `url` is joined onto the chosen replica's base URL. Defaults to None
+        :type endpoint_group: EndpointGroup, optional
+        :param transport: The transport to send the request with, such as a `ReplayTransport` for offline tests. Defaults to None, in which case `session_pool` is used.
+        :type transport: Transport, optional
+        :param response_encoding: The encoding to ask the server to send its response in, falling back to JSON if the server doesn't support it. Defaults to ResponseEncoding.JSON
+            If MessagePack is requested, but `msgpack` is not installed, a warning is logged and JSON is requested instead.
+        :type response_encoding: ResponseEncoding, optional
         :raises err: Currently, any exceptions that occur during the request will be raised up.
             If verbose logging is on, a simple debug message indicating the request type and URL is printed first.
         :return: The `Response` object from the request, or None if an error occurred.
@@ -36,7 +104,7 @@ class APIRequest:
 
         self._request_type : RESTType
 
-        if not (url.startswith("http://") or url.startswith("https://")):
+        if endpoint_group is None and not (url.startswith("http://") or url.startswith("https://")):
             url = f"https://{url}"
         if isinstance(request_type, RESTType):
             self._request_type = request_type
@@ -49,51 +117,702 @@ class APIRequest:
 
         self._url = url
         self._params = params
-        self._body = body
+        self._body = ChunkedUpload(body) if ChunkedUpload.IsStreamable(body) and not isinstance(body, ChunkedUpload) else body
         self._timeout = timeout
+        self._session_pool = session_pool
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._cache = cache
+        self._coalescer = coalescer
+        self._latency_recorder = latency_recorder
+        self._hedge_policy = hedge_policy
+        self._body_encoding = body_encoding
+        self._compress_threshold = compress_threshold
+        self._rate_limiter = rate_limiter
+        self._endpoint_group = endpoint_group
+        self._transport = transport
+        self._response_encoding = response_encoding
+        if not ResponseCodec.Available(response_encoding):
+            Logger.Log(f"The {response_encoding} response encoding was requested, but its package is not installed; requesting JSON instead.", logging.WARNING)
+            self._response_encoding = ResponseEncoding.JSON
 
     def __str__(self) -> str:
         return f"Request: {self._request_type} {self._url}"
         
-    def Execute(self, logger:Optional[logging.Logger]=None, retry:int=0) -> APIResponse:
-        ret_val : APIResponse
+    def Execute(self, logger:Optional[logging.Logger]=None) -> APIResponse:
+        """Send the request, retrying timeouts and busy-server responses according to the request's RetryPolicy.
+
+        If every attempt times out, a `GATEWAY_TIMEOUT` response is returned.
+        If an unexpected error occurs, an `INTERNAL_ERR` response is returned.
+        If the request was given a RequestCoalescer, an identical GET already in flight is waited on, and its response shared, instead of sending another.
+        Timings of each request sent upstream are attached to its response, and added to the request's LatencyRecorder.
+        If the request was given a HedgePolicy, a GET with no response after the hedge delay is duplicated, and the first response is used.
+
+        :param logger: A logger to use for debug/error outputs. Defaults to None, in which case the Flask app logger is used, if available.
+        :type logger: logging.Logger, optional
+        :return: The response to the request.
+        :rtype: APIResponse
+        """
+        if logger is None and current_app:
+            logger = current_app.logger
+
+        key = self._requestKey()
+        if self._coalescer is not None and key is not None:
+            return self._coalescer.Do(key, lambda: self._execute(logger=logger))
+        return self._execute(logger=logger)
+
+    async def ExecuteAsync(self, logger:Optional[logging.Logger]=None) -> APIResponse:
+        """Awaitable counterpart to `Execute`, which sends the request without blocking a thread while waiting on the server.
+
+        Retries, caching and coalescing work as in `Execute`, and timeouts and unexpected errors map to the same `GATEWAY_TIMEOUT` and `INTERNAL_ERR` responses.
+        Sending through a SessionPool requires the optional `aiohttp` package; if it is not installed, `Execute` is run in a worker thread instead.
+
+        :param logger: A logger to use for debug/error outputs. Defaults to None, in which case the Flask app logger is used, if available.
+        :type logger: logging.Logger, optional
+        :return: The response to the request.
+        :rtype: APIResponse
+        """
+        if logger is None and current_app:
+            logger = current_app.logger
+
+        if isinstance(self._getTransport(), SessionPool) and not SessionPool.AsyncSupported():
+            if logger:
+                logger.debug(f"aiohttp is not installed, running {self} in a worker thread.")
+            return await asyncio.to_thread(self.Execute, logger)
+
+        key = self._requestKey()
+        if self._coalescer is not None and key is not None:
+            return await self._coalescer.DoAsync(key, lambda: self._executeAsync(logger=logger))
+        return await self._executeAsync(logger=logger)
+
+    def ExecuteStream(self, logger:Optional[logging.Logger]=None, chunk_size:int=64 * 1024, accept:Optional[str]=None) -> APIResponseStream:
+        """Send the request, and return a stream over the response instead of reading and decoding the whole body.
+
+        The status and envelope are available as soon as they arrive, and `val` can then be read one element at a time,
+        or passed on as raw bytes. See `APIResponseStream` for details.
+        Retries and the circuit breaker work as in `Execute`, but streamed responses are never cached or coalesced.
+        Only the timings up to the response headers are recorded, since the body has not been read yet.
+
+        :param logger: A logger to use for debug/error outputs. Defaults to None, in which case the Flask app logger is used, if available.
+        :type logger: logging.Logger, optional
+        :param chunk_size: The number of bytes to read from the connection at a time. Defaults to 64KiB
+        :type chunk_size: int, optional
+        :param accept: The `Accept` header to send, such as `"application/x-ndjson"` to have a server that supports it send rows as NDJSON. Defaults to None
+        :type accept: Optional[str], optional
+        :return: A stream over the response, which should be closed when done.
+        :rtype: APIResponseStream
+        """
+        if logger is None and current_app:
+            logger = current_app.logger
+
+        url, replica = self._target()
+        if replica is not None and self._endpoint_group is not None:
+            self._endpoint_group.Begin(replica)
+        timings = RequestTimings()
+        start   = time.perf_counter()
+        headers = {"Accept" : accept} if accept is not None else {}
+        result  = self._sendWithRetries(url, headers=headers, stream=True, timings=timings, logger=logger)
+        self._recordTimings(url, timings=timings, start=start)
+        if replica is not None:
+            status = result.Status if isinstance(result, APIResponse) else ResponseStatus(result.status_code)
+            self._finishReplica(replica, status=status, latency=timings.Phase(LatencyPhase.TOTAL))
+        if isinstance(result, APIResponse):
+            return APIResponseStream.FromAPIResponse(result)
+        return APIResponseStream.FromResponse(result, chunk_size=chunk_size)
+
+    def IterPages(self, prefetch:bool=False, cursor_param:str="cursor", logger:Optional[logging.Logger]=None) -> Iterator[APIResponse]:
+        """Send the request, then follow the `next` cursors of a paginated result, yielding each page's response as it is fetched.
+
+        Pages are fetched lazily, as the iterator is advanced, by re-sending the request with the previous page's cursor added to its params.
+        Iteration stops after a page that does not have a `PARTIAL` status and a next cursor, including an error response.
+        With `prefetch`, the next page is fetched in the background while the current one is being used,
+        so at most two pages are held at once. See `Paginator` for the server side.
+
+        :param prefetch: Whether to fetch the next page while the current one is being used. Defaults to False
+        :type prefetch: bool, optional
+        :param cursor_param: The name of the request parameter to send the cursor in. Defaults to "cursor"
+        :type cursor_param: str, optional
+        :param logger: A logger to use for debug/error outputs. Defaults to None, in which case the Flask app logger is used, if available.
+        :type logger: logging.Logger, optional
+        :return: An iterator over the response for each page.
+        :rtype: Iterator[APIResponse]
+        """
+        # The prefetching thread doesn't have the Flask app context, so resolve the logger up-front.
+        if logger is None and current_app:
+            logger = current_app.logger
 
+        response = self.Execute(logger=logger)
+        with ThreadPoolExecutor(max_workers=1) if prefetch else nullcontext() as executor:
+            while True:
+                cursor   = response.NextCursor if response.Status == ResponseStatus.PARTIAL else None
+                upcoming : Optional[Future[APIResponse]] = None
+                if cursor is not None and executor is not None:
+                    upcoming = executor.submit(self._pageRequest(cursor, cursor_param=cursor_param).Execute, logger)
+                yield response
+                if cursor is None:
+                    return
+                response = upcoming.result() if upcoming is not None else self._pageRequest(cursor, cursor_param=cursor_param).Execute(logger=logger)
+
+    @staticmethod
+    def ExecuteMany(batch:List["APIRequest"], max_workers:int=8, max_per_host:int=4,
+                    mode:BatchMode=BatchMode.GATHER_ALL, logger:Optional[logging.Logger]=None) -> List[APIResponse]:
+        """Execute a batch of requests concurrently, on a bounded pool of worker threads.
+
+        Results are returned in the same order as the given requests.
+        In `BatchMode.FAIL_FAST` mode, once any request gets a response that is not OK, requests that have not yet been sent are cancelled,
+        and get a `FAILED_DEPENDENCY` response in their place. Requests already in flight are allowed to finish.
+
+        :param batch: The requests to execute.
+        :type batch: List[APIRequest]
+        :param max_workers: The maximum number of requests in flight at once. Defaults to 8
+        :type max_workers: int, optional
+        :param max_per_host: The maximum number of requests in flight at once to any one host. Defaults to 4
+        :type max_per_host: int, optional
+        :param mode: Whether to run every request, or stop after the first failure. Defaults to BatchMode.GATHER_ALL
+        :type mode: BatchMode, optional
+        :param logger: A logger to use for debug/error outputs. Defaults to None, in which case the Flask app logger is used, if available.
+        :type logger: logging.Logger, optional
+        :return: The response to each request, in the same order as `batch`.
+        :rtype: List[APIResponse]
+        """
+        if not batch:
+            return []
+        # Worker threads don't have the Flask app context, so resolve the logger up-front.
         if logger is None and current_app:
             logger = current_app.logger
 
-        response : requests.Response
+        host_limits : Dict[str, threading.Semaphore] = {
+            request._hostKey() : threading.Semaphore(max(1, max_per_host)) for request in batch
+        }
+        failed = threading.Event()
+
+        def _run(request:APIRequest) -> APIResponse:
+            with host_limits[request._hostKey()]:
+                if failed.is_set():
+                    return request._cancelledResponse()
+                response = request.Execute(logger=logger)
+            if mode == BatchMode.FAIL_FAST and not response.OK:
+                failed.set()
+            return response
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batch)))) as executor:
+            futures = [executor.submit(_run, request) for request in batch]
+            if mode == BatchMode.FAIL_FAST:
+                for future in as_completed(futures):
+                    if failed.is_set():
+                        for pending in futures:
+                            pending.cancel()
+                        break
+        return [batch[i]._cancelledResponse() if future.cancelled() else future.result() for i, future in enumerate(futures)]
+
+    def _execute(self, logger:Optional[logging.Logger]) -> APIResponse:
+        ret_val          : APIResponse
+        response_headers : Optional[Mapping[str, str]]
+
+        cache_key = self._requestKey()
+        headers   : Dict[str, str] = {}
+        if self._cache is not None and cache_key is not None:
+            cached = self._cache.Get(cache_key)
+            if cached is not None:
+                if logger:
+                    logger.debug(f"Using cached response for {self}")
+                return cached
+            headers = self._cache.Validators(cache_key)
+
+        while True:
+            ret_val, response_headers = self._fetchTarget(headers=headers, logger=logger)
+            if response_headers is None:
+                return ret_val
+            if self._cache is None or cache_key is None:
+                break
+            ret_val = self._cache.Resolve(cache_key, ret_val, headers=response_headers)
+            if ret_val.Status != ResponseStatus.NOT_MODIFIED or not headers:
+                break
+            # The cached entry was evicted while it was being revalidated, so fetch the response in full, without validators.
+            if logger:
+                logger.debug(f"Cached response for {self} was evicted during revalidation, fetching it again.")
+            headers = {}
+        self._logResponse(ret_val, logger=logger)
+        return ret_val
+
+    def _fetchTarget(self, headers:Dict[str, str], logger:Optional[logging.Logger]) -> Tuple[APIResponse, Optional[Mapping[str, str]]]:
+        """Send the request to its target, hedging it if it is a GET with a HedgePolicy.
+        """
+        if self._hedge_policy is not None and self._request_type == RESTType.GET:
+            return self._fetchHedged(self._hedge_policy, headers=headers, logger=logger)
+        url, replica = self._target()
+        return self._fetch(url, headers=headers, logger=logger, replica=replica)
+
+    def _fetch(self, url:str, headers:Dict[str, str], logger:Optional[logging.Logger],
+               cancel:Optional[threading.Event]=None, replica:Optional[str]=None) -> Tuple[APIResponse, Optional[Mapping[str, str]]]:
+        """Send the request to the given URL, with retries, and decode the response, counting it against an EndpointGroup replica if given.
+
+        :return: The decoded response and its headers, or an APIResponse describing why no usable response was received, and None.
+        """
+        if replica is None or self._endpoint_group is None:
+            return self._fetchURL(url, headers=headers, logger=logger, cancel=cancel)
+        self._endpoint_group.Begin(replica)
+        outcome : Optional[Tuple[APIResponse, Optional[Mapping[str, str]]]] = None
+        try:
+            outcome = self._fetchURL(url, headers=headers, logger=logger, cancel=cancel)
+            return outcome
+        finally:
+            self._finishReplica(replica, response=outcome[0] if outcome else None)
+
+    def _fetchURL(self, url:str, headers:Dict[str, str], logger:Optional[logging.Logger],
+                  cancel:Optional[threading.Event]=None) -> Tuple[APIResponse, Optional[Mapping[str, str]]]:
+        timings = RequestTimings()
+        start   = time.perf_counter()
+        result  = self._sendWithRetries(url, headers=headers, stream=False, timings=timings, logger=logger, cancel=cancel)
+        if isinstance(result, APIResponse):
+            self._recordTimings(url, timings=timings, start=start)
+            return result, None
+
+        ret_val = APIResponse.FromResponse(result, timings=timings)
+        self._recordTimings(url, timings=timings, start=start)
+        return ret_val, result.headers
+
+    def _fetchHedged(self, policy:HedgePolicy, headers:Dict[str, str], logger:Optional[logging.Logger]) -> Tuple[APIResponse, Optional[Mapping[str, str]]]:
+        """Fetch the request, sending a hedge if no response arrives within the HedgePolicy's delay.
+
+        The first response that is not a server error wins, and the other attempt is cancelled.
+        Threads can't be interrupted, so a cancelled attempt stops at its next chance: before sending, before reading the body, or while waiting to retry.
+        """
+        url, replica = self._target()
+        delay   = policy.Delay(url, recorder=self._latency_recorder or LatencyRecorder.Default())
+        results : queue.Queue[Tuple[int, Tuple[APIResponse, Optional[Mapping[str, str]]]]] = queue.Queue()
+        cancels = (threading.Event(), threading.Event())
+
+        def _run(index:int, url:str, replica:Optional[str]):
+            results.put((index, self._fetch(url, headers=headers, logger=logger, cancel=cancels[index], replica=replica)))
+
+        threading.Thread(target=_run, args=(0, url, replica), daemon=True).start()
         try:
-            match (self._request_type):
-                case RESTType.GET:
-                    response = requests.get( self._url, params=self._params, timeout=self._timeout)
-                case RESTType.POST:
-                    response = requests.post(self._url, params=self._params, data=self._body, timeout=self._timeout)
-                case RESTType.PUT:
-                    response = requests.put( self._url, params=self._params, data=self._body, timeout=self._timeout)
-                case _:
+            _, outcome = results.get(timeout=delay)
+        except queue.Empty:
+            pass
+        else:
+            policy.RecordOutcome(hedged=False, won=False)
+            return outcome
+
+        hedge_url, hedge_replica = self._hedgeTarget(policy, url=url, replica=replica)
+        if logger:
+            logger.debug(f"No response from {self} after {delay:.3f}s, sending hedge to {hedge_url}")
+        threading.Thread(target=_run, args=(1, hedge_url, hedge_replica), daemon=True).start()
+        winner, outcome = results.get()
+        if outcome[0].Status in ResponseStatus.ServerErrors():
+            # Give the other attempt a chance to do better than a server error.
+            other, other_outcome = results.get()
+            if other_outcome[0].Status not in ResponseStatus.ServerErrors() or other == 0:
+                winner, outcome = other, other_outcome
+        else:
+            cancels[1 - winner].set()
+        policy.RecordOutcome(hedged=True, won=winner == 1)
+        return outcome
+
+    def _sendWithRetries(self, url:str, headers:Dict[str, str], stream:bool, timings:RequestTimings, logger:Optional[logging.Logger],
+                         cancel:Optional[threading.Event]=None) -> requests.Response | APIResponse:
+        """Send the request to the given URL, retrying according to the RetryPolicy and checking the CircuitBreaker before each attempt.
+
+        Unless `stream` is set, the body of the final response is read before returning, so that its download can be timed.
+        If `cancel` is set, the request stops before its next attempt, or before reading the body of the current one.
+
+        :return: The final response from the server, or an APIResponse describing why no usable response was received.
+        """
+        policy   = self._retry_policy or RetryPolicy.Default()
+        breaker  = self._circuit_breaker or CircuitBreaker.Default()
+        deadline = policy.StartDeadline()
+        retry    = 0
+        data, send_headers, body_size = self._encodeBody(headers)
+        resendable = not isinstance(data, ChunkedUpload) or data.Rewindable
+        while True:
+            delay : Optional[float]
+            if cancel is not None and cancel.is_set():
+                return self._cancelledResponse(reason="a hedged duplicate finished first")
+            if self._rate_limiter is not None and not self._rate_limiter.Acquire(url, timeout=APIRequest._remaining(deadline)):
+                if logger:
+                    logger.warning(f"Rate limit for {SessionPool.HostKey(url)} would not allow {self} before its deadline.")
+                return self._rateLimitedResponse()
+            permit = breaker.Allow(url)
+            if permit is None:
+                if logger:
+                    logger.warning(f"Circuit is open for {SessionPool.HostKey(url)}, not executing {self}.")
+                return self._unavailableResponse()
+            timings.ClearPhases()
+            timings.Retries          = retry
+            timings.RequestBytes     = body_size
+            timings.RequestWireBytes = len(data) if isinstance(data, bytes) else body_size
+            attempt_start            = time.perf_counter()
+            try:
+                response = self._send(url, timeout=policy.AttemptTimeout(self._timeout, deadline), headers=send_headers, data=data, timings=timings, logger=logger)
+                headers_at = time.perf_counter()
+                timings.SetPhase(LatencyPhase.FIRST_BYTE, headers_at - attempt_start - (timings.Phase(LatencyPhase.CONNECT) or 0.0))
+                if cancel is not None and cancel.is_set():
+                    breaker.RecordResult(url, status=response.status_code, permit=permit)
+                    response.close()
+                    return self._cancelledResponse(reason="a hedged duplicate finished first")
+                if stream:
+                    timings.ResponseWireBytes = int(response.headers.get("Content-Length", 0))
+                    timings.ResponseBytes     = timings.ResponseWireBytes if "Content-Encoding" not in response.headers else 0
+                else:
+                    timings.ResponseBytes     = len(response.content)
+                    timings.ResponseWireBytes = response.raw.tell()
+                    timings.SetPhase(LatencyPhase.DOWNLOAD, time.perf_counter() - headers_at)
+            except requests.exceptions.Timeout:
+                breaker.RecordFailure(url, permit=permit)
+                delay = policy.NextDelay(retry, deadline=deadline) if resendable else None
+                if delay is None:
                     if logger:
-                        logger.warning(f"Bad request type {self._request_type}, defaulting to GET")
-                    response = requests.get(self._url, params=self._params, timeout=self._timeout)
-        except requests.exceptions.ReadTimeout:
-            if retry < 5:
+                        logger.error(f"Timeout error executing {self}.")
+                    return self._timeoutResponse()
+                if logger:
+                    logger.error(f"Timeout error executing {self}, trying again in {delay:.2f}s...")
+            except Exception as err:
+                breaker.RecordFailure(url, permit=permit)
                 if logger:
-                    logger.error(f"Timeout error executing {self}, trying again...")
-                return self.Execute(logger=logger, retry=retry+1)
+                    logger.error(f"Error on {self._request_type} request to {url} : {err}")
+                return self._errorResponse()
             else:
+                breaker.RecordResult(url, status=response.status_code, permit=permit)
+                retry_after = RetryPolicy.ParseRetryAfter(response.headers.get("Retry-After"))
+                delay = policy.NextDelay(retry, deadline=deadline, retry_after=retry_after) if policy.ShouldRetryStatus(response.status_code) and resendable else None
+                if delay is None:
+                    return response
                 if logger:
-                    logger.error(f"Timeout error executing {self}.")
-                return APIResponse(req_type=self._request_type, val=None, msg="Could not retrieve results, server timed out!", status=ResponseStatus.GATEWAY_TIMEOUT)
-        except Exception as err:
+                    logger.warning(f"Got status {response.status_code} executing {self}, trying again in {delay:.2f}s...")
+                response.close()
+            finally:
+                # Free the trial slot of an attempt that ended without an outcome, such as a cancelled hedge. Does nothing once an outcome was recorded.
+                breaker.Release(url, permit=permit)
+            if cancel is not None:
+                cancel.wait(delay)
+            else:
+                time.sleep(delay)
+            retry += 1
+
+    async def _executeAsync(self, logger:Optional[logging.Logger]) -> APIResponse:
+        ret_val          : APIResponse
+        response_headers : Optional[Mapping[str, str]]
+
+        cache_key = self._requestKey()
+        headers   : Dict[str, str] = {}
+        if self._cache is not None and cache_key is not None:
+            cached = self._cache.Get(cache_key)
+            if cached is not None:
+                if logger:
+                    logger.debug(f"Using cached response for {self}")
+                return cached
+            headers = self._cache.Validators(cache_key)
+
+        while True:
+            ret_val, response_headers = await self._fetchTargetAsync(headers=headers, logger=logger)
+            if response_headers is None:
+                return ret_val
+            if self._cache is None or cache_key is None:
+                break
+            ret_val = self._cache.Resolve(cache_key, ret_val, headers=response_headers)
+            if ret_val.Status != ResponseStatus.NOT_MODIFIED or not headers:
+                break
+            # The cached entry was evicted while it was being revalidated, so fetch the response in full, without validators.
             if logger:
-                logger.error(f"Error on {self._request_type} request to {self._url} : {err}")
-            return APIResponse(req_type=self._request_type, val=None, msg="Could not retrieve results, encountered an unexpected error while executing request!", status=ResponseStatus.INTERNAL_ERR)
+                logger.debug(f"Cached response for {self} was evicted during revalidation, fetching it again.")
+            headers = {}
+        self._logResponse(ret_val, logger=logger)
+        return ret_val
+
+    async def _fetchTargetAsync(self, headers:Dict[str, str], logger:Optional[logging.Logger]) -> Tuple[APIResponse, Optional[Mapping[str, str]]]:
+        """Awaitable counterpart to `_fetchTarget`.
+        """
+        if self._hedge_policy is not None and self._request_type == RESTType.GET:
+            return await self._fetchHedgedAsync(self._hedge_policy, headers=headers, logger=logger)
+        url, replica = self._target()
+        return await self._fetchAsync(url, headers=headers, logger=logger, replica=replica)
+
+    async def _fetchAsync(self, url:str, headers:Dict[str, str], logger:Optional[logging.Logger],
+                          replica:Optional[str]=None) -> Tuple[APIResponse, Optional[Mapping[str, str]]]:
+        """Awaitable counterpart to `_fetch`, which sends the request to the given URL with retries, and decodes the response.
+        """
+        if replica is None or self._endpoint_group is None:
+            return await self._fetchURLAsync(url, headers=headers, logger=logger)
+        self._endpoint_group.Begin(replica)
+        outcome : Optional[Tuple[APIResponse, Optional[Mapping[str, str]]]] = None
+        try:
+            outcome = await self._fetchURLAsync(url, headers=headers, logger=logger)
+            return outcome
+        finally:
+            self._finishReplica(replica, response=outcome[0] if outcome else None)
+
+    async def _fetchURLAsync(self, url:str, headers:Dict[str, str], logger:Optional[logging.Logger]) -> Tuple[APIResponse, Optional[Mapping[str, str]]]:
+        timings  = RequestTimings()
+        start    = time.perf_counter()
+        policy   = self._retry_policy or RetryPolicy.Default()
+        breaker  = self._circuit_breaker or CircuitBreaker.Default()
+        deadline = policy.StartDeadline()
+        retry    = 0
+        data, send_headers, body_size = self._encodeBody(headers)
+        resendable = not isinstance(data, ChunkedUpload) or data.Rewindable
+        while True:
+            delay : Optional[float]
+            if self._rate_limiter is not None and not await self._rate_limiter.AcquireAsync(url, timeout=APIRequest._remaining(deadline)):
+                if logger:
+                    logger.warning(f"Rate limit for {SessionPool.HostKey(url)} would not allow {self} before its deadline.")
+                self._recordTimings(url, timings=timings, start=start)
+                return self._rateLimitedResponse(), None
+            permit = breaker.Allow(url)
+            if permit is None:
+                if logger:
+                    logger.warning(f"Circuit is open for {SessionPool.HostKey(url)}, not executing {self}.")
+                self._recordTimings(url, timings=timings, start=start)
+                return self._unavailableResponse(), None
+            timings.ClearPhases()
+            timings.Retries          = retry
+            timings.RequestBytes     = body_size
+            timings.RequestWireBytes = len(data) if isinstance(data, bytes) else body_size
+            try:
+                status, response_headers, content = await self._sendAsync(url, timeout=policy.AttemptTimeout(self._timeout, deadline),
+                                                                          headers=send_headers, data=data, timings=timings)
+            except asyncio.TimeoutError:
+                breaker.RecordFailure(url, permit=permit)
+                delay = policy.NextDelay(retry, deadline=deadline) if resendable else None
+                if delay is None:
+                    if logger:
+                        logger.error(f"Timeout error executing {self}.")
+                    self._recordTimings(url, timings=timings, start=start)
+                    return self._timeoutResponse(), None
+                if logger:
+                    logger.error(f"Timeout error executing {self}, trying again in {delay:.2f}s...")
+            except Exception as err:
+                breaker.RecordFailure(url, permit=permit)
+                if logger:
+                    logger.error(f"Error on {self._request_type} request to {url} : {err}")
+                self._recordTimings(url, timings=timings, start=start)
+                return self._errorResponse(), None
+            else:
+                breaker.RecordResult(url, status=status, permit=permit)
+                retry_after = RetryPolicy.ParseRetryAfter(response_headers.get("Retry-After"))
+                delay = policy.NextDelay(retry, deadline=deadline, retry_after=retry_after) if policy.ShouldRetryStatus(status) and resendable else None
+                if delay is None:
+                    ret_val = APIResponse.FromContent(content, status_code=status, timings=timings, content_type=response_headers.get("Content-Type"))
+                    self._recordTimings(url, timings=timings, start=start)
+                    return ret_val, response_headers
+                if logger:
+                    logger.warning(f"Got status {status} executing {self}, trying again in {delay:.2f}s...")
+            finally:
+                # Free the trial slot of an attempt that ended without an outcome, such as a cancelled hedge. Does nothing once an outcome was recorded.
+                breaker.Release(url, permit=permit)
+            await asyncio.sleep(delay)
+            retry += 1
+
+    async def _fetchHedgedAsync(self, policy:HedgePolicy, headers:Dict[str, str], logger:Optional[logging.Logger]) -> Tuple[APIResponse, Optional[Mapping[str, str]]]:
+        """Awaitable counterpart to `_fetchHedged`. Here, the losing attempt's task is cancelled outright, closing its connection.
+        """
+        url, replica = self._target()
+        delay   = policy.Delay(url, recorder=self._latency_recorder or LatencyRecorder.Default())
+        primary = asyncio.ensure_future(self._fetchAsync(url, headers=headers, logger=logger, replica=replica))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            policy.RecordOutcome(hedged=False, won=False)
+            return primary.result()
+
+        hedge_url, hedge_replica = self._hedgeTarget(policy, url=url, replica=replica)
+        if logger:
+            logger.debug(f"No response from {self} after {delay:.3f}s, sending hedge to {hedge_url}")
+        hedge   = asyncio.ensure_future(self._fetchAsync(hedge_url, headers=headers, logger=logger, replica=hedge_replica))
+        pending = {primary, hedge}
+        winner  : Optional[asyncio.Future] = None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.result()[0].Status not in ResponseStatus.ServerErrors():
+                        winner = task
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+            # Let the cancelled attempt unwind, so it has released its connection and circuit breaker slot before the winner is used.
+            if pending:
+                await asyncio.wait(pending)
+        # If both attempts got server errors, report the original request's.
+        winner = winner or primary
+        policy.RecordOutcome(hedged=True, won=winner is hedge)
+        return winner.result()
+
+    def _requestKey(self) -> Optional[str]:
+        """Get the key identifying identical GET requests, for caching and coalescing. Other request types have no key.
+        """
+        if self._request_type != RESTType.GET:
+            return None
+        url = self._url if self._endpoint_group is None else f"{self._endpoint_group.Name}|{self._url}"
+        return ResponseCache.Key(url, APIRequest._flattenParams(self._params))
+
+    def _hostKey(self) -> str:
+        return SessionPool.HostKey(self._url) if self._endpoint_group is None else self._endpoint_group.Name
+
+    def _target(self, exclude:Optional[str]=None) -> Tuple[str, Optional[str]]:
+        """Get the full URL to send the request to, choosing a replica if the request targets an EndpointGroup.
+
+        :return: The full URL, and the base URL of the chosen replica, or None if there is no EndpointGroup.
+        """
+        if self._endpoint_group is None:
+            return self._url, None
+        replica = self._endpoint_group.Choose(exclude=exclude)
+        return EndpointGroup.URL(replica, self._url), replica
+
+    def _hedgeTarget(self, policy:HedgePolicy, url:str, replica:Optional[str]) -> Tuple[str, Optional[str]]:
+        """Get the URL to send a hedge to: another replica of the EndpointGroup, if there is one, or else the HedgePolicy's next alternate.
+        """
+        if self._endpoint_group is not None:
+            return self._target(exclude=replica)
+        return policy.HedgeURL(url), None
+
+    def _finishReplica(self, replica:str, response:Optional[APIResponse]=None, status:Optional[ResponseStatus]=None, latency:Optional[float]=None):
+        """Count a request to an EndpointGroup replica as finished. Server errors, including timeouts, count as failures.
+        """
+        if self._endpoint_group is None:
+            return
+        if response is not None:
+            status  = response.Status
+            latency = response.Timings.Phase(LatencyPhase.TOTAL) if response.Timings is not None else None
+        failed = status is not None and status in ResponseStatus.ServerErrors()
+        self._endpoint_group.End(replica, failed=failed, latency=None if failed else latency)
+
+    def _send(self, url:str, timeout:float, headers:Dict[str, str], data:Optional[Dict[str, Any] | bytes | ChunkedUpload], timings:RequestTimings, logger:Optional[logging.Logger]) -> requests.Response:
+        # Always stream, so that waiting for the headers and downloading the body can be timed separately.
+        pool = self._getTransport()
+        if isinstance(data, ChunkedUpload):
+            data = data.Chunks(timings=timings, compress="Content-Encoding" in headers) # type: ignore[assignment]
+        match (self._request_type):
+            case RESTType.GET:
+                return pool.Request("GET",  url, params=self._params, headers=headers, timeout=timeout, stream=True, timings=timings)
+            case RESTType.POST:
+                return pool.Request("POST", url, params=self._params, headers=headers, data=data, timeout=timeout, stream=True, timings=timings)
+            case RESTType.PUT:
+                return pool.Request("PUT",  url, params=self._params, headers=headers, data=data, timeout=timeout, stream=True, timings=timings)
+            case _:
+                if logger:
+                    logger.warning(f"Bad request type {self._request_type}, defaulting to GET")
+                return pool.Request("GET", url, params=self._params, headers=headers, timeout=timeout, stream=True, timings=timings)
+
+    async def _sendAsync(self, url:str, timeout:float, headers:Dict[str, str], data:Optional[Dict[str, Any] | bytes | ChunkedUpload],
+                         timings:RequestTimings) -> Tuple[int, Mapping[str, str], bytes]:
+        if isinstance(data, ChunkedUpload):
+            data = data.ChunksAsync(timings=timings, compress="Content-Encoding" in headers) # type: ignore[assignment]
+        return await self._getTransport().RequestAsync(str(self._request_type), url, params=APIRequest._flattenParams(self._params),
+                                                       headers=headers, data=data, timeout=timeout, timings=timings)
+
+    def _getTransport(self) -> Transport:
+        if self._transport is not None:
+            return self._transport
+        return self._session_pool or SessionPool.Default()
+
+    def _encodeBody(self, headers:Dict[str, str]) -> Tuple[Optional[Dict[str, Any] | bytes | ChunkedUpload], Dict[str, str], int]:
+        """Encode the body according to the request's BodyEncoding, gzipping it if it is over the compression threshold.
+
+        A form body that won't be compressed is left as a dict, for `requests` or `aiohttp` to encode.
+        A ChunkedUpload is left as-is, to be read as it is sent, and is gzipped on the fly unless its size is known to be under the threshold.
+
+        :return: The data to send, the given headers plus any needed to describe the data, and the size of the body before compression.
+        """
+        send_headers = {"Accept-Encoding" : APIRequest._ACCEPT_ENCODING, **headers}
+        if self._response_encoding != ResponseEncoding.JSON and "Accept" not in send_headers:
+            send_headers["Accept"] = f"{ResponseCodec.MimeType(self._response_encoding)}, application/json;q=0.5"
+        if self._body is None or self._request_type not in {RESTType.POST, RESTType.PUT}:
+            return None, send_headers, 0
+
+        if isinstance(self._body, ChunkedUpload):
+            send_headers["Content-Type"] = "application/json" if self._body_encoding == BodyEncoding.JSON else "application/octet-stream"
+            size = self._body.Size
+            if self._compress_threshold is not None and (size is None or size > self._compress_threshold):
+                send_headers["Content-Encoding"] = "gzip"
+            return self._body, send_headers, 0
+
+        data : bytes
+        if isinstance(self._body, (bytes, str)):
+            data = self._body if isinstance(self._body, bytes) else self._body.encode("utf-8")
+        elif self._body_encoding == BodyEncoding.JSON:
+            data = JSONSerializer.Default().Dumps(self._body)
+            send_headers["Content-Type"] = "application/json"
+        elif self._compress_threshold is None:
+            return self._body, send_headers, APIRequest._bodySize(self._body)
         else:
-            ret_val = APIResponse.FromResponse(response)
-            if logger:
-                out = logger.debug if ret_val.Status == ResponseStatus.OK else logger.warning
-                out(f"Request sent to:        {self._url}, with params {self._params}")
-                out(f"Response received from: {self._url}")
-                out(f"   Status: {ret_val.Status}")
-                out(f"   Msg:    {ret_val.Message}")
-                out(f"   Value:  {ret_val.Value}")
+            data = urlencode(APIRequest._flattenParams(self._body)).encode("utf-8")
+            send_headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+        size = len(data)
+        if self._compress_threshold is not None and size > self._compress_threshold:
+            data = gzip.compress(data, compresslevel=APIRequest._COMPRESS_LEVEL)
+            send_headers["Content-Encoding"] = "gzip"
+        return data, send_headers, size
+
+    def _pageRequest(self, cursor:str, cursor_param:str) -> "APIRequest":
+        ret_val = copy.copy(self)
+        ret_val._params = {**self._params, cursor_param : cursor}
         return ret_val
+
+    def _timeoutResponse(self) -> APIResponse:
+        return APIResponse(req_type=self._request_type, val=None, msg="Could not retrieve results, server timed out!", status=ResponseStatus.GATEWAY_TIMEOUT)
+
+    def _errorResponse(self) -> APIResponse:
+        return APIResponse(req_type=self._request_type, val=None, msg="Could not retrieve results, encountered an unexpected error while executing request!", status=ResponseStatus.INTERNAL_ERR)
+
+    def _unavailableResponse(self) -> APIResponse:
+        return APIResponse(req_type=self._request_type, val=None, msg="Could not retrieve results, remote server is unavailable after repeated failures!", status=ResponseStatus.UNAVAILABLE)
+
+    def _rateLimitedResponse(self) -> APIResponse:
+        return APIResponse(req_type=self._request_type, val=None, msg="Could not send request, client-side rate limit would not allow it before the deadline!", status=ResponseStatus.TOO_MANY_REQUESTS)
+
+    def _cancelledResponse(self, reason:str="another request in its batch failed") -> APIResponse:
+        return APIResponse(req_type=self._request_type, val=None, msg=f"Request was cancelled, because {reason}.", status=ResponseStatus.FAILED_DEPENDENCY)
+
+    def _recordTimings(self, url:str, timings:RequestTimings, start:float):
+        timings.SetPhase(LatencyPhase.TOTAL, time.perf_counter() - start)
+        (self._latency_recorder or LatencyRecorder.Default()).Record(url, timings)
+
+    def _logResponse(self, response:APIResponse, logger:Optional[logging.Logger]):
+        if logger:
+            out = logger.debug if response.Status == ResponseStatus.OK else logger.warning
+            out(f"Request sent to:        {self._url}, with params {self._params}")
+            out(f"Response received from: {self._url}")
+            out(f"   Status: {response.Status}")
+            out(f"   Msg:    {response.Message}")
+            out(f"   Value:  {response.Value}")
+
+    @staticmethod
+    def _flattenParams(params:Dict[str, Any] | List[Tuple[Any, Any]] | Tuple[Tuple[Any, Any], ...]) -> List[Tuple[str, str]]:
+        """Convert request params to the string pairs `aiohttp` expects, matching how `requests` encodes them.
+
+        List values become repeated keys, and None values are dropped.
+        As with `requests`, form data may also be given as a list of key/value pairs.
+
+        :raises TypeError: If the params are neither a dict nor a list of key/value pairs.
+        """
+        ret_val : List[Tuple[str, str]] = []
+        if isinstance(params, dict):
+            pairs = list(params.items())
+        elif isinstance(params, (list, tuple)) and all(isinstance(pair, (list, tuple)) and len(pair) == 2 for pair in params):
+            pairs = list(params)
+        else:
+            raise TypeError(f"Form data must be a dict or a list of key/value pairs, not {type(params).__name__} {str(params)[:20]}.")
+        for key, value in pairs:
+            values = value if isinstance(value, (list, tuple)) else [value]
+            ret_val += [(str(key), str(item)) for item in values if item is not None]
+        return ret_val
+
+    @staticmethod
+    def _bodySize(body:Optional[Dict[str, Any] | List[Tuple[Any, Any]] | str | bytes]) -> int:
+        """Get the number of bytes a request body is sent as. Dicts and lists of pairs are form-encoded, as both `requests` and `aiohttp` do.
+        """
+        if body is None:
+            return 0
+        if isinstance(body, bytes):
+            return len(body)
+        if isinstance(body, (dict, list, tuple)):
+            return len(urlencode(APIRequest._flattenParams(body)))
+        return len(str(body).encode("utf-8"))
+
+    @staticmethod
+    def _remaining(deadline:Optional[float]) -> Optional[float]:
+        """Get the number of seconds left before a deadline from `RetryPolicy.StartDeadline`, or None if there is no deadline.
+        """
+        return max(0.0, deadline - time.monotonic()) if deadline is not None else None
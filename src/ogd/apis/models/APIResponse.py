@@ -6,13 +6,16 @@ as well as utility enums used by the APIResponse class.
 """
 
 # import standard libraries
-import json
+import copy
+import hashlib
+import itertools
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Final, Iterable, Iterator, List, Optional, Self, Tuple
 
 # import 3rd-party libraries
 import requests
-from flask import Response
+from flask import Response, has_request_context, request
 
 # import OGD libraries
 from ogd.common.utils.typing import Map
@@ -20,12 +23,58 @@ from ogd.common.utils.Logger import Logger
 
 # Import local files
 from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.enums.LatencyPhase import LatencyPhase
+from ogd.apis.models.enums.ResponseEncoding import ResponseEncoding
 from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.RequestTimings import RequestTimings
+from ogd.apis.utils.JSONSerializer import JSONSerializer
+from ogd.apis.utils.ResponseCodec import ResponseCodec
+from ogd.apis.utils.ResponseCompressor import ResponseCompressor
 
 class APIResponse:
-    def __init__(self, req_type:Optional[RESTType | str], val:Optional[Map], msg:str, status:ResponseStatus):
-        self._type   : Optional[RESTType]
-        self._val    : Optional[Map]
+    """Representation of a response from an OGD API, with a type, value, message and status.
+
+    Responses parsed from an HTTP body keep the raw body and are only decoded when their Type, Message or Value is first read,
+    so callers that only check `OK` or `Status` never pay for decoding.
+    Until the Value is read or anything but the status is changed, `AsJSONBytes` and `AsFlaskResponse` pass the raw body through as-is,
+    once decoding it has shown it to be a well-formed envelope, so a malformed body is never sent on.
+    Likewise, a value given to the constructor as a JSON string is only decoded when first needed.
+
+    Besides the usual JSON envelope, a response can be sent as newline-delimited JSON rows with `AsNDJSONStream`,
+    or in one of the binary encodings of ResponseEncoding with `AsEncodedResponse`,
+    or in whichever of these the request's `Accept` header prefers with `AsNegotiatedResponse`.
+    Responses parsed from a body in one of the binary encodings are decoded right away, and never passed through.
+
+    A response that is sent over and over, such as a health check, can be frozen with `Freeze()`,
+    so its encoded bytes, and its gzipped bytes, are only computed once, until its message, value or status is changed.
+    """
+    __slots__ = ("_type", "_val", "_raw_val", "_msg", "_status", "_timings", "_body", "_pending", "_frozen", "_gzip", "_etag", "_next")
+
+    _DEFAULT_CHUNK_SIZE : Final[int] = 64 * 1024
+    _JSON_MIMETYPE      : Final[str] = "application/json"
+    # The members a decoded body must have to be passed through as an envelope.
+    _ENVELOPE_KEYS      : Final[frozenset[str]] = frozenset({"type", "val", "msg"})
+    _NDJSON_MIMETYPES   : Final[Tuple[str, ...]] = ("application/x-ndjson", "application/ndjson")
+    # Lists and dicts longer than this are treated as data, and encoded one element at a time when streaming.
+    _STREAM_THRESHOLD   : Final[int] = 256
+
+    def __init__(self, req_type:Optional[RESTType | str], val:Optional[Map | List[Any] | str | bytes], msg:str, status:ResponseStatus,
+                 next_cursor:Optional[str]=None):
+        self._type     : Optional[RESTType]
+        self._val      : Optional[Map]               = None
+        self._raw_val  : Optional[str | bytes]       = None
+        self._msg      : str                         = msg
+        self._status   : ResponseStatus              = status
+        self._next     : Optional[str]               = next_cursor
+        self._timings  : Optional[RequestTimings]    = None
+        # The raw, still-encoded body the response was parsed from, which is dropped once the response may differ from it,
+        # and whether that body is still waiting to be decoded.
+        self._body     : Optional[bytes]             = None
+        self._pending  : bool                        = False
+        # Whether the encoded body is kept once computed, and the gzipped body, along with the compressor that produced it.
+        self._frozen   : bool                        = False
+        self._gzip     : Optional[Tuple[ResponseCompressor, bytes]] = None
+        self._etag     : Optional[str]               = None
 
         if isinstance(req_type, RESTType):
             self._type = req_type
@@ -33,21 +82,16 @@ class APIResponse:
             self._type = RESTType[req_type]
         else:
             self._type = None
-        if isinstance(val, dict) or val is None:
+        if isinstance(val, (dict, list)) or val is None:
             self._val = val
+        elif isinstance(val, (bytes, bytearray, memoryview)):
+            self._raw_val = bytes(val)
         else:
-            try:
-                self._val = json.loads(str(val))
-            except json.decoder.JSONDecodeError as err:
-                abbreviated_val = f"{str(val)[:20]}..." if len(str(val)) > 20 else str(val)
-                _msg = f"API response 'value' field contained value '{abbreviated_val}' with invalid type {type(val)}, which could not be converted to a dictionary. Attempting to do so resulted in error:\n{err}\nThe value field will be left blank."
-                Logger.Log(_msg, logging.ERROR)
-                self._val = None
-        self._msg    : str                = msg
-        self._status : ResponseStatus     = status
+            self._raw_val = str(val)
 
     def __str__(self):
-        return f"{str(self.Type)} request: {self.Status}\n{self.Message}\nValues: {self.Value}"
+        self._decodeBody()
+        return f"{str(self.Type)} request: {self.Status}\n{self.Message}\nValues: {self._decodeValue()}"
 
     @staticmethod
     def Default(req_type:RESTType):
@@ -59,17 +103,43 @@ class APIResponse:
         )
 
     @staticmethod
-    def FromResponse(result:requests.Response) -> "APIResponse":
-        ret_val : APIResponse
+    def FromResponse(result:requests.Response, timings:Optional[RequestTimings]=None) -> "APIResponse":
+        """Create an APIResponse from a `requests.Response`.
 
-        try:
-            raw = result.json()
-            ret_val = APIResponse(req_type=raw.get("type"), val=raw.get("val"), msg=raw.get("msg"), status=ResponseStatus(result.status_code))
-        except requests.exceptions.JSONDecodeError:
-            ret_val = APIResponse(req_type=None, val=None, msg=result.text, status=ResponseStatus(result.status_code))
+        The body is kept as-is, and only decoded when the response's Type, Message or Value is first read.
+        If the body is not a valid JSON object, it is used as the message of the APIResponse.
+        If the response's `Content-Type` is one of the binary encodings of ResponseEncoding, the body is decoded from that encoding instead.
+
+        :param result: The response to parse.
+        :type result: requests.Response
+        :param timings: Timings of the request, to attach to the APIResponse, and record the time spent decoding in once it is decoded. Defaults to None
+        :type timings: RequestTimings, optional
+        :return: An APIResponse parsed from the given response.
+        :rtype: APIResponse
+        """
+        return APIResponse._fromBody(result.content, status_code=result.status_code, timings=timings,
+                                     encoding=ResponseCodec.FromMimeType(result.headers.get("Content-Type")))
+
+    @staticmethod
+    def FromContent(content:bytes | str, status_code:int, timings:Optional[RequestTimings]=None, content_type:Optional[str]=None) -> "APIResponse":
+        """Create an APIResponse from the raw body and status code of an HTTP response.
+
+        This is the counterpart to `FromResponse` for responses that did not come from `requests`, such as those from `aiohttp`.
+        As with `FromResponse`, the body is only decoded when first needed.
+
+        :param content: The raw body of the response.
+        :type content: bytes | str
+        :param status_code: The HTTP status code of the response.
+        :type status_code: int
+        :param timings: Timings of the request, to attach to the APIResponse, and record the time spent decoding in once it is decoded. Defaults to None
+        :type timings: RequestTimings, optional
+        :param content_type: The `Content-Type` header of the response, which tells which ResponseEncoding the body is in. Defaults to None, in which case the body is treated as JSON
+        :type content_type: Optional[str], optional
+        :return: An APIResponse parsed from the given body and status.
+        :rtype: APIResponse
+        """
+        return APIResponse._fromBody(content, status_code=status_code, timings=timings, encoding=ResponseCodec.FromMimeType(content_type))
 
-        return ret_val
-    
     @staticmethod
     def FromDict(all_elements:Dict[str, Any], status:Optional[ResponseStatus]=None) -> Optional["APIResponse"]:
         ret_val : Optional["APIResponse"] = None
@@ -77,15 +147,16 @@ class APIResponse:
         _type_raw   = all_elements.get("type", None)
         _val_raw    = all_elements.get("val",  None)
         _msg        = all_elements.get("msg", "NOT FOUND")
+        _next       = all_elements.get("next", None)
         _status_raw = all_elements.get("status", None)
         try:
             _type   = RESTType[str(_type_raw).upper()] if _type_raw else None
-            _val    = _val_raw if isinstance(_val_raw, dict) else json.loads(str(_val_raw)) if _val_raw is not None else None
+            _val    = _val_raw
             _status = ResponseStatus[str(_status_raw).upper()] if _status_raw else (status or ResponseStatus.NONE)
         except KeyError:
             pass
         else:
-            ret_val = APIResponse(req_type=_type, val=_val, msg=_msg, status=_status)
+            ret_val = APIResponse(req_type=_type, val=_val, msg=_msg, status=_status, next_cursor=str(_next) if _next is not None else None)
         return ret_val
 
     @property
@@ -95,20 +166,29 @@ class APIResponse:
         :return: A RESTType representing the type of REST request
         :rtype: _type_
         """
+        self._decodeBody()
         return self._type
 
     @property
-    def Value(self) -> Optional[Map]:
+    def Value(self) -> Any:
         """Property for the value of the request result.
 
-        :return: Some value, of any type, returned from the request.
+        Since the value may be modified once it has been read, the response stops passing its raw body through after this is first used,
+        unless it is frozen. The value of a frozen response should not be modified in place, since the change would not be detected.
+
+        :return: Some value returned from the request, usually a dict or list, though a JSON body may also give a number or boolean.
         :rtype: Any
         """
-        return self._val
+        self._decodeBody()
+        if not self._frozen:
+            self._invalidate()
+        return self._decodeValue()
     @Value.setter
-    def Value(self, new_val:Optional[Map]):
-        self._val = new_val
-
+    def Value(self, new_val:Any):
+        self._decodeBody()
+        self._invalidate()
+        self._raw_val = None
+        self._val     = new_val
 
     @property
     def Message(self) -> str:
@@ -117,9 +197,12 @@ class APIResponse:
         :return: A string message giving details on the result of the request.
         :rtype: str
         """
+        self._decodeBody()
         return self._msg
     @Message.setter
     def Message(self, new_msg:str):
+        self._decodeBody()
+        self._invalidate()
         self._msg = new_msg
 
     @property
@@ -130,6 +213,40 @@ class APIResponse:
         :rtype: ResponseStatus
         """
         return self._status
+
+    @property
+    def NextCursor(self) -> Optional[str]:
+        """Property for the cursor to request the next page of a paginated result with, sent as `next` in the envelope.
+
+        :return: The cursor for the next page, or None if this is the last page, or the result is not paginated.
+        :rtype: Optional[str]
+        """
+        self._decodeBody()
+        return self._next
+    @NextCursor.setter
+    def NextCursor(self, new_cursor:Optional[str]):
+        self._decodeBody()
+        self._invalidate()
+        self._next = new_cursor
+
+    @property
+    def Frozen(self) -> bool:
+        """Property indicating whether the response keeps its encoded bytes once computed, see `Freeze`.
+
+        :return: True if the response is frozen, otherwise False.
+        :rtype: bool
+        """
+        return self._frozen
+
+    @property
+    def Timings(self) -> Optional[RequestTimings]:
+        """Property for the timings of the request that produced the response.
+
+        :return: The per-phase timings, retry count and payload sizes of the request, or None if the response was not received by an APIRequest.
+        :rtype: Optional[RequestTimings]
+        """
+        return self._timings
+
     @property
     def OK(self) -> bool:
         """Property indicating whether the APIResponse was successful or not.
@@ -143,19 +260,265 @@ class APIResponse:
 
     @property
     def AsDict(self):
-        return {
+        ret_val = {
+            "type"   : str(self.Type),
+            "val"    : self.Value,
+            "msg"    : self.Message,
+        }
+        if self._next is not None:
+            ret_val["next"] = self._next
+        return ret_val
+
+    @property
+    def AsJSON(self) -> str:
+        return self.AsJSONBytes.decode("utf-8")
+
+    @property
+    def AsJSONBytes(self) -> bytes:
+        """Property for the response encoded as UTF-8 JSON by the shared JSONSerializer, ready to send without re-encoding.
+
+        If the response was parsed from a body that it still matches, that body is returned as-is, without re-encoding it.
+        The body is still decoded once first, so that a body that is not a well-formed envelope is re-encoded rather than passed through.
+        If the response is frozen, the bytes are kept after they are first encoded, and returned again until the response changes.
+
+        :return: The JSON-encoded response.
+        :rtype: bytes
+        """
+        self._decodeBody()
+        if self._body is not None:
+            return self._body
+        envelope = {
             "type"   : str(self._type),
-            "val"    : self._val,
+            "val"    : self._decodeValue(),
             "msg"    : self._msg,
         }
+        if self._next is not None:
+            envelope["next"] = self._next
+        ret_val = JSONSerializer.Default().Dumps(envelope)
+        if self._frozen:
+            self._body = ret_val
+        return ret_val
+
+    def AsEncodedBytes(self, encoding:ResponseEncoding) -> bytes:
+        """Get the response encoded in the given ResponseEncoding.
+
+        :param encoding: The encoding to use, where `JSON` gives the same bytes as `AsJSONBytes`.
+        :type encoding: ResponseEncoding
+        :raises RuntimeError: If MessagePack is requested, but `msgpack` is not installed.
+        :return: The encoded response.
+        :rtype: bytes
+        """
+        if encoding == ResponseEncoding.JSON:
+            return self.AsJSONBytes
+        return ResponseCodec.Encode(self.AsDict, encoding=encoding)
 
     @property
-    def AsJSON(self):
-        return json.dumps(self.AsDict)
+    def ETag(self) -> str:
+        """Property for an entity tag identifying the encoded response, for use in an `ETag` header.
+
+        The tag is a hash of `AsJSONBytes`, so for a frozen response it is only computed once, until the response changes.
+
+        :return: The unquoted entity tag.
+        :rtype: str
+        """
+        if self._etag is not None:
+            return self._etag
+        ret_val = hashlib.blake2b(self.AsJSONBytes, digest_size=16).hexdigest()
+        if self._frozen:
+            self._etag = ret_val
+        return ret_val
 
     @property
     def AsFlaskResponse(self) -> Response:
-        return Response(response=self.AsJSON, status=self.Status.value, mimetype='application/json')
+        """Property for the response as a Flask response.
+
+        When a frozen response is sent to a request that accepts gzip, its body is gzipped here by the shared ResponseCompressor,
+        and the compressed bytes are kept to send again until the response changes.
+
+        :return: A Flask response with the JSON-encoded response as its body.
+        :rtype: Response
+        """
+        body    = self.AsJSONBytes
+        ret_val = Response(response=body, status=self.Status.value, mimetype='application/json')
+        if self._frozen and has_request_context():
+            compressor = ResponseCompressor.Default()
+            ret_val.vary.add("Accept-Encoding")
+            if compressor.ShouldCompress(size=len(body), accept_encoding=request.headers.get("Accept-Encoding")):
+                if self._gzip is None or self._gzip[0] is not compressor:
+                    self._gzip = (compressor, compressor.Compress(body))
+                ret_val.set_data(self._gzip[1])
+                ret_val.headers["Content-Encoding"] = "gzip"
+        return ret_val
+
+    def AsFlaskStream(self, chunk_size:int=_DEFAULT_CHUNK_SIZE) -> Response:
+        """Get a Flask response that sends the response body in chunks as it is encoded, rather than encoding it all up front.
+
+        See `IterJSONBytes` for how the body is encoded.
+
+        :param chunk_size: The approximate size of each chunk to send, in bytes. Defaults to 64KiB
+        :type chunk_size: int, optional
+        :return: A streamed Flask response, sent with chunked transfer encoding.
+        :rtype: Response
+        """
+        return Response(response=self.IterJSONBytes(chunk_size=chunk_size), status=self.Status.value, mimetype='application/json')
+
+    def AsEncodedResponse(self, encoding:ResponseEncoding) -> Response:
+        """Get a Flask response with the response encoded in the given ResponseEncoding, see `AsEncodedBytes`.
+
+        :param encoding: The encoding to use, where `JSON` gives the same response as `AsFlaskResponse`.
+        :type encoding: ResponseEncoding
+        :raises RuntimeError: If MessagePack is requested, but `msgpack` is not installed.
+        :return: A Flask response, with the mimetype of the encoding.
+        :rtype: Response
+        """
+        if encoding == ResponseEncoding.JSON:
+            return self.AsFlaskResponse
+        return Response(response=self.AsEncodedBytes(encoding), status=self.Status.value, mimetype=ResponseCodec.MimeType(encoding))
+
+    def AsNDJSONStream(self, rows:Optional[Iterable[Any]]=None, chunk_size:int=_DEFAULT_CHUNK_SIZE) -> Response:
+        """Get a Flask response that streams rows as newline-delimited JSON, see `IterNDJSONBytes` for the format.
+
+        :param rows: The rows to send, such as a generator over query results. Defaults to None, in which case the rows of the Value are sent.
+        :type rows: Optional[Iterable[Any]], optional
+        :param chunk_size: The approximate size of each chunk to send, in bytes. Defaults to 64KiB
+        :type chunk_size: int, optional
+        :return: A streamed Flask response, with an `application/x-ndjson` mimetype.
+        :rtype: Response
+        """
+        return Response(response=self.IterNDJSONBytes(rows=rows, chunk_size=chunk_size), status=self.Status.value,
+                        mimetype=APIResponse._NDJSON_MIMETYPES[0])
+
+    def AsNegotiatedResponse(self, rows:Optional[Iterable[Any]]=None, chunk_size:int=_DEFAULT_CHUNK_SIZE) -> Response:
+        """Get a Flask response in whichever format the current request's `Accept` header prefers:
+        the JSON envelope, NDJSON rows, or the envelope in one of the available binary encodings of ResponseEncoding.
+
+        The JSON envelope is sent unless another format is preferred, including when there is no `Accept` header, or no current request.
+        When rows are given and an envelope is sent, the rows are collected into a list, which is sent as the value.
+
+        :param rows: The rows to send, such as a generator over query results. Defaults to None, in which case the Value is sent.
+        :type rows: Optional[Iterable[Any]], optional
+        :param chunk_size: The approximate size of each chunk to send when streaming NDJSON, in bytes. Defaults to 64KiB
+        :type chunk_size: int, optional
+        :return: The Flask response.
+        :rtype: Response
+        """
+        encoding = ResponseEncoding.JSON
+        if has_request_context():
+            # JSON comes first, so it wins whenever the client accepts several formats equally, such as with `*/*`.
+            offered = (APIResponse._JSON_MIMETYPE,) + APIResponse._NDJSON_MIMETYPES + tuple(
+                mimetype for option in (ResponseEncoding.MSGPACK, ResponseEncoding.COLUMNAR) if ResponseCodec.Available(option)
+                         for mimetype in ResponseCodec.MimeTypes(option)
+            )
+            best = request.accept_mimetypes.best_match(offered)
+            if best in APIResponse._NDJSON_MIMETYPES:
+                return self.AsNDJSONStream(rows=rows, chunk_size=chunk_size)
+            encoding = ResponseCodec.FromMimeType(best) or ResponseEncoding.JSON
+        if rows is not None:
+            return APIResponse(req_type=self.Type, val=list(rows), msg=self.Message, status=self.Status, next_cursor=self.NextCursor).AsEncodedResponse(encoding)
+        return self.AsEncodedResponse(encoding)
+
+    def IterNDJSONBytes(self, rows:Optional[Iterable[Any]]=None, chunk_size:int=_DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Encode rows as newline-delimited JSON, one JSON value per line, yielding it in chunks as the rows are produced.
+
+        The first line is a header record, `{"type", "msg", "status"}`, sent straight away so clients can start before any rows are ready.
+        The last line is a trailer record, `{"status", "msg", "count"}`, plus the `next` cursor, if any,
+        so that a client can tell a complete stream from a truncated one, and learn of an error that happened part-way through.
+        If producing the rows raises an error, the stream ends with a trailer whose status is `INTERNAL_ERR`,
+        since the HTTP status has already been sent by then.
+        If no rows are given, the rows of the Value are sent: each item of a list, or a `[key, value]` pair for each member of a dict.
+
+        :param rows: The rows to send. Defaults to None, in which case the rows of the Value are sent.
+        :type rows: Optional[Iterable[Any]], optional
+        :param chunk_size: The approximate size of each chunk after the header, in bytes. Defaults to 64KiB
+        :type chunk_size: int, optional
+        :return: An iterator over chunks of the NDJSON body.
+        :rtype: Iterator[bytes]
+        """
+        self._decodeBody()
+        serializer = JSONSerializer.Default()
+        status     = self._status
+        msg        = self._msg
+        count      = 0
+        yield serializer.Dumps({"type" : str(self._type), "msg" : msg, "status" : status.name}) + b"\n"
+
+        buffer = bytearray()
+        try:
+            for row in (rows if rows is not None else APIResponse._rowsOf(self._decodeValue())):
+                # Neither JSON backend writes raw newlines, so each row stays on one line.
+                buffer += serializer.Dumps(row)
+                buffer += b"\n"
+                count  += 1
+                if len(buffer) >= chunk_size:
+                    yield bytes(buffer)
+                    buffer.clear()
+        except Exception as err:
+            Logger.Log(f"Error while streaming NDJSON rows for {self._type} response, after {count} rows:\n{err}", logging.ERROR)
+            status = ResponseStatus.INTERNAL_ERR
+            msg    = f"SERVER ERROR: Response ended early, after {count} rows."
+        trailer = {"status" : status.name, "msg" : msg, "count" : count}
+        if self._next is not None:
+            trailer["next"] = self._next
+        buffer += serializer.Dumps(trailer) + b"\n"
+        yield bytes(buffer)
+
+    def IterJSONBytes(self, chunk_size:int=_DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Encode the response as UTF-8 JSON incrementally, yielding it in chunks.
+
+        The `type`, `msg` and `next` cursor, if any, are written first, so a client reading the body incrementally, such as an APIResponseStream, gets them before `val`.
+        The `val` is then encoded one element at a time, descending into the members of small dicts,
+        so that large lists and dicts, and the top-level `val` itself, are never encoded all at once.
+        The elements of a large list are each encoded whole by the shared JSONSerializer, unless they are large themselves.
+        If the response can pass through the body it was parsed from, that body is yielded in chunks instead, once it has been checked as in `AsJSONBytes`.
+
+        :param chunk_size: The approximate size of each chunk, in bytes. Chunks may run over by up to one encoded element. Defaults to 64KiB
+        :type chunk_size: int, optional
+        :return: An iterator over chunks of the JSON-encoded response.
+        :rtype: Iterator[bytes]
+        """
+        self._decodeBody()
+        if self._body is not None:
+            body = memoryview(self._body)
+            for start in range(0, len(body), chunk_size):
+                yield bytes(body[start:start + chunk_size])
+            return
+
+        serializer = JSONSerializer.Default()
+        buffer     = bytearray(b'{"type": ' + serializer.Dumps(str(self._type)) + b', "msg": ' + serializer.Dumps(self._msg))
+        if self._next is not None:
+            buffer += b', "next": ' + serializer.Dumps(self._next)
+        buffer += b', "val": '
+        for piece in APIResponse._encodeIncrementally(self._decodeValue(), serializer=serializer, stream=True):
+            buffer += piece
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        buffer += b"}"
+        yield bytes(buffer)
+
+    def Freeze(self) -> Self:
+        """Freeze the response, so that its encoded and gzipped bytes are computed once, then reused until its message, value or status is changed.
+
+        :return: The response itself, so it can be frozen as it is created.
+        :rtype: APIResponse
+        """
+        self._frozen = True
+        return self
+
+    def Copy(self) -> "APIResponse":
+        """Get an independent copy of the response, decoding the response first if it has not been decoded yet.
+
+        The copy has its own copy of the value and timings, so either response can be changed without affecting the other.
+        Once the original has been decoded, copying it only reads it, so many threads can copy one decoded response at once.
+
+        :return: A copy of the response.
+        :rtype: APIResponse
+        """
+        self._decodeBody()
+        self._decodeValue()
+        ret_val = copy.copy(self)
+        ret_val._val     = copy.deepcopy(self._val)
+        ret_val._timings = copy.deepcopy(self._timings)
+        return ret_val
 
     def RequestErrored(self, msg:str, status:Optional[ResponseStatus]=None):
         self._status = status if status is not None and status in ResponseStatus.ClientErrors() else ResponseStatus.BAD_REQUEST
@@ -169,3 +532,122 @@ class APIResponse:
         self._status = ResponseStatus.OK
         self.Message = f"SUCCESS: {msg}"
         self.Value   = val
+
+    # *** PRIVATE METHODS ***
+
+    @staticmethod
+    def _fromBody(content:bytes | str, status_code:int, timings:Optional[RequestTimings], encoding:Optional[ResponseEncoding]=None) -> "APIResponse":
+        ret_val = APIResponse(req_type=None, val=None, msg="", status=ResponseStatus(status_code))
+        ret_val._body    = content.encode("utf-8") if isinstance(content, str) else bytes(content)
+        ret_val._pending = True
+        ret_val._timings = timings
+        if encoding is not None and encoding != ResponseEncoding.JSON:
+            ret_val._decodeBody(encoding=encoding)
+        return ret_val
+
+    def _invalidate(self):
+        """Drop the encoded and gzipped bytes and entity tag of the response, since it may no longer match them.
+        """
+        self._body = None
+        self._gzip = None
+        self._etag = None
+
+    def _decodeBody(self, encoding:ResponseEncoding=ResponseEncoding.JSON):
+        """Decode the raw body the response was parsed from, if it has not been decoded yet.
+
+        A JSON body that is a well-formed envelope is kept afterwards, so an unchanged response can still be passed through.
+        A body missing any of the envelope's members is decoded as far as it can be, but re-encoded rather than passed through.
+        If the body is not a valid object in its encoding, it becomes the message instead, and is no longer passed through.
+        """
+        if not self._pending:
+            return
+        self._pending = False
+        start = time.perf_counter()
+        try:
+            raw = ResponseCodec.Decode(self._body or b"", encoding=encoding)
+            if not isinstance(raw, dict):
+                raise ValueError(f"Expected an object, got {type(raw)}")
+            if encoding != ResponseEncoding.JSON or not APIResponse._ENVELOPE_KEYS <= raw.keys():
+                self._body = None
+            _type_raw = raw.get("type")
+            _val_raw  = raw.get("val")
+            self._type = RESTType[_type_raw] if isinstance(_type_raw, str) and _type_raw in RESTType.__members__ else None
+            if isinstance(_val_raw, (dict, list)) or _val_raw is None:
+                self._val = _val_raw
+            else:
+                self._raw_val = str(_val_raw)
+            self._msg  = raw.get("msg")
+            self._next = str(raw["next"]) if raw.get("next") is not None else None
+        except ValueError:
+            self._msg  = (self._body or b"").decode("utf-8", errors="replace")
+            self._body = None
+        if self._timings is not None:
+            self._timings.SetPhase(LatencyPhase.DECODE, time.perf_counter() - start)
+
+    def _decodeValue(self) -> Any:
+        """Decode a value that was given as a JSON string, if it has not been decoded yet.
+
+        :return: The decoded value, or None if it could not be decoded.
+        :rtype: Any
+        """
+        if self._raw_val is not None:
+            raw_val, self._raw_val = self._raw_val, None
+            try:
+                self._val = JSONSerializer.Default().Loads(raw_val)
+            except ValueError as err:
+                abbreviated_val = f"{str(raw_val)[:20]}..." if len(str(raw_val)) > 20 else str(raw_val)
+                _msg = f"API response 'value' field contained value '{abbreviated_val}' with invalid type {type(raw_val)}, which could not be converted to a dictionary. Attempting to do so resulted in error:\n{err}\nThe value field will be left blank."
+                Logger.Log(_msg, logging.ERROR)
+                self._val = None
+        return self._val
+
+    @staticmethod
+    def _encodeIncrementally(value:Any, serializer:JSONSerializer, stream:bool) -> Iterator[bytes]:
+        """Encode a value as JSON in pieces, streaming its elements if it is a list or dict that should be streamed, and encoding it whole otherwise.
+
+        The members of a small dict are streamed too, since they are usually structure, such as the `rows` of a table, rather than data.
+        Elements are encoded in batches, to keep the per-call overhead of the serializer down, unless a batch holds a large element of its own.
+        """
+        if isinstance(value, dict) and (stream or len(value) > APIResponse._STREAM_THRESHOLD):
+            stream_members = len(value) <= APIResponse._STREAM_THRESHOLD
+            items = iter(value.items())
+            yield b"{"
+            first = True
+            while batch := dict(itertools.islice(items, APIResponse._STREAM_THRESHOLD)):
+                if not stream_members and not APIResponse._hasLarge(batch.values()):
+                    yield (b"" if first else b", ") + serializer.Dumps(batch)[1:-1]
+                else:
+                    for i, (key, member) in enumerate(batch.items()):
+                        # Match json.dumps, which writes non-string keys such as numbers, booleans and None as the string of their JSON.
+                        key = key if isinstance(key, str) else serializer.Dumps(key).decode("utf-8")
+                        yield (b"" if first and not i else b", ") + serializer.Dumps(key) + b": "
+                        yield from APIResponse._encodeIncrementally(member, serializer=serializer, stream=stream_members)
+                first = False
+            yield b"}"
+        elif isinstance(value, (list, tuple)) and (stream or len(value) > APIResponse._STREAM_THRESHOLD):
+            yield b"["
+            for start in range(0, len(value), APIResponse._STREAM_THRESHOLD):
+                batch = value[start:start + APIResponse._STREAM_THRESHOLD]
+                if not APIResponse._hasLarge(batch):
+                    yield (b", " if start else b"") + serializer.Dumps(batch)[1:-1]
+                else:
+                    for i, item in enumerate(batch):
+                        yield b", " if start or i else b""
+                        yield from APIResponse._encodeIncrementally(item, serializer=serializer, stream=False)
+            yield b"]"
+        else:
+            yield serializer.Dumps(value)
+
+    @staticmethod
+    def _rowsOf(value:Any) -> Iterable[Any]:
+        if value is None:
+            return ()
+        if isinstance(value, dict):
+            return ([key, member] for key, member in value.items())
+        if isinstance(value, (list, tuple)):
+            return value
+        return (value,)
+
+    @staticmethod
+    def _hasLarge(values:Iterable[Any]) -> bool:
+        return any(isinstance(value, (dict, list, tuple)) and len(value) > APIResponse._STREAM_THRESHOLD for value in values)
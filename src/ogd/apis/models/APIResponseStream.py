@@ -0,0 +1,420 @@
+"""
+APIResponseStream
+
+Contains a class for reading a response from an OGD API incrementally,
+so that a large `val` can be processed without buffering and decoding the whole body at once.
+"""
+
+# import standard libraries
+import codecs
+import json
+import logging
+from enum import IntEnum
+from typing import Any, Final, Iterator, List, Optional, Self, Tuple
+
+# import 3rd-party libraries
+import requests
+
+# import OGD libraries
+from ogd.common.utils.Logger import Logger
+
+# Import local files
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.APIResponse import APIResponse
+
+class _ParseState(IntEnum):
+    MEMBERS = 1 # reading the top-level members of the envelope
+    VALUE   = 2 # positioned just inside the opening bracket of a list or dict `val`
+    DONE    = 3 # the whole body has been read
+    ROWS    = 4 # reading the rows of an NDJSON body, with the line after the current row already read
+
+class APIResponseStream:
+    """Incrementally-read response from an OGD API.
+
+    The status is available as soon as the response headers arrive.
+    On creation, the envelope is read up to the start of `val`, so `Type` and `Message` are available up front
+    when the server sends them before `val`; any that come after `val` become available once `val` has been read.
+
+    The body can then be consumed in one of two ways:
+    * `IterValue()` parses `val` one element at a time, yielding `(key, value)` pairs for a dict, or items for a list.
+    * `IterChunks()` yields the raw bytes of the body, for passing it on without decoding.
+
+    Only one of these may be used, and only once. The stream should be closed when done, or used as a context manager.
+
+    Newline-delimited JSON bodies, as sent by `APIResponse.AsNDJSONStream`, are read the same way, with `IterValue()` yielding each row.
+    `Type` and `Message` come from the header record, and once the rows are read, the trailer record updates `Status`, `Message` and `NextCursor`.
+    """
+    _NDJSON_MIMETYPES   : Final[Tuple[str, ...]] = ("application/x-ndjson", "application/ndjson")
+    _DEFAULT_CHUNK_SIZE : Final[int] = 64 * 1024
+    _WHITESPACE         : Final[str] = " \t\n\r"
+    _DELIMITERS         : Final[str] = " \t\n\r,:]}"
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, status:ResponseStatus, req_type:Optional[RESTType]=None, msg:Optional[str]=None,
+                 val:Optional[Any]=None, response:Optional[requests.Response]=None, chunk_size:int=_DEFAULT_CHUNK_SIZE):
+        self._status   : ResponseStatus              = status
+        self._type     : Optional[RESTType]          = req_type
+        self._msg      : Optional[str]               = msg
+        self._val      : Optional[Any]               = val
+        self._next     : Optional[str]               = None
+        self._response : Optional[requests.Response] = response
+
+        self._chunks    : Iterator[bytes]           = response.iter_content(chunk_size=chunk_size) if response is not None else iter(())
+        self._decoder   : codecs.IncrementalDecoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._json      : json.JSONDecoder          = json.JSONDecoder()
+        self._raw       : List[bytes]               = []
+        self._buffer    : str                       = ""
+        self._pos       : int                       = 0
+        self._exhausted : bool                      = response is None
+        self._consumed  : bool                      = False
+        self._val_open  : str                       = ""
+        self._line      : Optional[str]             = None
+        self._state     : _ParseState               = _ParseState.MEMBERS if response is not None else _ParseState.DONE
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args:Any) -> None:
+        self.Close()
+
+    def __str__(self):
+        return f"{str(self.Type)} request stream: {self.Status}\n{self.Message}"
+
+    @property
+    def Type(self) -> Optional[RESTType]:
+        return self._type
+
+    @property
+    def Message(self) -> Optional[str]:
+        """Property for the message associated with the response.
+
+        :return: The message of the response, or None if it has not been read yet.
+        :rtype: Optional[str]
+        """
+        return self._msg
+
+    @property
+    def Status(self) -> ResponseStatus:
+        return self._status
+
+    @property
+    def NextCursor(self) -> Optional[str]:
+        """Property for the cursor to request the next page of a paginated result with.
+
+        :return: The cursor for the next page, or None if there is no next page, or it has not been read yet.
+        :rtype: Optional[str]
+        """
+        return self._next
+
+    @property
+    def OK(self) -> bool:
+        return self.Status in ResponseStatus.SuccessStatuses()
+
+    @property
+    def Value(self) -> Optional[Any]:
+        """Property for the whole `val` of the response, reading and decoding the rest of `val` if needed.
+
+        :raises RuntimeError: If the body was already consumed through `IterValue` or `IterChunks`.
+        :return: The value of the response.
+        :rtype: Optional[Any]
+        """
+        if self._state in (_ParseState.VALUE, _ParseState.ROWS):
+            is_dict = self._val_open == "{"
+            items = list(self.IterValue())
+            self._val = dict(items) if is_dict else items
+        elif self._consumed and self._state != _ParseState.DONE:
+            raise RuntimeError("The response body was already consumed as raw chunks.")
+        return self._val
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def FromResponse(result:requests.Response, chunk_size:int=_DEFAULT_CHUNK_SIZE) -> "APIResponseStream":
+        """Create a stream over a `requests.Response` that was sent with `stream=True`, reading the envelope up to `val`.
+
+        If the body is not a JSON object, it is read in full and used as the message, as in `APIResponse.FromResponse`.
+        An NDJSON body, identified by its `Content-Type`, is read up to the end of its header record instead.
+
+        :param result: The streaming response.
+        :type result: requests.Response
+        :param chunk_size: The number of bytes to read from the connection at a time. Defaults to 64KiB
+        :type chunk_size: int, optional
+        :return: A stream over the response.
+        :rtype: APIResponseStream
+        """
+        ret_val = APIResponseStream(status=ResponseStatus(result.status_code), response=result, chunk_size=chunk_size)
+        if result.headers.get("Content-Type", "").split(";")[0].strip().lower() in APIResponseStream._NDJSON_MIMETYPES:
+            ret_val._readNDJSONHeader()
+        else:
+            ret_val._readEnvelope()
+        return ret_val
+
+    @staticmethod
+    def FromAPIResponse(response:APIResponse) -> "APIResponseStream":
+        """Wrap an already-complete APIResponse, such as a timeout or error response, as a stream.
+
+        :param response: The complete response.
+        :type response: APIResponse
+        :return: A stream whose value is that of the response.
+        :rtype: APIResponseStream
+        """
+        ret_val = APIResponseStream(status=response.Status, req_type=response.Type, msg=response.Message, val=response.Value)
+        ret_val._next = response.NextCursor
+        return ret_val
+
+    # *** PUBLIC METHODS ***
+
+    def IterValue(self) -> Iterator[Any]:
+        """Iterate over `val`, decoding one element at a time.
+
+        Yields `(key, value)` pairs if `val` is a dict, or each item if it is a list.
+        If `val` was already fully decoded (for example, because it is not a container), it is iterated in the same way.
+
+        :raises RuntimeError: If the body was already consumed.
+        :return: An iterator over the elements of `val`.
+        :rtype: Iterator[Any]
+        """
+        if self._consumed:
+            raise RuntimeError("The response body was already consumed.")
+        self._consumed = True
+
+        if self._state == _ParseState.ROWS:
+            yield from self._iterRows()
+            return
+        if self._state != _ParseState.VALUE:
+            if isinstance(self._val, dict):
+                yield from self._val.items()
+            elif isinstance(self._val, list):
+                yield from self._val
+            return
+
+        is_dict = self._val_open == "{"
+        close   = "}" if is_dict else "]"
+        while True:
+            char = self._peek()
+            if char == close:
+                self._pos += 1
+                break
+            if char == ",":
+                self._pos += 1
+                continue
+            if char == "":
+                raise ValueError("Response body ended in the middle of 'val'.")
+            if is_dict:
+                key = self._decodeValue()
+                self._expect(":")
+                yield (key, self._decodeValue())
+            else:
+                yield self._decodeValue()
+            self._compact()
+        self._state = _ParseState.MEMBERS
+        self._readMembers()
+
+    def IterChunks(self) -> Iterator[bytes]:
+        """Iterate over the raw bytes of the whole body, including any part already read to parse the envelope.
+
+        :raises RuntimeError: If the body was already consumed.
+        :return: An iterator over chunks of the body.
+        :rtype: Iterator[bytes]
+        """
+        if self._consumed:
+            raise RuntimeError("The response body was already consumed.")
+        self._consumed = True
+        yield from self._raw
+        self._raw = []
+        yield from self._chunks
+        self._exhausted = True
+
+    def ToAPIResponse(self) -> APIResponse:
+        """Read the rest of the body, and collect it into a regular APIResponse.
+
+        :return: The complete response.
+        :rtype: APIResponse
+        """
+        val = self.Value
+        self.Close()
+        return APIResponse(req_type=self._type, val=val, msg=self._msg or "", status=self._status, next_cursor=self._next)
+
+    def Close(self):
+        if self._response is not None:
+            self._response.close()
+
+    # *** PRIVATE METHODS ***
+
+    def _readEnvelope(self):
+        try:
+            if self._peek() != "{":
+                raise ValueError("Response body is not a JSON object.")
+            self._pos += 1
+            self._readMembers()
+        except ValueError:
+            # Not an API envelope, so fall back to treating the whole body as the message.
+            self._readAsMessage()
+
+    def _readAsMessage(self):
+        while self._fill():
+            pass
+        self._msg   = b"".join(self._raw).decode("utf-8", errors="replace")
+        self._state = _ParseState.DONE
+        self.Close()
+
+    def _readNDJSONHeader(self):
+        try:
+            header = self._json.decode(self._readLine() or "")
+            if not isinstance(header, dict):
+                raise ValueError("NDJSON header is not a JSON object.")
+            self._setMember(key="type", value=header.get("type"))
+            self._setMember(key="msg",  value=header.get("msg"))
+            self._line  = self._readLine()
+            self._state = _ParseState.ROWS
+        except ValueError:
+            self._readAsMessage()
+
+    def _iterRows(self) -> Iterator[Any]:
+        """Iterate over the rows of an NDJSON body, reading one line ahead, so that the last line can be read as the trailer record.
+        """
+        self._raw = []
+        while True:
+            line = self._line
+            if line is None:
+                raise ValueError("Response body ended without an NDJSON trailer record.")
+            self._line = self._readLine()
+            if self._line is None:
+                self._readNDJSONTrailer(line)
+                break
+            yield self._json.decode(line)
+        self._state = _ParseState.DONE
+
+    def _readNDJSONTrailer(self, line:str):
+        trailer = self._json.decode(line)
+        if not isinstance(trailer, dict) or "count" not in trailer:
+            raise ValueError("Response body ended without an NDJSON trailer record.")
+        try:
+            self._status = ResponseStatus[str(trailer.get("status"))]
+        except KeyError:
+            Logger.Log(f"API response stream had invalid trailer status {trailer.get('status')}, leaving it as {self._status}.", logging.WARNING)
+        self._setMember(key="msg",  value=trailer.get("msg"))
+        self._setMember(key="next", value=trailer.get("next"))
+
+    def _readLine(self) -> Optional[str]:
+        """Read the next non-blank line of the body, reading more of the body as needed.
+
+        :return: The line, without its newline, or None at the end of the body.
+        """
+        while True:
+            searched = self._pos
+            end      = self._buffer.find("\n", searched)
+            while end == -1:
+                searched = len(self._buffer)
+                if not self._fill():
+                    break
+                end = self._buffer.find("\n", searched)
+            line      = self._buffer[self._pos:end] if end != -1 else self._buffer[self._pos:]
+            self._pos = end + 1 if end != -1 else len(self._buffer)
+            self._compact()
+            if line.strip():
+                return line
+            if end == -1:
+                return None
+
+    def _readMembers(self):
+        """Read top-level members of the envelope, stopping at the start of a list or dict `val`, or at the end of the envelope.
+        """
+        while True:
+            char = self._peek()
+            if char == "}":
+                self._pos  += 1
+                self._state = _ParseState.DONE
+                self._raw   = [] if self._consumed else self._raw
+                return
+            if char == ",":
+                self._pos += 1
+                continue
+            if char == "":
+                raise ValueError("Response body ended in the middle of the envelope.")
+            key = self._decodeValue()
+            self._expect(":")
+            if key == "val" and self._peek() in ("{", "["):
+                self._val_open = self._peek()
+                self._pos     += 1
+                self._state    = _ParseState.VALUE
+                return
+            self._setMember(key=key, value=self._decodeValue())
+
+    def _setMember(self, key:str, value:Any):
+        match key:
+            case "type":
+                try:
+                    self._type = RESTType[str(value).upper()] if value else None
+                except KeyError:
+                    Logger.Log(f"API response stream had invalid type {value}, leaving it blank.", logging.WARNING)
+            case "msg":
+                self._msg = str(value) if value is not None else None
+            case "val":
+                self._val = value
+            case "next":
+                self._next = str(value) if value is not None else None
+
+    def _fill(self) -> bool:
+        """Read the next chunk from the connection into the buffer.
+
+        :return: True if a chunk was read, or False if the body was exhausted.
+        """
+        if self._exhausted:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._exhausted = True
+            self._buffer += self._decoder.decode(b"", final=True)
+            return False
+        if not self._consumed:
+            self._raw.append(chunk)
+        self._buffer += self._decoder.decode(chunk)
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace, and get the next character without consuming it, or "" at the end of the body.
+        """
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in APIResponseStream._WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char:str):
+        if self._peek() != char:
+            raise ValueError(f"Expected '{char}' at position {self._pos} of response body.")
+        self._pos += 1
+
+    def _decodeValue(self) -> Any:
+        """Decode one complete JSON value from the buffer, reading more of the body as needed.
+
+        A value might be cut short by the end of the buffer (e.g. a number), so it is only accepted once the character after it is a delimiter.
+        The buffer is at least doubled before each retry, so that large values don't get re-parsed once per chunk.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._exhausted:
+                    raise
+            else:
+                if self._exhausted or (end < len(self._buffer) and self._buffer[end] in APIResponseStream._DELIMITERS):
+                    self._pos = end
+                    return value
+            target = len(self._buffer) + max(1, len(self._buffer) - self._pos)
+            while len(self._buffer) < target and self._fill():
+                pass
+
+    def _compact(self):
+        """Drop the already-parsed part of the buffer, once it grows large enough to be worth copying.
+        """
+        if self._pos > APIResponseStream._DEFAULT_CHUNK_SIZE:
+            self._buffer = self._buffer[self._pos:]
+            self._pos    = 0
@@ -0,0 +1,197 @@
+"""
+ChunkedUpload
+
+Contains a class for sending a large POST or PUT body a chunk at a time,
+so that files, generators and memory-mapped files can be uploaded without loading them into memory.
+"""
+
+# import standard libraries
+import mmap
+import os
+import zlib
+from typing import Any, AsyncIterable, AsyncIterator, Final, Iterable, Iterator, Optional
+
+# import 3rd-party libraries
+
+# import OGD libraries
+
+# Import local files
+from ogd.apis.models.RequestTimings import RequestTimings
+
+class ChunkedUpload:
+    """Request body that is read from its source and sent a chunk at a time, with chunked transfer encoding.
+
+    The source may be:
+    * a binary (or text) file object, read `chunk_size` bytes at a time,
+    * a memory-mapped file, sliced `chunk_size` bytes at a time,
+    * an iterator or generator of `bytes` or `str` chunks, sent as they come,
+    * an async iterable of chunks, which can only be sent by `APIRequest.ExecuteAsync`.
+
+    Only one chunk is held in memory at a time, whatever the size of the source.
+    Seekable files and memory-mapped files are rewound to where they started before each attempt, so a request with one can be retried.
+    Generators and other one-shot sources can only be sent once, so a request with one is never retried.
+    """
+    _DEFAULT_CHUNK_SIZE : Final[int] = 64 * 1024
+    _COMPRESS_LEVEL     : Final[int] = 6
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, source:Any, chunk_size:int=_DEFAULT_CHUNK_SIZE):
+        """Constructor for a ChunkedUpload.
+
+        :param source: The file object, memory-mapped file, or (async) iterable of chunks to upload.
+        :type source: Any
+        :param chunk_size: The number of bytes to read from a file or memory-mapped file at a time. Defaults to 64KiB
+        :type chunk_size: int, optional
+        :raises TypeError: If the source is not something that can be uploaded in chunks.
+        """
+        if not ChunkedUpload.IsStreamable(source):
+            raise TypeError(f"Cannot upload a {type(source).__name__} in chunks.")
+        self._source     : Any           = source
+        self._chunk_size : int           = max(1, chunk_size)
+        self._start      : Optional[int] = ChunkedUpload._startPosition(source)
+
+    def __str__(self) -> str:
+        size = f"{self.Size}B" if self.Size is not None else "unknown size"
+        return f"ChunkedUpload: {type(self._source).__name__}, {size}, {self._chunk_size}B chunks"
+
+    @property
+    def Rewindable(self) -> bool:
+        """Property for whether the upload can be sent more than once, such as when its request is retried.
+
+        :return: True if the source is a memory-mapped file or seekable file.
+        :rtype: bool
+        """
+        return self._start is not None
+
+    @property
+    def Size(self) -> Optional[int]:
+        """Property for the number of bytes left to upload, if it can be known without reading the source.
+
+        :return: The size of a memory-mapped file, or the bytes from the starting position to the end of a regular file, or None for other sources.
+        :rtype: Optional[int]
+        """
+        if isinstance(self._source, mmap.mmap):
+            return len(self._source) - (self._start or 0)
+        if self._start is not None and hasattr(self._source, "fileno"):
+            try:
+                return os.fstat(self._source.fileno()).st_size - self._start
+            except (OSError, ValueError):
+                return None
+        return None
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def IsStreamable(body:Any) -> bool:
+        """Check whether a request body should be uploaded in chunks, rather than encoded in one piece.
+
+        File objects, memory-mapped files, iterators (including generators) and async iterables are streamed.
+        Anything else, such as a dict, string, bytes, list, tuple or set, is encoded in one piece.
+
+        :param body: The request body.
+        :type body: Any
+        :return: True if the body can be uploaded as a ChunkedUpload.
+        :rtype: bool
+        """
+        return isinstance(body, (ChunkedUpload, mmap.mmap, Iterator, AsyncIterable)) or hasattr(body, "read")
+
+    # *** PUBLIC METHODS ***
+
+    def Chunks(self, timings:Optional[RequestTimings]=None, compress:bool=False) -> Iterator[bytes]:
+        """Iterate over the chunks of the body to send, rewinding the source first if possible.
+
+        :param timings: Timings whose request byte counts are updated as each chunk is sent. Defaults to None
+        :type timings: RequestTimings, optional
+        :param compress: Whether to gzip the chunks as they are sent. Defaults to False
+        :type compress: bool, optional
+        :raises TypeError: If the source is an async iterable.
+        :return: An iterator over the chunks to send.
+        :rtype: Iterator[bytes]
+        """
+        if isinstance(self._source, AsyncIterable) and not isinstance(self._source, Iterable):
+            raise TypeError("An async iterable body can only be sent asynchronously.")
+        return self._counted(self._read(), timings=timings, compress=compress)
+
+    async def ChunksAsync(self, timings:Optional[RequestTimings]=None, compress:bool=False) -> AsyncIterator[bytes]:
+        """Asynchronously iterate over the chunks of the body to send, rewinding the source first if possible.
+
+        Files are read directly rather than in a worker thread, since each read is only one chunk.
+
+        :param timings: Timings whose request byte counts are updated as each chunk is sent. Defaults to None
+        :type timings: RequestTimings, optional
+        :param compress: Whether to gzip the chunks as they are sent. Defaults to False
+        :type compress: bool, optional
+        :return: An async iterator over the chunks to send.
+        :rtype: AsyncIterator[bytes]
+        """
+        if isinstance(self._source, AsyncIterable) and not isinstance(self._source, Iterable):
+            if timings is not None:
+                timings.RequestBytes     = 0
+                timings.RequestWireBytes = 0
+            compressor = zlib.compressobj(ChunkedUpload._COMPRESS_LEVEL, wbits=31) if compress else None
+            async for chunk in self._source:
+                for out in self._encodeChunk(chunk, compressor=compressor, timings=timings):
+                    yield out
+            if compressor is not None:
+                yield self._flush(compressor, timings=timings)
+        else:
+            for chunk in self.Chunks(timings=timings, compress=compress):
+                yield chunk
+
+    # *** PRIVATE METHODS ***
+
+    @staticmethod
+    def _startPosition(source:Any) -> Optional[int]:
+        """Get the position to rewind the source to before each attempt, or None if it can't be rewound.
+        """
+        if isinstance(source, mmap.mmap):
+            return source.tell()
+        if hasattr(source, "seekable") and hasattr(source, "tell"):
+            try:
+                return source.tell() if source.seekable() else None
+            except (OSError, ValueError):
+                return None
+        return None
+
+    def _read(self) -> Iterator[bytes | str]:
+        if isinstance(self._source, mmap.mmap):
+            for offset in range(self._start or 0, len(self._source), self._chunk_size):
+                yield self._source[offset:offset + self._chunk_size]
+        elif hasattr(self._source, "read"):
+            if self._start is not None:
+                self._source.seek(self._start)
+            while chunk := self._source.read(self._chunk_size):
+                yield chunk
+        else:
+            yield from self._source
+
+    def _counted(self, chunks:Iterator[bytes | str], timings:Optional[RequestTimings], compress:bool) -> Iterator[bytes]:
+        if timings is not None:
+            timings.RequestBytes     = 0
+            timings.RequestWireBytes = 0
+        compressor = zlib.compressobj(ChunkedUpload._COMPRESS_LEVEL, wbits=31) if compress else None
+        for chunk in chunks:
+            yield from self._encodeChunk(chunk, compressor=compressor, timings=timings)
+        if compressor is not None:
+            yield self._flush(compressor, timings=timings)
+
+    @staticmethod
+    def _encodeChunk(chunk:bytes | str, compressor:Optional[Any], timings:Optional[RequestTimings]) -> Iterator[bytes]:
+        data = chunk.encode("utf-8") if isinstance(chunk, str) else bytes(chunk)
+        if timings is not None:
+            timings.RequestBytes += len(data)
+        if compressor is not None:
+            data = compressor.compress(data)
+        # An empty chunk would end a chunked body early, so skip any the compressor is still buffering.
+        if data:
+            if timings is not None:
+                timings.RequestWireBytes += len(data)
+            yield data
+
+    @staticmethod
+    def _flush(compressor:Any, timings:Optional[RequestTimings]) -> bytes:
+        data = compressor.flush()
+        if timings is not None:
+            timings.RequestWireBytes += len(data)
+        return data
@@ -0,0 +1,158 @@
+"""
+RecordedExchange
+
+Contains a class for one recorded HTTP request and its response,
+as saved by a RecordingTransport and replayed by a ReplayTransport.
+"""
+
+# import standard libraries
+import base64
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+# import 3rd-party libraries
+
+# import OGD libraries
+
+# Import local files
+
+class RecordedExchange:
+    """A recorded request, identified by its method, URL and params, along with the response it got and how long that took.
+
+    The body is stored decoded, so replaying it does not depend on the `Content-Encoding` the server happened to use.
+    """
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, method:str, url:str, params:Iterable[Tuple[str, str]], status:int, headers:Mapping[str, str], body:bytes, elapsed:float=0.0):
+        """Constructor for a RecordedExchange.
+
+        :param method: The HTTP method of the request, such as "GET".
+        :type method: str
+        :param url: The full URL of the request, without params.
+        :type url: str
+        :param params: The request params, as key/value string pairs.
+        :type params: Iterable[Tuple[str, str]]
+        :param status: The status code of the response.
+        :type status: int
+        :param headers: The headers of the response.
+        :type headers: Mapping[str, str]
+        :param body: The decoded body of the response.
+        :type body: bytes
+        :param elapsed: The number of seconds the response took to arrive. Defaults to 0.0
+        :type elapsed: float, optional
+        """
+        self._method  : str            = method.upper()
+        self._url     : str            = url
+        self._params  : str            = urlencode(sorted(params))
+        self._status  : int            = status
+        self._headers : Dict[str, str] = {name : value for name, value in headers.items()
+                                          if name.lower() not in {"content-encoding", "content-length", "transfer-encoding"}}
+        self._body    : bytes          = body
+        self._elapsed : float          = elapsed
+
+    def __str__(self) -> str:
+        return f"RecordedExchange: {self.Key} -> {self._status}, {len(self._body)}B in {self._elapsed * 1000:.1f}ms"
+
+    @property
+    def Key(self) -> str:
+        """Property for the key that identifies matching requests, made up of the method, URL and sorted params.
+
+        :return: The key of the recorded request.
+        :rtype: str
+        """
+        return f"{self._method} {self._url}?{self._params}" if self._params else f"{self._method} {self._url}"
+
+    @property
+    def Status(self) -> int:
+        return self._status
+
+    @property
+    def Headers(self) -> Dict[str, str]:
+        """Property for the headers of the response, leaving out those that described its original encoding and length.
+
+        :return: The response headers.
+        :rtype: Dict[str, str]
+        """
+        return dict(self._headers)
+
+    @property
+    def Body(self) -> bytes:
+        return self._body
+
+    @property
+    def Elapsed(self) -> float:
+        return self._elapsed
+
+    @property
+    def AsDict(self) -> Dict[str, Any]:
+        """Property for the exchange in a JSON-friendly form, with the body stored as text if it is UTF-8, or as base64 otherwise.
+
+        :return: A dict that `FromDict` can turn back into the exchange.
+        :rtype: Dict[str, Any]
+        """
+        ret_val : Dict[str, Any] = {
+            "method"  : self._method,
+            "url"     : self._url,
+            "params"  : self._params,
+            "status"  : self._status,
+            "headers" : self._headers,
+            "elapsed" : self._elapsed
+        }
+        try:
+            ret_val["body"] = self._body.decode("utf-8")
+        except UnicodeDecodeError:
+            ret_val["body_b64"] = base64.b64encode(self._body).decode("ascii")
+        return ret_val
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def MakeKey(method:str, url:str, params:Optional[Iterable[Tuple[str, str]] | Mapping[str, Any]]) -> str:
+        """Get the key that identifies matching requests, so that param order does not matter.
+
+        :param method: The HTTP method of the request.
+        :type method: str
+        :param url: The full URL of the request, without params.
+        :type url: str
+        :param params: The request params, as key/value string pairs or as a mapping whose list values become repeated keys.
+        :type params: Iterable[Tuple[str, str]] | Mapping[str, Any], optional
+        :return: The key of the request.
+        :rtype: str
+        """
+        query = urlencode(sorted(RecordedExchange.ParamPairs(params)))
+        return f"{method.upper()} {url}?{query}" if query else f"{method.upper()} {url}"
+
+    @staticmethod
+    def ParamPairs(params:Optional[Iterable[Tuple[str, str]] | Mapping[str, Any]]) -> Iterable[Tuple[str, str]]:
+        """Convert request params to key/value string pairs, as `requests` would send them.
+
+        :param params: The request params, as key/value string pairs or as a mapping whose list values become repeated keys.
+        :type params: Iterable[Tuple[str, str]] | Mapping[str, Any], optional
+        :return: The params as key/value string pairs, leaving out None values.
+        :rtype: Iterable[Tuple[str, str]]
+        """
+        if params is None:
+            return []
+        if not isinstance(params, Mapping):
+            return [(str(key), str(value)) for key, value in params]
+        ret_val = []
+        for key, value in params.items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            ret_val += [(str(key), str(item)) for item in values if item is not None]
+        return ret_val
+
+    @staticmethod
+    def FromDict(elements:Dict[str, Any]) -> "RecordedExchange":
+        """Create a RecordedExchange from the form produced by `AsDict`.
+
+        :param elements: The dict form of the exchange.
+        :type elements: Dict[str, Any]
+        :return: The exchange.
+        :rtype: RecordedExchange
+        """
+        body = elements["body"].encode("utf-8") if "body" in elements else base64.b64decode(elements.get("body_b64", ""))
+        ret_val = RecordedExchange(method=elements["method"], url=elements["url"], params=(), status=int(elements["status"]),
+                                   headers=elements.get("headers", {}), body=body, elapsed=float(elements.get("elapsed", 0.0)))
+        ret_val._params = elements.get("params", "")
+        return ret_val
@@ -0,0 +1,139 @@
+"""
+RequestTimings
+
+Contains a class for recording where the time went in a single APIRequest,
+along with its retry count and payload sizes.
+"""
+
+# import standard libraries
+from typing import Any, Callable, Dict, Optional
+
+# import 3rd-party libraries
+
+# import OGD libraries
+
+# Import local files
+from ogd.apis.models.enums.LatencyPhase import LatencyPhase
+
+class RequestTimings:
+    """Per-phase timings, in seconds, for one APIRequest, along with its retry count and payload sizes.
+
+    Payload sizes are counted both before compression (`RequestBytes`, `ResponseBytes`) and as sent over the wire (`RequestWireBytes`, `ResponseWireBytes`).
+    Phase timings describe the final attempt, except for `TOTAL`, which covers the whole request.
+    A phase that was not reached, or does not apply (such as `CONNECT` on a reused connection), has no timing.
+    A phase can be timed after the request has finished, such as `DECODE` for a response that is decoded lazily,
+    so phases set from then on can be forwarded to whatever recorded the timings, see `ForwardPhases`.
+    """
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self):
+        self._phases              : Dict[LatencyPhase, float] = {}
+        self._retries             : int                       = 0
+        self._request_bytes       : int                       = 0
+        self._request_wire_bytes  : int                       = 0
+        self._response_bytes      : int                       = 0
+        self._response_wire_bytes : int                       = 0
+        self._forward             : Optional[Callable[[LatencyPhase, float], None]] = None
+
+    def __str__(self) -> str:
+        phases = ", ".join(f"{phase}={seconds * 1000:.1f}ms" for phase, seconds in sorted(self._phases.items()))
+        return f"RequestTimings: {phases}, {self._retries} retries, {self._request_wire_bytes}B sent, {self._response_wire_bytes}B received"
+
+    @property
+    def Phases(self) -> Dict[LatencyPhase, float]:
+        """Property for the timings of every phase that was recorded.
+
+        :return: A mapping of phases to their durations, in seconds.
+        :rtype: Dict[LatencyPhase, float]
+        """
+        return dict(self._phases)
+
+    @property
+    def Retries(self) -> int:
+        return self._retries
+    @Retries.setter
+    def Retries(self, retries:int):
+        self._retries = retries
+
+    @property
+    def RequestBytes(self) -> int:
+        return self._request_bytes
+    @RequestBytes.setter
+    def RequestBytes(self, size:int):
+        self._request_bytes = size
+
+    @property
+    def RequestWireBytes(self) -> int:
+        return self._request_wire_bytes
+    @RequestWireBytes.setter
+    def RequestWireBytes(self, size:int):
+        self._request_wire_bytes = size
+
+    @property
+    def ResponseBytes(self) -> int:
+        return self._response_bytes
+    @ResponseBytes.setter
+    def ResponseBytes(self, size:int):
+        self._response_bytes = size
+
+    @property
+    def ResponseWireBytes(self) -> int:
+        return self._response_wire_bytes
+    @ResponseWireBytes.setter
+    def ResponseWireBytes(self, size:int):
+        self._response_wire_bytes = size
+
+    @property
+    def AsDict(self) -> Dict[str, Any]:
+        return {
+            "phases"              : {str(phase) : seconds for phase, seconds in self._phases.items()},
+            "retries"             : self._retries,
+            "request_bytes"       : self._request_bytes,
+            "request_wire_bytes"  : self._request_wire_bytes,
+            "response_bytes"      : self._response_bytes,
+            "response_wire_bytes" : self._response_wire_bytes
+        }
+
+    # *** PUBLIC METHODS ***
+
+    def Phase(self, phase:LatencyPhase) -> Optional[float]:
+        """Get the timing of a single phase.
+
+        :param phase: The phase to get.
+        :type phase: LatencyPhase
+        :return: The duration of the phase, in seconds, or None if it was not recorded.
+        :rtype: Optional[float]
+        """
+        return self._phases.get(phase)
+
+    def SetPhase(self, phase:LatencyPhase, seconds:float):
+        self._phases[phase] = max(0.0, seconds)
+        if self._forward is not None:
+            self._forward(phase, self._phases[phase])
+
+    def ForwardPhases(self, forward:Optional[Callable[[LatencyPhase, float], None]]):
+        """Send every phase set from now on to a function, so that phases timed after the timings were recorded are still counted.
+
+        :param forward: The function to call with each phase and its duration, in seconds, or None to stop forwarding.
+        :type forward: Optional[Callable[[LatencyPhase, float], None]]
+        """
+        self._forward = forward
+
+    def AddPhase(self, phase:LatencyPhase, seconds:float):
+        """Add time to a phase, for phases that can happen more than once in an attempt, such as opening connections.
+
+        :param phase: The phase to add time to.
+        :type phase: LatencyPhase
+        :param seconds: The number of seconds to add.
+        :type seconds: float
+        """
+        self._phases[phase] = self._phases.get(phase, 0.0) + max(0.0, seconds)
+
+    def ClearPhases(self):
+        """Remove all phase timings except `TOTAL`, so that a new attempt can be timed.
+        """
+        total = self._phases.get(LatencyPhase.TOTAL)
+        self._phases.clear()
+        if total is not None:
+            self._phases[LatencyPhase.TOTAL] = total
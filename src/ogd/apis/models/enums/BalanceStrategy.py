@@ -0,0 +1,18 @@
+from enum import IntEnum
+
+class BalanceStrategy(IntEnum):
+    """Enumerated type for how an EndpointGroup chooses which replica to send a request to.
+
+    `LEAST_OUTSTANDING` chooses the replica with the fewest requests in flight.
+    `EWMA_LATENCY` chooses the replica with the lowest moving average latency, weighted by its requests in flight.
+    """
+    LEAST_OUTSTANDING = 1
+    EWMA_LATENCY      = 2
+
+    def __str__(self):
+        """Stringify function for BalanceStrategies.
+
+        :return: Simple string version of the name of a BalanceStrategy
+        :rtype: _type_
+        """
+        return self.name
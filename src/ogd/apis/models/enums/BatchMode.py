@@ -0,0 +1,18 @@
+from enum import IntEnum
+
+class BatchMode(IntEnum):
+    """Enumerated type to track how a batch of requests handles a failed request.
+
+    `GATHER_ALL` runs every request and returns all of their results.
+    `FAIL_FAST` stops starting new requests as soon as any request fails.
+    """
+    GATHER_ALL = 1
+    FAIL_FAST  = 2
+
+    def __str__(self):
+        """Stringify function for BatchModes.
+
+        :return: Simple string version of the name of a BatchMode
+        :rtype: _type_
+        """
+        return self.name
@@ -0,0 +1,18 @@
+from enum import IntEnum
+
+class BodyEncoding(IntEnum):
+    """Enumerated type for how an APIRequest encodes its body.
+
+    `FORM` sends the body as URL-encoded form data.
+    `JSON` sends the body as a JSON document.
+    """
+    FORM = 1
+    JSON = 2
+
+    def __str__(self):
+        """Stringify function for BodyEncodings.
+
+        :return: Simple string version of the name of a BodyEncoding
+        :rtype: _type_
+        """
+        return self.name
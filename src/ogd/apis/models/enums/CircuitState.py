@@ -0,0 +1,20 @@
+from enum import IntEnum
+
+class CircuitState(IntEnum):
+    """Enumerated type to track the state of a circuit breaker for a remote host.
+
+    `CLOSED` lets requests through as normal.
+    `OPEN` fails requests immediately, after the host has failed repeatedly.
+    `HALF_OPEN` lets a limited number of trial requests through, to check whether the host has recovered.
+    """
+    CLOSED    = 1
+    OPEN      = 2
+    HALF_OPEN = 3
+
+    def __str__(self):
+        """Stringify function for CircuitStates.
+
+        :return: Simple string version of the name of a CircuitState
+        :rtype: _type_
+        """
+        return self.name
@@ -0,0 +1,20 @@
+from enum import IntEnum
+
+class JSONBackend(IntEnum):
+    """Enumerated type for the library a JSONSerializer uses to encode and decode JSON.
+
+    `AUTO` uses the fastest library that is installed, so the exact bytes sent depend on the installed packages.
+    `STDLIB` uses Python's built-in `json` module, and is the default.
+    `ORJSON` uses the optional `orjson` package, whose output is compact, so it is only used when asked for.
+    """
+    AUTO   = 1
+    STDLIB = 2
+    ORJSON = 3
+
+    def __str__(self):
+        """Stringify function for JSONBackends.
+
+        :return: Simple string version of the name of a JSONBackend
+        :rtype: _type_
+        """
+        return self.name
@@ -0,0 +1,24 @@
+from enum import IntEnum
+
+class LatencyPhase(IntEnum):
+    """Enumerated type for the phases of an APIRequest that are timed separately.
+
+    `CONNECT` is the time spent opening new connections (including TLS handshakes), and is only recorded when a connection was opened.
+    `FIRST_BYTE` is the time from sending the request to receiving the response headers, not counting any connect time.
+    `DOWNLOAD` is the time spent reading the response body.
+    `DECODE` is the time spent parsing the response body into an APIResponse.
+    `TOTAL` is the time for the whole request, including any retries and the delays between them.
+    """
+    CONNECT    = 1
+    FIRST_BYTE = 2
+    DOWNLOAD   = 3
+    DECODE     = 4
+    TOTAL      = 5
+
+    def __str__(self):
+        """Stringify function for LatencyPhases.
+
+        :return: Simple string version of the name of a LatencyPhase
+        :rtype: _type_
+        """
+        return self.name
@@ -0,0 +1,20 @@
+from enum import IntEnum
+
+class ResponseEncoding(IntEnum):
+    """Enumerated type for the formats an APIResponse can be encoded in, negotiated with `Accept`/`Content-Type` headers.
+
+    `JSON` is the usual JSON envelope, and is always available.
+    `MSGPACK` is the same envelope in MessagePack, which needs the optional `msgpack` package.
+    `COLUMNAR` is the JSON envelope, with each list of records in the value laid out as one list per column.
+    """
+    JSON     = 1
+    MSGPACK  = 2
+    COLUMNAR = 3
+
+    def __str__(self):
+        """Stringify function for ResponseEncodings.
+
+        :return: Simple string version of the name of a ResponseEncoding
+        :rtype: _type_
+        """
+        return self.name
@@ -1,8 +1,14 @@
 from enum import IntEnum
-from typing import Set
+from types import MappingProxyType
+from typing import Final, FrozenSet, Mapping
+
+from ogd.apis.models.enums.StatusClass import StatusClass
 
 class ResponseStatus(IntEnum):
     """Enumerated type to track the status of an API request result.
+
+    The class of each status, and the sets of statuses in each class, are computed once, when the module is imported,
+    so checking them is a lookup rather than a scan over every status.
     """
     NONE          =   1
     CONTINUE      = 100
@@ -81,32 +87,41 @@ class ResponseStatus(IntEnum):
     INSUFFICIENT_STORAGE = 507
     LOOP_DETECTED        = 508
 
+    @property
+    def Class(self) -> StatusClass:
+        """Property for the class of the status, such as `SUCCESS` for any 200-level status.
+
+        :return: The class of the status.
+        :rtype: StatusClass
+        """
+        return _STATUS_CLASSES[self]
+
     @staticmethod
-    def SuccessStatuses() -> Set["ResponseStatus"]:
-        """Gets the set of valid 400-level "client" error responses.
+    def SuccessStatuses() -> FrozenSet["ResponseStatus"]:
+        """Gets the set of valid 200-level "success" responses.
 
-        :return: The set of valid 400-level "client" error responses.
-        :rtype: Set[ResponseStatus]
+        :return: The set of valid 200-level "success" responses.
+        :rtype: FrozenSet[ResponseStatus]
         """
-        return {status for status in set(ResponseStatus) if status in range(200, 300)}
+        return _SUCCESS_STATUSES
 
     @staticmethod
-    def ClientErrors() -> Set["ResponseStatus"]:
+    def ClientErrors() -> FrozenSet["ResponseStatus"]:
         """Gets the set of valid 400-level "client" error responses.
 
         :return: The set of valid 400-level "client" error responses.
-        :rtype: Set[ResponseStatus]
+        :rtype: FrozenSet[ResponseStatus]
         """
-        return {status for status in set(ResponseStatus) if status in range(400, 500)}
+        return _CLIENT_ERRORS
 
     @staticmethod
-    def ServerErrors() -> Set["ResponseStatus"]:
+    def ServerErrors() -> FrozenSet["ResponseStatus"]:
         """Gets the set of valid 500-level "server" error responses.
 
         :return: The set of valid 500-level "server" error responses.
-        :rtype: Set[ResponseStatus]
+        :rtype: FrozenSet[ResponseStatus]
         """
-        return {status for status in set(ResponseStatus) if status in range(500, 600)}
+        return _SERVER_ERRORS
 
     def __str__(self):
         """Stringify function for ResponseStatus objects.
@@ -115,3 +130,11 @@ class ResponseStatus(IntEnum):
         :rtype: _type_
         """
         return self.name
+
+# Lookup tables for classifying statuses, which can only be built once the members of ResponseStatus exist.
+_STATUS_CLASSES   : Final[Mapping[ResponseStatus, StatusClass]] = MappingProxyType({
+    status : StatusClass(status.value // 100) if status.value >= 100 else StatusClass.NONE for status in ResponseStatus
+})
+_SUCCESS_STATUSES : Final[FrozenSet[ResponseStatus]] = frozenset(status for status, status_class in _STATUS_CLASSES.items() if status_class == StatusClass.SUCCESS)
+_CLIENT_ERRORS    : Final[FrozenSet[ResponseStatus]] = frozenset(status for status, status_class in _STATUS_CLASSES.items() if status_class == StatusClass.CLIENT_ERROR)
+_SERVER_ERRORS    : Final[FrozenSet[ResponseStatus]] = frozenset(status for status, status_class in _STATUS_CLASSES.items() if status_class == StatusClass.SERVER_ERROR)
@@ -0,0 +1,22 @@
+from enum import IntEnum
+
+class StatusClass(IntEnum):
+    """Enumerated type for the class of a ResponseStatus, given by the hundreds digit of its HTTP status code.
+
+    `NONE` is the class of `ResponseStatus.NONE`, which is not an HTTP status.
+    `INFORMATIONAL`, `SUCCESS`, `REDIRECT`, `CLIENT_ERROR` and `SERVER_ERROR` are the 100s through 500s.
+    """
+    NONE          = 0
+    INFORMATIONAL = 1
+    SUCCESS       = 2
+    REDIRECT      = 3
+    CLIENT_ERROR  = 4
+    SERVER_ERROR  = 5
+
+    def __str__(self):
+        """Stringify function for StatusClasses.
+
+        :return: Simple string version of the name of a StatusClass
+        :rtype: _type_
+        """
+        return self.name
@@ -1,29 +1,20 @@
 # import 3rd-party libraries
+from flask import Response
 from flask_restful import Resource
 
 from ogd.apis.models.APIResponse import APIResponse, RESTType, ResponseStatus
 
 class Hello(Resource):
-    def get(self):
-        ret_val = APIResponse(
-            req_type = RESTType.GET,
-            val      = None,
-            msg      = "Hello! You GETted successfully!",
-            status   = ResponseStatus.OK)
-        return ret_val.AsDict
+    # The responses never change, so they are frozen, and only encoded once.
+    _GET_RESPONSE  = APIResponse(req_type=RESTType.GET,  val=None, msg="Hello! You GETted successfully!",  status=ResponseStatus.OK).Freeze()
+    _POST_RESPONSE = APIResponse(req_type=RESTType.POST, val=None, msg="Hello! You POSTed successfully!", status=ResponseStatus.OK).Freeze()
+    _PUT_RESPONSE  = APIResponse(req_type=RESTType.PUT,  val=None, msg="Hello! You PUTted successfully!",  status=ResponseStatus.OK).Freeze()
 
-    def post(self):
-        ret_val = APIResponse(
-            req_type = RESTType.POST,
-            val      = None,
-            msg      = "Hello! You POSTed successfully!",
-            status   = ResponseStatus.OK)
-        return ret_val.AsDict
+    def get(self) -> Response:
+        return Hello._GET_RESPONSE.AsFlaskResponse
 
-    def put(self):
-        ret_val = APIResponse(
-            req_type = RESTType.PUT,
-            val      = None,
-            msg      = "Hello! You PUTted successfully!",
-            status   = ResponseStatus.OK)
-        return ret_val.AsDict
+    def post(self) -> Response:
+        return Hello._POST_RESPONSE.AsFlaskResponse
+
+    def put(self) -> Response:
+        return Hello._PUT_RESPONSE.AsFlaskResponse
@@ -12,6 +12,14 @@ from logging import Logger
 from typing import Any, List, Optional
 from urllib import parse
 
+# import 3rd-party libraries
+from flask import Flask
+
+# import local files
+from ogd.apis.configs.ServerConfig import ServerConfig
+from ogd.apis.utils.JSONSerializer import JSONSerializer
+from ogd.apis.utils.ResponseCompressor import ResponseCompressor
+
 def parse_list(list_str:str, logger:Optional[Logger]=None) -> Optional[List[Any]]:
     """Simple utility to parse a string containing a bracketed list into a Python list.
     Returns None if the list was empty
@@ -73,6 +81,22 @@ def urljoin(base:str, url:str, ignore_base_file:bool=False, allow_fragments:bool
             url = url[1:]
         return f"{base}/{url}"
 
+def configure_app(app:Flask, server_config:ServerConfig):
+    """Utility to apply a ServerConfig's serialization and compression settings to an app, and gzip the app's responses.
+
+    The JSONSerializer and ResponseCompressor settings are process-wide, so this should be called once, by the code that sets up the app,
+    rather than by each API registered to it. Calling it again for the same app does not add a second compression hook.
+
+    :param app: The app whose responses should be compressed.
+    :type app: Flask
+    :param server_config: The config with the JSON backend and compression settings to use.
+    :type server_config: ServerConfig
+    """
+    JSONSerializer.Configure(backend=server_config.SerializerBackend)
+    ResponseCompressor.Configure(min_size=server_config.CompressMinSize, level=server_config.CompressLevel)
+    if ResponseCompressor.AfterRequest not in app.after_request_funcs.get(None, []):
+        app.after_request(ResponseCompressor.AfterRequest)
+
 # def gen_interface(game_id, core_config:ConfigSchema, logger:Optional[Logger]=None) -> Optional[Interface]:
 #     """Utility to set up an Interface object for use by the API, given a game_id.
 
@@ -0,0 +1,320 @@
+"""
+CircuitBreaker
+
+Contains a class for tracking repeated failures of remote hosts,
+so that APIRequests to a host that is down can fail immediately instead of waiting out timeouts and retries.
+"""
+
+# import standard libraries
+import threading
+import time
+from typing import Any, Dict, Final, Optional, Set
+
+# import 3rd-party libraries
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.models.enums.CircuitState import CircuitState
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.utils.SessionPool import SessionPool
+
+class _HostCircuit:
+    """Bookkeeping for the circuit of a single host.
+    """
+    def __init__(self):
+        self.state     : CircuitState = CircuitState.CLOSED
+        self.failures  : int          = 0
+        self.successes : int          = 0
+        self.opened_at : float        = 0.0
+        self.trials    : int          = 0
+        # Counts the times the circuit has gone half-open, so trial permits from an earlier half-open period are not counted.
+        self.period    : int          = 0
+
+class CircuitPermit:
+    """Permission from a CircuitBreaker to send one request, given by `CircuitBreaker.Allow`.
+
+    A permit given while its host's circuit is half-open is a trial, which holds one of the trial slots until the permit is passed
+    to `RecordResult`, `RecordSuccess`, `RecordFailure` or `Release`. Each permit is only counted once.
+    """
+    def __init__(self, circuit:Optional[_HostCircuit]=None):
+        self._circuit : Optional[_HostCircuit] = circuit
+        self._period  : int                    = circuit.period if circuit is not None else 0
+        self._settled : bool                   = False
+
+    @property
+    def Trial(self) -> bool:
+        """Property indicating whether the permit was given as a trial of a half-open circuit.
+
+        :return: True if the permit is a trial, otherwise False.
+        :rtype: bool
+        """
+        return self._circuit is not None
+
+class CircuitBreaker:
+    """Per-host circuit breaker for APIRequests.
+
+    Each host starts `CLOSED`. After `failure_threshold` consecutive failed attempts, its circuit goes `OPEN`,
+    and requests to it are refused until `recovery_timeout` seconds have passed.
+    The circuit then goes `HALF_OPEN`, letting up to `half_open_max_calls` trial requests through at a time.
+    After `success_threshold` successful trials the circuit closes again, while any failed trial re-opens it.
+    Only the successes of trials count, so a request that was let through before the circuit opened can't close it.
+    To tell them apart, `Allow` gives each request a CircuitPermit, which should be passed along when the request's outcome is recorded.
+
+    An attempt counts as failed if it timed out or raised an error, or got a response whose status is in `failure_statuses`.
+    A `failure_threshold` of 0 or less disables the breaker, so that every request is allowed.
+
+    A single process-wide breaker is available from `CircuitBreaker.Default()`, and is what APIRequest uses unless given a breaker explicitly.
+    """
+    _DEFAULT_FAILURE_THRESHOLD : Final[int]   = 5
+    _DEFAULT_RECOVERY_TIMEOUT  : Final[float] = 30.0
+    _DEFAULT_HALF_OPEN_CALLS   : Final[int]   = 1
+    _DEFAULT_SUCCESS_THRESHOLD : Final[int]   = 1
+    _DEFAULT_FAILURE_STATUSES  : Final[Set[ResponseStatus]] = {ResponseStatus.BAD_GATEWAY, ResponseStatus.UNAVAILABLE, ResponseStatus.GATEWAY_TIMEOUT}
+
+    _default      : Optional["CircuitBreaker"] = None
+    _default_lock : threading.Lock             = threading.Lock()
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, failure_threshold:int=_DEFAULT_FAILURE_THRESHOLD, recovery_timeout:float=_DEFAULT_RECOVERY_TIMEOUT,
+                 half_open_max_calls:int=_DEFAULT_HALF_OPEN_CALLS, success_threshold:int=_DEFAULT_SUCCESS_THRESHOLD,
+                 failure_statuses:Optional[Set[ResponseStatus]]=None):
+        """Constructor for a CircuitBreaker.
+
+        :param failure_threshold: The number of consecutive failures that opens a host's circuit, or 0 to disable the breaker. Defaults to 5
+        :type failure_threshold: int, optional
+        :param recovery_timeout: The number of seconds a circuit stays open before trial requests are allowed. Defaults to 30.0
+        :type recovery_timeout: float, optional
+        :param half_open_max_calls: The number of trial requests allowed at once while a circuit is half-open. Defaults to 1
+        :type half_open_max_calls: int, optional
+        :param success_threshold: The number of successful trial requests needed to close a half-open circuit. Defaults to 1
+        :type success_threshold: int, optional
+        :param failure_statuses: The response statuses that count as failures. Defaults to None, in which case `BAD_GATEWAY`, `UNAVAILABLE` and `GATEWAY_TIMEOUT` count.
+        :type failure_statuses: Set[ResponseStatus], optional
+        """
+        self._failure_threshold   : int                     = failure_threshold
+        self._recovery_timeout    : float                   = recovery_timeout
+        self._half_open_max_calls : int                     = max(1, half_open_max_calls)
+        self._success_threshold   : int                     = max(1, success_threshold)
+        self._failure_statuses    : Set[ResponseStatus]     = failure_statuses if failure_statuses is not None else set(CircuitBreaker._DEFAULT_FAILURE_STATUSES)
+        self._circuits            : Dict[str, _HostCircuit] = {}
+        self._lock                : threading.Lock          = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"CircuitBreaker: opens after {self._failure_threshold} failures, recovers after {self._recovery_timeout}s"
+
+    @property
+    def Enabled(self) -> bool:
+        return self._failure_threshold > 0
+
+    @property
+    def States(self) -> Dict[str, CircuitState]:
+        """Property for the current circuit state of every host the breaker has seen.
+
+        :return: A mapping of host keys, in `scheme://netloc` form, to their circuit states.
+        :rtype: Dict[str, CircuitState]
+        """
+        with self._lock:
+            now = time.monotonic()
+            return {host : self._currentState(circuit, now=now) for host, circuit in self._circuits.items()}
+
+    @property
+    def AsDict(self) -> Dict[str, Dict[str, Any]]:
+        """Property for a monitoring-friendly summary of every host's circuit.
+
+        :return: A mapping of host keys to their state, consecutive failure count, and seconds until an open circuit allows trial requests.
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        with self._lock:
+            now = time.monotonic()
+            return {
+                host : {
+                    "state"    : str(self._currentState(circuit, now=now)),
+                    "failures" : circuit.failures,
+                    "retry_in" : max(0.0, circuit.opened_at + self._recovery_timeout - now) if circuit.state == CircuitState.OPEN else 0.0
+                }
+                for host, circuit in self._circuits.items()
+            }
+
+    # *** PUBLIC STATICS ***
+
+    @classmethod
+    def Default(cls) -> "CircuitBreaker":
+        """Get the shared, process-wide CircuitBreaker, creating it on first use.
+
+        :return: The shared CircuitBreaker instance.
+        :rtype: CircuitBreaker
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = CircuitBreaker()
+        return cls._default
+
+    @classmethod
+    def Configure(cls, failure_threshold:int=_DEFAULT_FAILURE_THRESHOLD, recovery_timeout:float=_DEFAULT_RECOVERY_TIMEOUT,
+                  half_open_max_calls:int=_DEFAULT_HALF_OPEN_CALLS, success_threshold:int=_DEFAULT_SUCCESS_THRESHOLD,
+                  failure_statuses:Optional[Set[ResponseStatus]]=None) -> "CircuitBreaker":
+        """Replace the shared, process-wide CircuitBreaker with one using the given settings.
+
+        :return: The new shared CircuitBreaker instance.
+        :rtype: CircuitBreaker
+        """
+        with cls._default_lock:
+            cls._default = CircuitBreaker(failure_threshold=failure_threshold, recovery_timeout=recovery_timeout,
+                                          half_open_max_calls=half_open_max_calls, success_threshold=success_threshold,
+                                          failure_statuses=failure_statuses)
+        return cls._default
+
+    # *** PUBLIC METHODS ***
+
+    def State(self, url:str) -> CircuitState:
+        """Get the current circuit state for the host of a URL.
+
+        :param url: A full URL, including scheme.
+        :type url: str
+        :return: The circuit state of the URL's host.
+        :rtype: CircuitState
+        """
+        with self._lock:
+            circuit = self._circuits.get(SessionPool.HostKey(url))
+            return self._currentState(circuit, now=time.monotonic()) if circuit else CircuitState.CLOSED
+
+    def Allow(self, url:str) -> Optional[CircuitPermit]:
+        """Check whether a request to the host of a URL may be sent.
+
+        If the host's circuit is half-open, a permitted request is given a trial permit, which takes up one of the trial slots
+        until the permit is passed to `RecordResult`, `RecordSuccess`, `RecordFailure` or `Release`.
+
+        :param url: A full URL, including scheme.
+        :type url: str
+        :return: A permit for the request if it may be sent, or None if it should fail immediately.
+        :rtype: Optional[CircuitPermit]
+        """
+        if not self.Enabled:
+            return CircuitPermit()
+        with self._lock:
+            circuit = self._circuits.setdefault(SessionPool.HostKey(url), _HostCircuit())
+            match self._currentState(circuit, now=time.monotonic()):
+                case CircuitState.CLOSED:
+                    return CircuitPermit()
+                case CircuitState.HALF_OPEN:
+                    if circuit.state == CircuitState.OPEN:
+                        circuit.state     = CircuitState.HALF_OPEN
+                        circuit.successes = 0
+                        circuit.trials    = 0
+                        circuit.period   += 1
+                    if circuit.trials < self._half_open_max_calls:
+                        circuit.trials += 1
+                        return CircuitPermit(circuit)
+                    return None
+                case _:
+                    return None
+
+    def RecordResult(self, url:str, status:ResponseStatus | int, permit:Optional[CircuitPermit]=None):
+        """Record the status of a response from the host of a URL, counting it as a success or failure.
+
+        :param url: A full URL, including scheme.
+        :type url: str
+        :param status: The status of the response.
+        :type status: ResponseStatus | int
+        :param permit: The permit `Allow` gave the request. Defaults to None, in which case a success does not count towards closing a half-open circuit.
+        :type permit: CircuitPermit, optional
+        """
+        if status in self._failure_statuses:
+            self.RecordFailure(url, permit=permit)
+        else:
+            self.RecordSuccess(url, permit=permit)
+
+    def RecordSuccess(self, url:str, permit:Optional[CircuitPermit]=None):
+        """Record a successful request to the host of a URL.
+
+        A half-open circuit only counts the success if it was a trial, given `permit` by `Allow` during the current half-open period.
+
+        :param url: A full URL, including scheme.
+        :type url: str
+        :param permit: The permit `Allow` gave the request. Defaults to None
+        :type permit: CircuitPermit, optional
+        """
+        if not self.Enabled:
+            return
+        with self._lock:
+            circuit = self._circuits.setdefault(SessionPool.HostKey(url), _HostCircuit())
+            if self._settleTrial(circuit, permit=permit):
+                circuit.successes += 1
+                if circuit.successes >= self._success_threshold:
+                    circuit.state = CircuitState.CLOSED
+            circuit.failures = 0
+
+    def RecordFailure(self, url:str, permit:Optional[CircuitPermit]=None):
+        """Record a failed request to the host of a URL.
+
+        :param url: A full URL, including scheme.
+        :type url: str
+        :param permit: The permit `Allow` gave the request, whose trial slot is freed. Defaults to None
+        :type permit: CircuitPermit, optional
+        """
+        if not self.Enabled:
+            return
+        with self._lock:
+            circuit = self._circuits.setdefault(SessionPool.HostKey(url), _HostCircuit())
+            self._settleTrial(circuit, permit=permit)
+            circuit.failures += 1
+            if circuit.state == CircuitState.HALF_OPEN or circuit.failures >= self._failure_threshold:
+                circuit.state     = CircuitState.OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.trials    = 0
+
+    def Release(self, url:str, permit:Optional[CircuitPermit]):
+        """Free the trial slot a request to the host of a URL may hold, without counting the request as a success or failure.
+
+        This is for attempts that were allowed, but ended with no outcome to record, such as a hedged attempt that was cancelled.
+        Releasing a permit whose outcome was already recorded does nothing.
+
+        :param url: A full URL, including scheme.
+        :type url: str
+        :param permit: The permit `Allow` gave the request.
+        :type permit: Optional[CircuitPermit]
+        """
+        if not self.Enabled:
+            return
+        with self._lock:
+            circuit = self._circuits.get(SessionPool.HostKey(url))
+            if circuit is not None:
+                self._settleTrial(circuit, permit=permit)
+
+    def Reset(self, url:Optional[str]=None):
+        """Close the circuit for the host of a URL, or for every host.
+
+        :param url: A full URL, including scheme, whose host should be reset. Defaults to None, in which case every host is reset.
+        :type url: str, optional
+        """
+        with self._lock:
+            if url is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(SessionPool.HostKey(url), None)
+
+    # *** PRIVATE METHODS ***
+
+    @staticmethod
+    def _settleTrial(circuit:_HostCircuit, permit:Optional[CircuitPermit]) -> bool:
+        """Use up a permit, freeing its trial slot if it is a trial of the circuit's current half-open period. Must be called with the lock held.
+
+        :return: True if the permit was an unsettled trial of the current half-open period, otherwise False.
+        """
+        if permit is None or permit._settled:
+            return False
+        permit._settled = True
+        if permit._circuit is not circuit or permit._period != circuit.period or circuit.state != CircuitState.HALF_OPEN:
+            return False
+        circuit.trials = max(0, circuit.trials - 1)
+        return True
+
+    def _currentState(self, circuit:_HostCircuit, now:float) -> CircuitState:
+        """Get the effective state of a circuit, treating an open circuit whose recovery timeout has passed as half-open.
+        """
+        if circuit.state == CircuitState.OPEN and now - circuit.opened_at >= self._recovery_timeout:
+            return CircuitState.HALF_OPEN
+        return circuit.state
@@ -0,0 +1,126 @@
+"""
+ConditionalResponse
+
+Contains a class for answering conditional GET requests to APIResponse-based resources,
+replying `NOT_MODIFIED` to clients whose `If-None-Match`/`If-Modified-Since` headers show they already have the current response.
+"""
+
+# import standard libraries
+import hashlib
+from datetime import datetime, timezone
+from typing import Callable, Final, Optional, Tuple
+
+# import 3rd-party libraries
+from flask import Response, request
+from werkzeug.http import is_resource_modified
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.APIResponse import APIResponse
+
+class ConditionalResponse:
+    """Utility for sending APIResponses with `ETag` and `Last-Modified` validators, and answering conditional requests with `NOT_MODIFIED`.
+
+    A resource can give a cheap version token, such as the modification time or revision of the data it serves,
+    in which case a current client is answered before the response is even built, so the resource's expensive work is skipped entirely.
+    Without a token, the response is built, and its `ETag` is a hash of its encoded bytes,
+    which a frozen APIResponse only computes once, so a current client still costs no serialization.
+
+    Entity tags are weak, since the same response may be sent gzipped or not, depending on the request.
+    Only successful responses to GET and HEAD requests are given validators or answered with `NOT_MODIFIED`.
+    """
+    _CONDITIONAL_METHODS : Final[Tuple[str, ...]] = ("GET", "HEAD")
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def Respond(build:Callable[[], APIResponse], version:Optional[str | bytes | int | float]=None,
+                last_modified:Optional[datetime | float]=None) -> Response:
+        """Get the Flask response to the current request, or a `NOT_MODIFIED` response if the client already has the current one.
+
+        :param build: A function that builds the APIResponse to send, called only if it is needed.
+        :type build: Callable[[], APIResponse]
+        :param version: A token that changes whenever the response would, to make the entity tag from instead of the response itself. Defaults to None
+        :type version: Optional[str | bytes | int | float], optional
+        :param last_modified: When the data in the response last changed, as a datetime or a POSIX timestamp such as a file's mtime. Defaults to None
+        :type last_modified: Optional[datetime | float], optional
+        :return: The Flask response to send.
+        :rtype: Response
+        """
+        ret_val  : Response
+        modified : Optional[datetime] = ConditionalResponse._toDatetime(last_modified)
+        etag     : Optional[str]      = ConditionalResponse.MakeETag(version) if version is not None else None
+
+        if request.method not in ConditionalResponse._CONDITIONAL_METHODS:
+            return build().AsFlaskResponse
+        if etag is not None and not ConditionalResponse.IsModified(etag=etag, last_modified=modified):
+            return ConditionalResponse.NotModified(etag=etag, last_modified=modified)
+        response = build()
+        if not response.OK:
+            return response.AsFlaskResponse
+        etag = etag if etag is not None else response.ETag
+        if not ConditionalResponse.IsModified(etag=etag, last_modified=modified):
+            return ConditionalResponse.NotModified(etag=etag, last_modified=modified)
+
+        ret_val = response.AsFlaskResponse
+        ret_val.set_etag(etag, weak=True)
+        if modified is not None:
+            ret_val.last_modified = modified
+        return ret_val
+
+    @staticmethod
+    def MakeETag(version:str | bytes | int | float) -> str:
+        """Make an entity tag from a version token.
+
+        :param version: The token, which should change whenever the response it stands for does.
+        :type version: str | bytes | int | float
+        :return: The unquoted entity tag.
+        :rtype: str
+        """
+        token = version if isinstance(version, bytes) else str(version).encode("utf-8")
+        return hashlib.blake2b(token, digest_size=16).hexdigest()
+
+    @staticmethod
+    def IsModified(etag:Optional[str], last_modified:Optional[datetime]) -> bool:
+        """Check whether the client making the current request needs a full response, rather than `NOT_MODIFIED`.
+
+        As in RFC 9110, `If-None-Match` takes precedence over `If-Modified-Since` when both are given.
+
+        :param etag: The unquoted entity tag of the current response, if any.
+        :type etag: Optional[str]
+        :param last_modified: When the data in the current response last changed, if known.
+        :type last_modified: Optional[datetime]
+        :return: True unless the request is a GET or HEAD whose validators match the current response.
+        :rtype: bool
+        """
+        if request.method not in ConditionalResponse._CONDITIONAL_METHODS:
+            return True
+        return is_resource_modified(request.environ, etag=etag, last_modified=last_modified)
+
+    @staticmethod
+    def NotModified(etag:Optional[str], last_modified:Optional[datetime]) -> Response:
+        """Make an empty `NOT_MODIFIED` Flask response, carrying the current validators.
+
+        :param etag: The unquoted entity tag of the current response, if any.
+        :type etag: Optional[str]
+        :param last_modified: When the data in the current response last changed, if known.
+        :type last_modified: Optional[datetime]
+        :return: A `NOT_MODIFIED` response with no body.
+        :rtype: Response
+        """
+        ret_val = Response(status=ResponseStatus.NOT_MODIFIED.value)
+        if etag is not None:
+            ret_val.set_etag(etag, weak=True)
+        if last_modified is not None:
+            ret_val.last_modified = last_modified
+        return ret_val
+
+    # *** PRIVATE METHODS ***
+
+    @staticmethod
+    def _toDatetime(last_modified:Optional[datetime | float]) -> Optional[datetime]:
+        if last_modified is None or isinstance(last_modified, datetime):
+            return last_modified
+        return datetime.fromtimestamp(last_modified, tz=timezone.utc)
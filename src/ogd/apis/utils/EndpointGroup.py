@@ -0,0 +1,201 @@
+"""
+EndpointGroup
+
+Contains a class for balancing APIRequests across several replicas of the same OGD API,
+choosing a replica for each request and temporarily ejecting replicas that keep failing.
+"""
+
+# import standard libraries
+import threading
+import time
+from typing import Any, Dict, Final, List, Optional
+
+# import 3rd-party libraries
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.models.enums.BalanceStrategy import BalanceStrategy
+from ogd.apis.utils.APIUtils import urljoin
+
+class _Replica:
+    """Bookkeeping for a single replica of the group.
+    """
+    def __init__(self, base_url:str):
+        self.base_url      : str             = base_url
+        self.outstanding   : int             = 0
+        self.ewma          : Optional[float] = None
+        self.failures      : int             = 0
+        self.ejected_until : float           = 0.0
+
+class EndpointGroup:
+    """Group of base URLs for replicas of the same API, which an APIRequest can target instead of a single URL.
+
+    For each request, the group chooses a replica by its `strategy`, and the request's endpoint is joined onto the replica's base URL with `APIUtils.urljoin`.
+    With `EWMA_LATENCY`, each replica's score is its exponentially-weighted moving average latency times one more than its requests in flight,
+    so that a fast replica does not get every request during a burst. Replicas with no latency yet score 0, so each gets tried.
+    Ties are broken round-robin.
+
+    After `failure_threshold` consecutive failed requests, a replica is ejected for `ejection_time` seconds, and gets no requests unless every replica is ejected.
+    A request counts as failed if it got a server error, which includes timeouts and connection errors.
+    """
+    _DEFAULT_FAILURE_THRESHOLD : Final[int]   = 3
+    _DEFAULT_EJECTION_TIME     : Final[float] = 10.0
+    _DEFAULT_EWMA_WEIGHT       : Final[float] = 0.3
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, base_urls:List[str], strategy:BalanceStrategy=BalanceStrategy.LEAST_OUTSTANDING,
+                 failure_threshold:int=_DEFAULT_FAILURE_THRESHOLD, ejection_time:float=_DEFAULT_EJECTION_TIME,
+                 ewma_weight:float=_DEFAULT_EWMA_WEIGHT, name:Optional[str]=None):
+        """Constructor for an EndpointGroup.
+
+        :param base_urls: The base URLs of the replicas, such as `https://replica.host/path/to/app.wsgi`.
+        :type base_urls: List[str]
+        :param strategy: How to choose a replica for each request. Defaults to BalanceStrategy.LEAST_OUTSTANDING
+        :type strategy: BalanceStrategy, optional
+        :param failure_threshold: The number of consecutive failures that ejects a replica, or 0 to never eject. Defaults to 3
+        :type failure_threshold: int, optional
+        :param ejection_time: The number of seconds an ejected replica stays out of rotation. Defaults to 10.0
+        :type ejection_time: float, optional
+        :param ewma_weight: The weight, from 0 to 1, given to each new latency in a replica's moving average. Defaults to 0.3
+        :type ewma_weight: float, optional
+        :param name: A name for the group, used to key cached and coalesced requests. Defaults to None, in which case the base URLs are used.
+        :type name: str, optional
+        :raises ValueError: If no base URLs are given.
+        """
+        if not base_urls:
+            raise ValueError("An EndpointGroup needs at least one base URL.")
+        self._replicas          : List[_Replica]  = [_Replica(base_url=base_url) for base_url in base_urls]
+        self._strategy          : BalanceStrategy = strategy
+        self._failure_threshold : int             = failure_threshold
+        self._ejection_time     : float           = ejection_time
+        self._ewma_weight       : float           = min(max(ewma_weight, 0.0), 1.0)
+        self._name              : str             = name or ",".join(base_urls)
+        self._lock              : threading.Lock  = threading.Lock()
+        self._next              : int             = 0
+
+    def __str__(self) -> str:
+        return f"EndpointGroup {self._name}: {len(self._replicas)} replicas, {self._strategy}"
+
+    @property
+    def Name(self) -> str:
+        return self._name
+
+    @property
+    def BaseURLs(self) -> List[str]:
+        return [replica.base_url for replica in self._replicas]
+
+    @property
+    def Healthy(self) -> List[str]:
+        """Property for the base URLs of the replicas that are not currently ejected.
+
+        :return: The base URLs of the replicas in rotation.
+        :rtype: List[str]
+        """
+        with self._lock:
+            now = time.monotonic()
+            return [replica.base_url for replica in self._replicas if replica.ejected_until <= now]
+
+    @property
+    def AsDict(self) -> Dict[str, Dict[str, Any]]:
+        """Property for a monitoring-friendly summary of every replica.
+
+        :return: A mapping of base URLs to their requests in flight, moving average latency, consecutive failures, and whether they are ejected.
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        with self._lock:
+            now = time.monotonic()
+            return {
+                replica.base_url : {
+                    "outstanding" : replica.outstanding,
+                    "ewma"        : replica.ewma,
+                    "failures"    : replica.failures,
+                    "ejected"     : replica.ejected_until > now
+                }
+                for replica in self._replicas
+            }
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def URL(base_url:str, endpoint:str) -> str:
+        """Build the full URL of an endpoint on one replica.
+
+        :param base_url: The base URL of the replica.
+        :type base_url: str
+        :param endpoint: The endpoint, relative to the base URL.
+        :type endpoint: str
+        :return: The endpoint joined onto the base URL, keeping any file name in the base, such as `app.wsgi`.
+        :rtype: str
+        """
+        return urljoin(base=base_url, url=endpoint)
+
+    # *** PUBLIC METHODS ***
+
+    def Choose(self, exclude:Optional[str]=None) -> str:
+        """Choose the replica for the next request.
+
+        :param exclude: The base URL of a replica to avoid if any other is available, such as the one a hedged request was already sent to. Defaults to None
+        :type exclude: str, optional
+        :return: The base URL of the chosen replica.
+        :rtype: str
+        """
+        with self._lock:
+            now        = time.monotonic()
+            count      = len(self._replicas)
+            rotation   = [self._replicas[(self._next + i) % count] for i in range(count)]
+            self._next = (self._next + 1) % count
+            candidates = [replica for replica in rotation if replica.ejected_until <= now and replica.base_url != exclude] \
+                      or [replica for replica in rotation if replica.ejected_until <= now] \
+                      or [min(rotation, key=lambda replica: replica.ejected_until)]
+            return min(candidates, key=self._score).base_url
+
+    def Begin(self, base_url:str):
+        """Count a request as in flight to a replica.
+
+        :param base_url: The base URL of the replica, from `Choose`.
+        :type base_url: str
+        """
+        with self._lock:
+            replica = self._find(base_url)
+            if replica is not None:
+                replica.outstanding += 1
+
+    def End(self, base_url:str, failed:bool, latency:Optional[float]=None):
+        """Count a request to a replica as finished, updating its latency average and health.
+
+        :param base_url: The base URL of the replica, from `Choose`.
+        :type base_url: str
+        :param failed: Whether the request failed.
+        :type failed: bool
+        :param latency: The latency of the request, in seconds, if it succeeded. Defaults to None
+        :type latency: float, optional
+        """
+        with self._lock:
+            replica = self._find(base_url)
+            if replica is None:
+                return
+            replica.outstanding = max(0, replica.outstanding - 1)
+            if failed:
+                replica.failures += 1
+                if 0 < self._failure_threshold <= replica.failures:
+                    replica.ejected_until = time.monotonic() + self._ejection_time
+                    replica.failures      = 0
+            else:
+                replica.failures = 0
+                if latency is not None:
+                    replica.ewma = latency if replica.ewma is None else self._ewma_weight * latency + (1 - self._ewma_weight) * replica.ewma
+
+    # *** PRIVATE METHODS ***
+
+    def _find(self, base_url:str) -> Optional[_Replica]:
+        for replica in self._replicas:
+            if replica.base_url == base_url:
+                return replica
+        return None
+
+    def _score(self, replica:_Replica) -> float:
+        if self._strategy == BalanceStrategy.EWMA_LATENCY:
+            return (replica.ewma or 0.0) * (replica.outstanding + 1)
+        return float(replica.outstanding)
@@ -0,0 +1,162 @@
+"""
+HedgePolicy
+
+Contains a class describing when an idempotent APIRequest should send a duplicate "hedge" request,
+to cut the tail latency caused by occasional slow upstream workers.
+"""
+
+# import standard libraries
+import threading
+from typing import Any, Dict, Final, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+# import 3rd-party libraries
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.models.enums.LatencyPhase import LatencyPhase
+from ogd.apis.utils.LatencyRecorder import LatencyRecorder
+
+class HedgePolicy:
+    """Policy for hedging GET requests.
+
+    If no response has arrived after the hedge delay, a duplicate request is sent, either to the same URL,
+    or to the next of the `alternates` hosts in turn, and whichever response arrives first is used.
+    The hedge delay is the given `percentile` of the host's recorded `TOTAL` latencies, clamped between `min_delay` and `max_delay`,
+    or `delay` if given. Until the host has `min_samples` recorded latencies, `max_delay` is used.
+
+    The policy counts how many requests were hedged, and how many of those the hedge won, for tuning.
+    """
+    _DEFAULT_PERCENTILE  : Final[float] = 95.0
+    _DEFAULT_MIN_DELAY   : Final[float] = 0.01
+    _DEFAULT_MAX_DELAY   : Final[float] = 1.0
+    _DEFAULT_MIN_SAMPLES : Final[int]   = 20
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, percentile:float=_DEFAULT_PERCENTILE, delay:Optional[float]=None,
+                 min_delay:float=_DEFAULT_MIN_DELAY, max_delay:float=_DEFAULT_MAX_DELAY, min_samples:int=_DEFAULT_MIN_SAMPLES,
+                 alternates:Optional[List[str]]=None):
+        """Constructor for a HedgePolicy.
+
+        :param percentile: The percentile of the host's recorded latencies after which to send a hedge. Defaults to 95.0
+        :type percentile: float, optional
+        :param delay: A fixed number of seconds after which to send a hedge, instead of using a percentile. Defaults to None
+        :type delay: float, optional
+        :param min_delay: The shortest percentile-based hedge delay, in seconds. Defaults to 0.01
+        :type min_delay: float, optional
+        :param max_delay: The longest percentile-based hedge delay, in seconds, also used until there are enough samples. Defaults to 1.0
+        :type max_delay: float, optional
+        :param min_samples: The number of recorded latencies a host needs before its percentile is used. Defaults to 20
+        :type min_samples: int, optional
+        :param alternates: Base URLs of alternate hosts to send hedges to, in `scheme://netloc` form. Defaults to None, in which case hedges go to the original URL.
+        :type alternates: List[str], optional
+        """
+        self._percentile  : float           = min(max(percentile, 0.0), 100.0)
+        self._delay       : Optional[float] = delay
+        self._min_delay   : float           = max(0.0, min_delay)
+        self._max_delay   : float           = max(self._min_delay, max_delay)
+        self._min_samples : int             = max(1, min_samples)
+        self._alternates  : List[str]       = [alt if alt.startswith(("http://", "https://")) else f"https://{alt}" for alt in (alternates or [])]
+        self._lock        : threading.Lock  = threading.Lock()
+        self._next_alt    : int             = 0
+        self._requests    : int             = 0
+        self._hedged      : int             = 0
+        self._wins        : int             = 0
+
+    def __str__(self) -> str:
+        when = f"{self._delay}s" if self._delay is not None else f"p{self._percentile:g}"
+        return f"HedgePolicy: hedge after {when}, {self._hedged}/{self._requests} requests hedged, {self._wins} hedges won"
+
+    @property
+    def Requests(self) -> int:
+        """Property for the number of requests sent under the policy.
+
+        :return: The number of requests sent under the policy, whether or not they were hedged.
+        :rtype: int
+        """
+        return self._requests
+
+    @property
+    def Hedged(self) -> int:
+        """Property for the number of requests that sent a hedge.
+
+        :return: The number of hedged requests.
+        :rtype: int
+        """
+        return self._hedged
+
+    @property
+    def Wins(self) -> int:
+        """Property for the number of hedged requests whose hedge supplied the response.
+
+        :return: The number of hedges that won.
+        :rtype: int
+        """
+        return self._wins
+
+    @property
+    def HedgeRate(self) -> float:
+        return self._hedged / self._requests if self._requests > 0 else 0.0
+
+    @property
+    def WinRate(self) -> float:
+        return self._wins / self._hedged if self._hedged > 0 else 0.0
+
+    @property
+    def AsDict(self) -> Dict[str, Any]:
+        return {
+            "requests"   : self._requests,
+            "hedged"     : self._hedged,
+            "wins"       : self._wins,
+            "hedge_rate" : self.HedgeRate,
+            "win_rate"   : self.WinRate
+        }
+
+    # *** PUBLIC METHODS ***
+
+    def Delay(self, url:str, recorder:LatencyRecorder) -> float:
+        """Get the number of seconds to wait for a response before hedging a request.
+
+        :param url: The full URL of the request, including scheme.
+        :type url: str
+        :param recorder: The recorder holding the latencies of the URL's host.
+        :type recorder: LatencyRecorder
+        :return: The hedge delay, in seconds.
+        :rtype: float
+        """
+        if self._delay is not None:
+            return max(0.0, self._delay)
+        histogram = recorder.Histogram(url, LatencyPhase.TOTAL)
+        if histogram is None or histogram.Count < self._min_samples:
+            return self._max_delay
+        return min(max(histogram.Percentile(self._percentile), self._min_delay), self._max_delay)
+
+    def HedgeURL(self, url:str) -> str:
+        """Get the URL to send a hedge of a request to, moving on to the next alternate host each time.
+
+        :param url: The full URL of the original request, including scheme.
+        :type url: str
+        :return: The URL with its scheme and host replaced by those of the next alternate, or the URL itself if there are no alternates.
+        :rtype: str
+        """
+        if not self._alternates:
+            return url
+        with self._lock:
+            alternate = urlsplit(self._alternates[self._next_alt % len(self._alternates)])
+            self._next_alt += 1
+        return urlunsplit(urlsplit(url)._replace(scheme=alternate.scheme, netloc=alternate.netloc))
+
+    def RecordOutcome(self, hedged:bool, won:bool):
+        """Count a request sent under the policy.
+
+        :param hedged: Whether a hedge was sent for the request.
+        :type hedged: bool
+        :param won: Whether the hedge supplied the response.
+        :type won: bool
+        """
+        with self._lock:
+            self._requests += 1
+            self._hedged   += int(hedged)
+            self._wins     += int(hedged and won)
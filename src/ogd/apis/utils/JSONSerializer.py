@@ -0,0 +1,146 @@
+"""
+JSONSerializer
+
+Contains a class for encoding and decoding the JSON bodies of API requests and responses,
+using the standard `json` module, or the optional `orjson` package when it is asked for and installed.
+"""
+
+# import standard libraries
+import json
+import logging
+import threading
+from typing import Any, Optional
+
+# import 3rd-party libraries
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# import OGD libraries
+from ogd.common.utils.Logger import Logger
+
+# import local files
+from ogd.apis.models.enums.JSONBackend import JSONBackend
+
+class JSONSerializer:
+    """Encoder and decoder for JSON, which encodes straight to UTF-8 bytes.
+
+    With the `STDLIB` backend, which is the default, output is identical to `json.dumps`.
+    With the `ORJSON` backend, output is compact (no spaces after separators), non-ASCII characters are written as UTF-8 rather than escaped,
+    and `datetime`, `UUID` and dataclass values are encoded natively, where `json.dumps` would raise a `TypeError`.
+    Since this changes the bytes sent, orjson is only used when asked for, with `ORJSON`, or with `AUTO` to use it whenever it is installed.
+    Objects orjson can't encode, such as integers too large for 64 bits, are encoded by the standard library instead.
+    Either way, unencodable values raise a `TypeError`, and malformed input raises a `ValueError`.
+
+    The process-wide serializer used by APIResponse and APIRequest is available from `JSONSerializer.Default()`,
+    and uses the standard library unless it is replaced with `JSONSerializer.Configure()`, such as from a ServerConfig's `SerializerBackend`.
+    """
+    _default      : Optional["JSONSerializer"] = None
+    _default_lock : threading.Lock             = threading.Lock()
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, backend:JSONBackend=JSONBackend.STDLIB):
+        """Constructor for a JSONSerializer.
+
+        If `ORJSON` is requested but `orjson` is not installed, a warning is logged and the standard library is used instead.
+
+        :param backend: The library to encode and decode with. Defaults to JSONBackend.STDLIB
+        :type backend: JSONBackend, optional
+        """
+        self._backend : JSONBackend = JSONSerializer._resolve(backend)
+
+    def __str__(self) -> str:
+        return f"JSONSerializer: {self._backend}"
+
+    @property
+    def Backend(self) -> JSONBackend:
+        """Property for the library the serializer actually uses, which is never `AUTO`.
+
+        :return: The backend in use.
+        :rtype: JSONBackend
+        """
+        return self._backend
+
+    # *** PUBLIC STATICS ***
+
+    @classmethod
+    def Default(cls) -> "JSONSerializer":
+        """Get the shared, process-wide JSONSerializer, creating it on first use.
+
+        :return: The shared JSONSerializer instance.
+        :rtype: JSONSerializer
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = JSONSerializer()
+        return cls._default
+
+    @classmethod
+    def Configure(cls, backend:JSONBackend=JSONBackend.STDLIB) -> "JSONSerializer":
+        """Replace the shared, process-wide JSONSerializer with one using the given backend.
+
+        :param backend: The library to encode and decode with. Defaults to JSONBackend.STDLIB
+        :type backend: JSONBackend, optional
+        :return: The new shared JSONSerializer instance.
+        :rtype: JSONSerializer
+        """
+        with cls._default_lock:
+            cls._default = JSONSerializer(backend=backend)
+        return cls._default
+
+    @staticmethod
+    def FastAvailable() -> bool:
+        """Check whether the faster `orjson` backend is available.
+
+        :return: True if `orjson` is installed, otherwise False.
+        :rtype: bool
+        """
+        return orjson is not None
+
+    # *** PUBLIC METHODS ***
+
+    def Dumps(self, obj:Any) -> bytes:
+        """Encode an object as JSON.
+
+        :param obj: The object to encode.
+        :type obj: Any
+        :raises TypeError: If the object contains a value that can't be encoded.
+        :return: The UTF-8 encoded JSON.
+        :rtype: bytes
+        """
+        if self._backend == JSONBackend.ORJSON:
+            try:
+                return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # orjson rejects some values the standard library accepts, such as integers over 64 bits, so let it have a try.
+                pass
+        return json.dumps(obj).encode("utf-8")
+
+    def Loads(self, data:bytes | bytearray | memoryview | str) -> Any:
+        """Decode a JSON document.
+
+        :param data: The JSON to decode.
+        :type data: bytes | bytearray | memoryview | str
+        :raises ValueError: A `json.JSONDecodeError` if the data is not valid JSON, or with the standard library, a `UnicodeDecodeError` if bytes are not valid UTF-8.
+        :return: The decoded object.
+        :rtype: Any
+        """
+        if self._backend == JSONBackend.ORJSON:
+            return orjson.loads(data)
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+    # *** PRIVATE METHODS ***
+
+    @staticmethod
+    def _resolve(backend:JSONBackend) -> JSONBackend:
+        match backend:
+            case JSONBackend.AUTO:
+                return JSONBackend.ORJSON if orjson is not None else JSONBackend.STDLIB
+            case JSONBackend.ORJSON if orjson is None:
+                Logger.Log("The orjson JSON backend was requested, but orjson is not installed; using the standard json module instead.", logging.WARNING)
+                return JSONBackend.STDLIB
+            case _:
+                return backend
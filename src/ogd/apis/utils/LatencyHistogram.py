@@ -0,0 +1,133 @@
+"""
+LatencyHistogram
+
+Contains a class for aggregating request latencies into fixed buckets,
+so that their distribution can be read or dumped cheaply without keeping every sample.
+"""
+
+# import standard libraries
+import bisect
+import math
+import threading
+from typing import Any, Dict, Final, List, Optional, Sequence, Tuple
+
+# import 3rd-party libraries
+
+# import OGD libraries
+
+# import local files
+
+class LatencyHistogram:
+    """Histogram of latencies, in seconds, with fixed bucket bounds.
+
+    Each bucket counts the samples no larger than its upper bound, and greater than the previous bucket's bound.
+    A final overflow bucket, with an infinite upper bound, counts anything larger than the last bound.
+    Percentiles are estimated as the upper bound of the bucket they fall in, capped at the largest sample seen.
+    """
+    _DEFAULT_BOUNDS : Final[Tuple[float, ...]] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, bounds:Optional[Sequence[float]]=None):
+        """Constructor for a LatencyHistogram.
+
+        :param bounds: The upper bounds of the buckets, in seconds. Defaults to None, in which case bounds from 1ms to 10s are used.
+        :type bounds: Sequence[float], optional
+        """
+        self._bounds : List[float]    = sorted(bounds) if bounds is not None else list(LatencyHistogram._DEFAULT_BOUNDS)
+        self._counts : List[int]      = [0] * (len(self._bounds) + 1)
+        self._count  : int            = 0
+        self._sum    : float          = 0.0
+        self._min    : float          = math.inf
+        self._max    : float          = 0.0
+        self._lock   : threading.Lock = threading.Lock()
+
+    def __str__(self) -> str:
+        if self._count == 0:
+            return "LatencyHistogram: no samples"
+        return f"LatencyHistogram: {self._count} samples, mean {self.Mean * 1000:.1f}ms, p50 {self.Percentile(50) * 1000:.1f}ms, p99 {self.Percentile(99) * 1000:.1f}ms, max {self._max * 1000:.1f}ms"
+
+    @property
+    def Count(self) -> int:
+        return self._count
+
+    @property
+    def Sum(self) -> float:
+        return self._sum
+
+    @property
+    def Mean(self) -> float:
+        return self._sum / self._count if self._count > 0 else 0.0
+
+    @property
+    def Min(self) -> float:
+        return self._min if self._count > 0 else 0.0
+
+    @property
+    def Max(self) -> float:
+        return self._max
+
+    @property
+    def Buckets(self) -> List[Tuple[float, int]]:
+        """Property for the count of samples in each bucket.
+
+        :return: A list of each bucket's upper bound, in seconds, and its count, ending with the overflow bucket.
+        :rtype: List[Tuple[float, int]]
+        """
+        with self._lock:
+            return list(zip(self._bounds + [math.inf], self._counts))
+
+    @property
+    def AsDict(self) -> Dict[str, Any]:
+        return {
+            "count"   : self._count,
+            "mean"    : self.Mean,
+            "min"     : self.Min,
+            "max"     : self.Max,
+            "p50"     : self.Percentile(50),
+            "p90"     : self.Percentile(90),
+            "p99"     : self.Percentile(99),
+            "buckets" : {("inf" if math.isinf(bound) else str(bound)) : count for bound, count in self.Buckets}
+        }
+
+    # *** PUBLIC METHODS ***
+
+    def Record(self, seconds:float):
+        """Add a sample to the histogram.
+
+        :param seconds: The latency to record, in seconds.
+        :type seconds: float
+        """
+        with self._lock:
+            self._counts[bisect.bisect_left(self._bounds, seconds)] += 1
+            self._count += 1
+            self._sum   += seconds
+            self._min    = min(self._min, seconds)
+            self._max    = max(self._max, seconds)
+
+    def Percentile(self, percent:float) -> float:
+        """Estimate a percentile of the recorded latencies.
+
+        :param percent: The percentile to estimate, from 0 to 100.
+        :type percent: float
+        :return: The estimated latency at that percentile, in seconds, or 0 if there are no samples.
+        :rtype: float
+        """
+        with self._lock:
+            if self._count == 0:
+                return 0.0
+            target = max(1, math.ceil(self._count * min(max(percent, 0.0), 100.0) / 100))
+            seen = 0
+            for i, count in enumerate(self._counts):
+                seen += count
+                if seen >= target:
+                    return min(self._bounds[i], self._max) if i < len(self._bounds) else self._max
+            return self._max
+
+    def Reset(self):
+        with self._lock:
+            self._counts = [0] * (len(self._bounds) + 1)
+            self._count  = 0
+            self._sum    = 0.0
+            self._min    = math.inf
+            self._max    = 0.0
@@ -0,0 +1,181 @@
+"""
+LatencyRecorder
+
+Contains a class for aggregating the RequestTimings of APIRequests into per-host latency histograms,
+so that slow upstream servers can be told apart from slow response decoding without attaching a profiler.
+"""
+
+# import standard libraries
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+# import 3rd-party libraries
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.models.enums.LatencyPhase import LatencyPhase
+from ogd.apis.models.RequestTimings import RequestTimings
+from ogd.apis.utils.LatencyHistogram import LatencyHistogram
+from ogd.apis.utils.SessionPool import SessionPool
+
+class _HostLatencies:
+    """Aggregated timings for a single host.
+    """
+    def __init__(self, bounds:Optional[Sequence[float]]):
+        self.phases              : Dict[LatencyPhase, LatencyHistogram] = {phase : LatencyHistogram(bounds=bounds) for phase in LatencyPhase}
+        self.requests            : int                                  = 0
+        self.retries             : int                                  = 0
+        self.request_bytes       : int                                  = 0
+        self.request_wire_bytes  : int                                  = 0
+        self.response_bytes      : int                                  = 0
+        self.response_wire_bytes : int                                  = 0
+
+class LatencyRecorder:
+    """Per-host latency histograms for APIRequests.
+
+    Each recorded request adds its phase timings to the histograms of its host (scheme + network location),
+    and adds to the host's totals of requests, retries, and bytes sent and received, both before compression and over the wire.
+
+    Phases timed after a request is recorded, such as `DECODE` for a response that is only decoded once its value is read,
+    are added to the histograms when they happen, so a response that is never decoded adds no `DECODE` sample.
+
+    A single process-wide recorder is available from `LatencyRecorder.Default()`, and is what APIRequest records to unless given a recorder explicitly.
+    """
+    _default      : Optional["LatencyRecorder"] = None
+    _default_lock : threading.Lock              = threading.Lock()
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, bounds:Optional[Sequence[float]]=None):
+        """Constructor for a LatencyRecorder.
+
+        :param bounds: The upper bounds of the histogram buckets, in seconds. Defaults to None, in which case the LatencyHistogram defaults are used.
+        :type bounds: Sequence[float], optional
+        """
+        self._bounds : Optional[Sequence[float]] = bounds
+        self._hosts  : Dict[str, _HostLatencies] = {}
+        self._lock   : threading.Lock            = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"LatencyRecorder: {len(self._hosts)} hosts"
+
+    @property
+    def Hosts(self) -> List[str]:
+        """Property for the list of hosts that have recorded timings.
+
+        :return: The list of host keys, in `scheme://netloc` form, with recorded timings.
+        :rtype: List[str]
+        """
+        with self._lock:
+            return list(self._hosts.keys())
+
+    @property
+    def AsDict(self) -> Dict[str, Dict[str, Any]]:
+        """Property for a monitoring-friendly summary of every host's timings.
+
+        :return: A mapping of host keys to their request, retry and byte totals, compression savings, and a summary of each phase's histogram.
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        with self._lock:
+            hosts = list(self._hosts.items())
+        return {
+            host : {
+                "requests"            : latencies.requests,
+                "retries"             : latencies.retries,
+                "request_bytes"       : latencies.request_bytes,
+                "request_wire_bytes"  : latencies.request_wire_bytes,
+                "response_bytes"      : latencies.response_bytes,
+                "response_wire_bytes" : latencies.response_wire_bytes,
+                "bytes_saved"         : latencies.request_bytes + latencies.response_bytes - latencies.request_wire_bytes - latencies.response_wire_bytes,
+                "phases"              : {str(phase) : histogram.AsDict for phase, histogram in latencies.phases.items()}
+            }
+            for host, latencies in hosts
+        }
+
+    # *** PUBLIC STATICS ***
+
+    @classmethod
+    def Default(cls) -> "LatencyRecorder":
+        """Get the shared, process-wide LatencyRecorder, creating it on first use.
+
+        :return: The shared LatencyRecorder instance.
+        :rtype: LatencyRecorder
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = LatencyRecorder()
+        return cls._default
+
+    # *** PUBLIC METHODS ***
+
+    def Record(self, url:str, timings:RequestTimings):
+        """Add the timings of a request to the histograms for the host of its URL, along with any phases set on the timings afterwards.
+
+        :param url: The full URL of the request, including scheme.
+        :type url: str
+        :param timings: The timings of the request.
+        :type timings: RequestTimings
+        """
+        key = SessionPool.HostKey(url)
+        with self._lock:
+            latencies = self._hosts.get(key)
+            if latencies is None:
+                latencies = _HostLatencies(bounds=self._bounds)
+                self._hosts[key] = latencies
+            latencies.requests            += 1
+            latencies.retries             += timings.Retries
+            latencies.request_bytes       += timings.RequestBytes
+            latencies.request_wire_bytes  += timings.RequestWireBytes
+            latencies.response_bytes      += timings.ResponseBytes
+            latencies.response_wire_bytes += timings.ResponseWireBytes
+        for phase, seconds in timings.Phases.items():
+            latencies.phases[phase].Record(seconds)
+        timings.ForwardPhases(lambda phase, seconds: latencies.phases[phase].Record(seconds))
+
+    def Histogram(self, url:str, phase:LatencyPhase) -> Optional[LatencyHistogram]:
+        """Get the histogram of one phase for the host of a URL.
+
+        :param url: A full URL, including scheme.
+        :type url: str
+        :param phase: The phase whose histogram to get.
+        :type phase: LatencyPhase
+        :return: The histogram, or None if nothing has been recorded for the host.
+        :rtype: Optional[LatencyHistogram]
+        """
+        with self._lock:
+            latencies = self._hosts.get(SessionPool.HostKey(url))
+        return latencies.phases[phase] if latencies is not None else None
+
+    def Dump(self) -> str:
+        """Format every host's timings as a human-readable table, for logging.
+
+        :return: One block per host, with a line per phase that has samples.
+        :rtype: str
+        """
+        lines : List[str] = []
+        with self._lock:
+            hosts = list(self._hosts.items())
+        for host, latencies in hosts:
+            lines.append(f"{host}: {latencies.requests} requests, {latencies.retries} retries,"
+                         f" {latencies.request_wire_bytes}B sent ({latencies.request_bytes}B uncompressed),"
+                         f" {latencies.response_wire_bytes}B received ({latencies.response_bytes}B uncompressed)")
+            for phase, histogram in latencies.phases.items():
+                if histogram.Count > 0:
+                    lines.append(f"    {str(phase):<10} n={histogram.Count:<6} mean={histogram.Mean * 1000:8.2f}ms"
+                                 f" p50={histogram.Percentile(50) * 1000:8.2f}ms p90={histogram.Percentile(90) * 1000:8.2f}ms"
+                                 f" p99={histogram.Percentile(99) * 1000:8.2f}ms max={histogram.Max * 1000:8.2f}ms")
+        return "\n".join(lines)
+
+    def Reset(self, url:Optional[str]=None):
+        """Clear the recorded timings for the host of a URL, or for every host.
+
+        :param url: A full URL, including scheme, whose host should be reset. Defaults to None, in which case every host is reset.
+        :type url: str, optional
+        """
+        with self._lock:
+            if url is None:
+                self._hosts.clear()
+            else:
+                self._hosts.pop(SessionPool.HostKey(url), None)
@@ -0,0 +1,157 @@
+"""
+Paginator
+
+Contains a class for splitting large results from APIResponse-based resources into pages, requested with cursor and limit parameters.
+"""
+
+# import standard libraries
+import base64
+import binascii
+from typing import Any, Callable, Final, List, Mapping, Optional, Sequence, Tuple
+
+# import 3rd-party libraries
+from flask import request
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.utils.JSONSerializer import JSONSerializer
+
+class Paginator:
+    """Helper for resources to return a large result a page at a time.
+
+    Each page's APIResponse has a `val` of `{"items" : [...]}`.
+    If there are more items after the page, it has a `PARTIAL` status and a `next` cursor in the envelope, which the client sends back to get the next page.
+    The last page has an `OK` status and no cursor. `APIRequest.IterPages` follows the cursors on the client side.
+
+    Cursors are opaque to clients: each is any JSON-serializable state, such as an offset or the key of the last item, encoded as URL-safe base64.
+    A request with a malformed cursor or limit gets a `BAD_REQUEST` response.
+    """
+    _DEFAULT_LIMIT     : Final[int] = 1000
+    _DEFAULT_MAX_LIMIT : Final[int] = 10000
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, default_limit:int=_DEFAULT_LIMIT, max_limit:int=_DEFAULT_MAX_LIMIT, cursor_param:str="cursor", limit_param:str="limit"):
+        """Constructor for a Paginator.
+
+        :param default_limit: The number of items in a page when the request does not give a limit. Defaults to 1000
+        :type default_limit: int, optional
+        :param max_limit: The largest number of items a request may ask for in one page; larger limits are reduced to this. Defaults to 10000
+        :type max_limit: int, optional
+        :param cursor_param: The name of the request parameter with the cursor. Defaults to "cursor"
+        :type cursor_param: str, optional
+        :param limit_param: The name of the request parameter with the page size. Defaults to "limit"
+        :type limit_param: str, optional
+        """
+        self._max_limit     : int = max(1, max_limit)
+        self._default_limit : int = min(max(1, default_limit), self._max_limit)
+        self._cursor_param  : str = cursor_param
+        self._limit_param   : str = limit_param
+
+    def __str__(self) -> str:
+        return f"Paginator: {self._default_limit} items per page, up to {self._max_limit}"
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def EncodeCursor(state:Any) -> str:
+        """Encode a cursor state as an opaque cursor string.
+
+        :param state: The state to resume from, which must be JSON-serializable.
+        :type state: Any
+        :return: The cursor, which is safe to use in a URL.
+        :rtype: str
+        """
+        return base64.urlsafe_b64encode(JSONSerializer.Default().Dumps(state)).rstrip(b"=").decode("ascii")
+
+    @staticmethod
+    def DecodeCursor(cursor:str) -> Any:
+        """Decode a cursor string back into its cursor state.
+
+        :param cursor: The cursor, as made by `EncodeCursor`.
+        :type cursor: str
+        :raises ValueError: If the cursor is malformed.
+        :return: The state to resume from.
+        :rtype: Any
+        """
+        try:
+            return JSONSerializer.Default().Loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        except (binascii.Error, ValueError) as err:
+            raise ValueError(f"Malformed cursor {cursor[:20]}") from err
+
+    # *** PUBLIC METHODS ***
+
+    def Page(self, req_type:RESTType, fetch:Callable[[Optional[Any], int], Tuple[List[Any], Optional[Any]]], msg:str,
+             args:Optional[Mapping[str, str]]=None) -> APIResponse:
+        """Get one page of a result, according to the cursor and limit parameters of a request.
+
+        :param req_type: The type of the request being answered.
+        :type req_type: RESTType
+        :param fetch: A function taking the decoded cursor state, or None for the first page, and the page size,
+            that returns the items in the page, and the cursor state to resume from, or None if the page is the last one.
+            It should raise a `ValueError` for a cursor state it can't resume from.
+        :type fetch: Callable[[Optional[Any], int], Tuple[List[Any], Optional[Any]]]
+        :param msg: The message for the response.
+        :type msg: str
+        :param args: The request parameters. Defaults to None, in which case the arguments of the current Flask request are used.
+        :type args: Optional[Mapping[str, str]], optional
+        :return: The page, with a `PARTIAL` status and a next cursor if there are more items, or an `OK` status if not.
+        :rtype: APIResponse
+        """
+        ret_val : APIResponse
+
+        args = args if args is not None else request.args
+        try:
+            raw_cursor = args.get(self._cursor_param)
+            state      = Paginator.DecodeCursor(raw_cursor) if raw_cursor else None
+            items, next_state = fetch(state, self._parseLimit(args.get(self._limit_param)))
+        except ValueError as err:
+            ret_val = APIResponse(req_type=req_type, val=None, msg="", status=ResponseStatus.BAD_REQUEST)
+            ret_val.RequestErrored(f"Invalid pagination parameters, {err}")
+        else:
+            ret_val = APIResponse(req_type=req_type, val={"items" : items}, msg=msg,
+                                  status=ResponseStatus.PARTIAL if next_state is not None else ResponseStatus.OK,
+                                  next_cursor=Paginator.EncodeCursor(next_state) if next_state is not None else None)
+        return ret_val
+
+    def PageSequence(self, req_type:RESTType, items:Sequence[Any], msg:str, args:Optional[Mapping[str, str]]=None) -> APIResponse:
+        """Get one page of a sequence, using offsets into the sequence as cursor states.
+
+        Only the page is copied out of the sequence, so a lazily-loaded sequence is only read a page at a time.
+
+        :param req_type: The type of the request being answered.
+        :type req_type: RESTType
+        :param items: The full sequence to page through.
+        :type items: Sequence[Any]
+        :param msg: The message for the response.
+        :type msg: str
+        :param args: The request parameters. Defaults to None, in which case the arguments of the current Flask request are used.
+        :type args: Optional[Mapping[str, str]], optional
+        :return: The page, as in `Page`.
+        :rtype: APIResponse
+        """
+        def _fetch(offset:Optional[Any], limit:int) -> Tuple[List[Any], Optional[int]]:
+            offset = offset if offset is not None else 0
+            if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+                raise ValueError("cursor did not hold a valid offset")
+            end = offset + limit
+            return list(items[offset:end]), end if end < len(items) else None
+
+        return self.Page(req_type=req_type, fetch=_fetch, msg=msg, args=args)
+
+    # *** PRIVATE METHODS ***
+
+    def _parseLimit(self, raw_limit:Optional[str]) -> int:
+        if raw_limit is None or raw_limit == "":
+            return self._default_limit
+        try:
+            limit = int(raw_limit)
+        except ValueError as err:
+            raise ValueError(f"limit {raw_limit} is not a number") from err
+        if limit < 1:
+            raise ValueError(f"limit {limit} is less than 1")
+        return min(limit, self._max_limit)
@@ -0,0 +1,207 @@
+"""
+RateLimiter
+
+Contains a class for limiting the rate of APIRequests to each remote host with a token bucket,
+so that batch jobs are smoothed to an upstream server's capacity instead of bursting into `TOO_MANY_REQUESTS` responses.
+"""
+
+# import standard libraries
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Final, Optional, Tuple
+
+# import 3rd-party libraries
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.utils.SessionPool import SessionPool
+
+class _HostBucket:
+    """Token bucket for a single host.
+    """
+    def __init__(self, rate:float, burst:int):
+        self.rate       : float = rate
+        self.burst      : int   = burst
+        self.tokens     : float = float(burst)
+        self.updated_at : float = time.monotonic()
+
+class RateLimiter:
+    """Per-host token-bucket rate limiter for APIRequests.
+
+    Each host (scheme + network location) gets a bucket holding up to `burst` tokens, which refills at `rate` tokens per second.
+    Every request to the host takes a token, waiting for one to refill if the bucket is empty.
+    Waiting callers are served in the order they arrived, since each one reserves its token before it starts waiting.
+    Individual hosts can be given their own rate and burst with `SetLimit`.
+
+    The limiter is safe to share across threads, and `AcquireAsync` waits without blocking the event loop.
+    A single process-wide limiter is available from `RateLimiter.Default()`.
+    """
+    _DEFAULT_RATE  : Final[float] = 10.0
+    _DEFAULT_BURST : Final[int]   = 10
+
+    _default      : Optional["RateLimiter"] = None
+    _default_lock : threading.Lock          = threading.Lock()
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, rate:float=_DEFAULT_RATE, burst:int=_DEFAULT_BURST):
+        """Constructor for a RateLimiter.
+
+        :param rate: The number of requests per second allowed to each host, on average. Defaults to 10.0
+        :type rate: float, optional
+        :param burst: The number of requests that may be sent to a host at once, after it has been idle. Defaults to 10
+        :type burst: int, optional
+        """
+        self._rate    : float                        = max(0.001, rate)
+        self._burst   : int                          = max(1, burst)
+        self._limits  : Dict[str, Tuple[float, int]] = {}
+        self._buckets : Dict[str, _HostBucket]       = {}
+        self._lock    : threading.Lock               = threading.Lock()
+        self._waited  : float                        = 0.0
+        self._granted : int                          = 0
+
+    def __str__(self) -> str:
+        return f"RateLimiter: {self._rate} requests/s per host, burst of {self._burst}"
+
+    @property
+    def Rate(self) -> float:
+        return self._rate
+
+    @property
+    def Burst(self) -> int:
+        return self._burst
+
+    @property
+    def AsDict(self) -> Dict[str, Any]:
+        """Property for a monitoring-friendly summary of the limiter.
+
+        :return: The number of requests let through, the total seconds callers spent waiting, and the tokens left for each host.
+        :rtype: Dict[str, Any]
+        """
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "granted" : self._granted,
+                "waited"  : self._waited,
+                "tokens"  : {host : self._refill(bucket, now=now) for host, bucket in self._buckets.items()}
+            }
+
+    # *** PUBLIC STATICS ***
+
+    @classmethod
+    def Default(cls) -> "RateLimiter":
+        """Get the shared, process-wide RateLimiter, creating it on first use.
+
+        :return: The shared RateLimiter instance.
+        :rtype: RateLimiter
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = RateLimiter()
+        return cls._default
+
+    @classmethod
+    def Configure(cls, rate:float=_DEFAULT_RATE, burst:int=_DEFAULT_BURST) -> "RateLimiter":
+        """Replace the shared, process-wide RateLimiter with one using the given settings.
+
+        :return: The new shared RateLimiter instance.
+        :rtype: RateLimiter
+        """
+        with cls._default_lock:
+            cls._default = RateLimiter(rate=rate, burst=burst)
+        return cls._default
+
+    # *** PUBLIC METHODS ***
+
+    def SetLimit(self, url:str, rate:float, burst:int):
+        """Give the host of a URL its own rate and burst, instead of the limiter's defaults.
+
+        :param url: A full URL, including scheme.
+        :type url: str
+        :param rate: The number of requests per second allowed to the host, on average.
+        :type rate: float
+        :param burst: The number of requests that may be sent to the host at once, after it has been idle.
+        :type burst: int
+        """
+        key = SessionPool.HostKey(url)
+        with self._lock:
+            self._limits[key] = (max(0.001, rate), max(1, burst))
+            self._buckets.pop(key, None)
+
+    def TryAcquire(self, url:str) -> bool:
+        """Take a token for the host of a URL, only if one is available right away.
+
+        :param url: A full URL, including scheme.
+        :type url: str
+        :return: True if a token was taken, otherwise False.
+        :rtype: bool
+        """
+        return self._reserve(url, max_wait=0.0) is not None
+
+    def Acquire(self, url:str, timeout:Optional[float]=None) -> bool:
+        """Take a token for the host of a URL, blocking until one is available.
+
+        :param url: A full URL, including scheme.
+        :type url: str
+        :param timeout: The longest time, in seconds, to wait for a token. Defaults to None, in which case there is no limit.
+        :type timeout: float, optional
+        :return: True if a token was taken, or False if none would be available within the timeout.
+        :rtype: bool
+        """
+        wait = self._reserve(url, max_wait=timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def AcquireAsync(self, url:str, timeout:Optional[float]=None) -> bool:
+        """Awaitable counterpart to `Acquire`, which waits for a token without blocking the event loop.
+
+        :param url: A full URL, including scheme.
+        :type url: str
+        :param timeout: The longest time, in seconds, to wait for a token. Defaults to None, in which case there is no limit.
+        :type timeout: float, optional
+        :return: True if a token was taken, or False if none would be available within the timeout.
+        :rtype: bool
+        """
+        wait = self._reserve(url, max_wait=timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    # *** PRIVATE METHODS ***
+
+    def _reserve(self, url:str, max_wait:Optional[float]) -> Optional[float]:
+        """Reserve a token for the host of a URL, letting the bucket go into debt so that later callers queue up behind this one.
+
+        :return: The number of seconds to wait before using the token, or None if that would be longer than `max_wait`, in which case nothing is reserved.
+        """
+        key = SessionPool.HostKey(url)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate, burst = self._limits.get(key, (self._rate, self._burst))
+                bucket = _HostBucket(rate=rate, burst=burst)
+                self._buckets[key] = bucket
+            tokens = self._refill(bucket, now=time.monotonic())
+            wait   = max(0.0, (1.0 - tokens) / bucket.rate)
+            if max_wait is not None and wait > max_wait:
+                return None
+            bucket.tokens  = tokens - 1.0
+            self._granted += 1
+            self._waited  += wait
+            return wait
+
+    @staticmethod
+    def _refill(bucket:_HostBucket, now:float) -> float:
+        """Add the tokens earned since the bucket was last updated. Must be called while holding `self._lock`.
+        """
+        bucket.tokens     = min(float(bucket.burst), bucket.tokens + (now - bucket.updated_at) * bucket.rate)
+        bucket.updated_at = now
+        return bucket.tokens
@@ -0,0 +1,106 @@
+"""
+RecordingTransport
+
+Contains a transport that sends requests through another transport, and records each response it gets,
+so that a session against a real server can be saved and later replayed offline with a ReplayTransport.
+"""
+
+# import standard libraries
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Mapping, Optional, Tuple
+
+# import 3rd-party libraries
+import requests
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.models.RecordedExchange import RecordedExchange
+from ogd.apis.models.RequestTimings import RequestTimings
+from ogd.apis.utils.SessionPool import SessionPool
+from ogd.apis.utils.Transport import Transport
+
+class RecordingTransport(Transport):
+    """Transport that passes requests on to another transport, recording every response as a RecordedExchange.
+
+    Each response body is read in full as it is recorded, so recording a streamed request buffers its body.
+    Requests that time out or fail without a response are not recorded.
+    Recordings can be saved to a JSON-lines file with `Save`, and loaded back with `ReplayTransport.FromFile`.
+    """
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, inner:Optional[Transport]=None):
+        """Constructor for a RecordingTransport.
+
+        :param inner: The transport that actually sends the requests. Defaults to None, in which case the shared `SessionPool.Default()` is used.
+        :type inner: Transport, optional
+        """
+        self._inner     : Transport              = inner if inner is not None else SessionPool.Default()
+        self._exchanges : List[RecordedExchange] = []
+        self._lock      : threading.Lock         = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._exchanges)
+
+    def __str__(self) -> str:
+        return f"RecordingTransport: {len(self._exchanges)} exchanges recorded through {self._inner}"
+
+    @property
+    def Exchanges(self) -> List[RecordedExchange]:
+        """Property for the exchanges recorded so far, in the order their responses arrived.
+
+        :return: The recorded exchanges.
+        :rtype: List[RecordedExchange]
+        """
+        with self._lock:
+            return list(self._exchanges)
+
+    # *** PUBLIC METHODS ***
+
+    def Request(self, method:str, url:str, timings:Optional[RequestTimings]=None, **kwargs:Any) -> requests.Response:
+        start    = time.perf_counter()
+        response = self._inner.Request(method, url, timings=timings, **kwargs)
+        content  = response.content
+        self._record(RecordedExchange(method=method, url=url, params=RecordedExchange.ParamPairs(kwargs.get("params")),
+                                      status=response.status_code, headers=response.headers, body=content,
+                                      elapsed=time.perf_counter() - start))
+        return response
+
+    async def RequestAsync(self, method:str, url:str, params:List[Tuple[str, str]], headers:Mapping[str, str], data:Optional[Any],
+                           timeout:float, timings:RequestTimings) -> Tuple[int, Mapping[str, str], bytes]:
+        start = time.perf_counter()
+        status, response_headers, content = await self._inner.RequestAsync(method, url, params=params, headers=headers, data=data,
+                                                                           timeout=timeout, timings=timings)
+        self._record(RecordedExchange(method=method, url=url, params=params, status=status, headers=response_headers, body=content,
+                                      elapsed=time.perf_counter() - start))
+        return status, response_headers, content
+
+    def Save(self, path:Path | str):
+        """Write the recorded exchanges to a JSON-lines file, one exchange per line.
+
+        :param path: The file to write.
+        :type path: Path | str
+        """
+        with open(path, "w", encoding="utf-8") as out:
+            for exchange in self.Exchanges:
+                out.write(json.dumps(exchange.AsDict) + "\n")
+
+    def Clear(self):
+        with self._lock:
+            self._exchanges.clear()
+
+    def Close(self):
+        self._inner.Close()
+
+    async def CloseAsync(self):
+        await self._inner.CloseAsync()
+
+    # *** PRIVATE METHODS ***
+
+    def _record(self, exchange:RecordedExchange):
+        with self._lock:
+            self._exchanges.append(exchange)
@@ -0,0 +1,154 @@
+"""
+ReplayTransport
+
+Contains a transport that answers requests from recorded exchanges instead of the network,
+so that APIRequests can be tested and benchmarked reproducibly without a live server.
+"""
+
+# import standard libraries
+import asyncio
+import io
+import json
+import threading
+import time
+from collections import deque
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# import 3rd-party libraries
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3 import HTTPResponse
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.models.RecordedExchange import RecordedExchange
+from ogd.apis.models.RequestTimings import RequestTimings
+from ogd.apis.utils.Transport import Transport
+
+class ReplayTransport(Transport):
+    """Transport that answers each request with a recorded response to a request with the same method, URL and params.
+
+    When several exchanges were recorded for the same request, they are replayed in order, and the last one is reused once the rest run out.
+    A request with no matching recording raises a `LookupError`, which APIRequest reports as an `INTERNAL_ERR` response.
+
+    With `replay_latency`, each response is delayed by as long as it originally took,
+    and a response that took longer than the request's timeout raises a timeout instead, as the real request would have.
+    """
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, exchanges:Iterable[RecordedExchange], replay_latency:bool=False):
+        """Constructor for a ReplayTransport.
+
+        :param exchanges: The recorded exchanges to answer requests with.
+        :type exchanges: Iterable[RecordedExchange]
+        :param replay_latency: Whether to delay each response by as long as it originally took. Defaults to False
+        :type replay_latency: bool, optional
+        """
+        self._replay_latency : bool                               = replay_latency
+        self._exchanges      : Dict[str, Deque[RecordedExchange]] = {}
+        self._lock           : threading.Lock                     = threading.Lock()
+        self._replayed       : int                                = 0
+        self._misses         : int                                = 0
+        for exchange in exchanges:
+            self._exchanges.setdefault(exchange.Key, deque()).append(exchange)
+
+    def __str__(self) -> str:
+        return f"ReplayTransport: {len(self._exchanges)} recorded requests, {self._replayed} replayed, {self._misses} misses"
+
+    @property
+    def Replayed(self) -> int:
+        return self._replayed
+
+    @property
+    def Misses(self) -> int:
+        """Property for the number of requests that had no matching recording.
+
+        :return: The number of unmatched requests.
+        :rtype: int
+        """
+        return self._misses
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def FromFile(path:Path | str, replay_latency:bool=False) -> "ReplayTransport":
+        """Create a ReplayTransport from a JSON-lines file written by `RecordingTransport.Save`.
+
+        :param path: The file to read.
+        :type path: Path | str
+        :param replay_latency: Whether to delay each response by as long as it originally took. Defaults to False
+        :type replay_latency: bool, optional
+        :return: A transport that replays the recorded exchanges.
+        :rtype: ReplayTransport
+        """
+        with open(path, "r", encoding="utf-8") as recording:
+            exchanges = [RecordedExchange.FromDict(json.loads(line)) for line in recording if line.strip()]
+        return ReplayTransport(exchanges=exchanges, replay_latency=replay_latency)
+
+    # *** PUBLIC METHODS ***
+
+    def Request(self, method:str, url:str, timings:Optional[RequestTimings]=None, **kwargs:Any) -> requests.Response:
+        exchange = self._next(RecordedExchange.MakeKey(method=method, url=url, params=kwargs.get("params")))
+        delay    = self._delay(exchange, timeout=kwargs.get("timeout"))
+        if delay is not None:
+            time.sleep(delay)
+            raise requests.exceptions.ReadTimeout(f"Replayed response to {method} {url} took longer than {delay}s")
+        if self._replay_latency:
+            time.sleep(exchange.Elapsed)
+        return ReplayTransport._toResponse(exchange, url=url)
+
+    async def RequestAsync(self, method:str, url:str, params:List[Tuple[str, str]], headers:Mapping[str, str], data:Optional[Any],
+                           timeout:float, timings:RequestTimings) -> Tuple[int, Mapping[str, str], bytes]:
+        exchange = self._next(RecordedExchange.MakeKey(method=method, url=url, params=params))
+        delay    = self._delay(exchange, timeout=timeout)
+        if delay is not None:
+            await asyncio.sleep(delay)
+            raise asyncio.TimeoutError()
+        if self._replay_latency:
+            await asyncio.sleep(exchange.Elapsed)
+        timings.ResponseBytes     = len(exchange.Body)
+        timings.ResponseWireBytes = len(exchange.Body)
+        return exchange.Status, exchange.Headers, exchange.Body
+
+    # *** PRIVATE METHODS ***
+
+    def _next(self, key:str) -> RecordedExchange:
+        with self._lock:
+            queued = self._exchanges.get(key)
+            if not queued:
+                self._misses += 1
+                raise LookupError(f"No recorded response for {key}")
+            self._replayed += 1
+            return queued.popleft() if len(queued) > 1 else queued[0]
+
+    def _delay(self, exchange:RecordedExchange, timeout:Optional[Any]) -> Optional[float]:
+        """Get how long to wait before timing out, if the exchange is replaying latency and originally took longer than the timeout.
+        """
+        if self._replay_latency and isinstance(timeout, (int, float)) and exchange.Elapsed > timeout:
+            return float(timeout)
+        return None
+
+    @staticmethod
+    def _toResponse(exchange:RecordedExchange, url:str) -> requests.Response:
+        headers = CaseInsensitiveDict({**exchange.Headers, "Content-Length" : str(len(exchange.Body))})
+        ret_val = requests.Response()
+        ret_val.status_code = exchange.Status
+        ret_val.headers     = headers
+        ret_val.url         = url
+        ret_val.reason      = ReplayTransport._reason(exchange.Status)
+        ret_val.encoding    = get_encoding_from_headers(headers)
+        ret_val.raw         = HTTPResponse(body=io.BytesIO(exchange.Body), headers=dict(headers), status=exchange.Status,
+                                           preload_content=False, decode_content=False)
+        return ret_val
+
+    @staticmethod
+    def _reason(status:int) -> str:
+        try:
+            return HTTPStatus(status).phrase
+        except ValueError:
+            return ""
@@ -0,0 +1,169 @@
+"""
+RequestCoalescer
+
+Contains a class for coalescing identical, concurrent requests into a single upstream call ("single-flight"),
+so that a burst of the same GET from many threads or tasks only reaches the remote server once.
+"""
+
+# import standard libraries
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+# import 3rd-party libraries
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.models.APIResponse import APIResponse
+
+class _InFlightCall:
+    """Bookkeeping for a call that other threads may be waiting on.
+    """
+    def __init__(self):
+        self.done   : threading.Event         = threading.Event()
+        self.result : Optional[APIResponse]   = None
+        self.error  : Optional[BaseException] = None
+
+class RequestCoalescer:
+    """Single-flight coalescer for identical, concurrent APIRequests.
+
+    The first caller for a given key (the "leader") makes the upstream call, while any callers that arrive with the same key
+    before it finishes wait for, and share, its result. The response is decoded before it is shared,
+    and every caller, the leader included, gets its own copy of it, so any caller can change its response without affecting the others.
+
+    Threaded callers use `Do`, and asyncio callers use `DoAsync`. Async calls are only coalesced with other calls on the same event loop.
+
+    A single process-wide coalescer is available from `RequestCoalescer.Default()`.
+    """
+    _default      : Optional["RequestCoalescer"] = None
+    _default_lock : threading.Lock               = threading.Lock()
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self):
+        self._calls       : Dict[str, _InFlightCall]                                  = {}
+        self._async_calls : Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Task] = {}
+        self._lock        : threading.Lock                                            = threading.Lock()
+        self._leaders     : int                                                       = 0
+        self._coalesced   : int                                                       = 0
+
+    def __str__(self) -> str:
+        return f"RequestCoalescer: {self._leaders} upstream calls, {self._coalesced} coalesced"
+
+    @property
+    def Leaders(self) -> int:
+        """Property for the number of calls that went upstream.
+
+        :return: The number of calls that went upstream.
+        :rtype: int
+        """
+        return self._leaders
+
+    @property
+    def Coalesced(self) -> int:
+        """Property for the number of calls that shared the result of an identical call already in flight.
+
+        :return: The number of coalesced calls.
+        :rtype: int
+        """
+        return self._coalesced
+
+    @property
+    def InFlight(self) -> int:
+        with self._lock:
+            return len(self._calls) + len(self._async_calls)
+
+    # *** PUBLIC STATICS ***
+
+    @classmethod
+    def Default(cls) -> "RequestCoalescer":
+        """Get the shared, process-wide RequestCoalescer, creating it on first use.
+
+        :return: The shared RequestCoalescer instance.
+        :rtype: RequestCoalescer
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = RequestCoalescer()
+        return cls._default
+
+    # *** PUBLIC METHODS ***
+
+    def Do(self, key:str, call:Callable[[], APIResponse]) -> APIResponse:
+        """Run `call`, unless an identical call is already in flight, in which case wait for and share its result.
+
+        If the leader's call raises an exception, the same exception is raised to every waiter.
+
+        :param key: The key identifying identical calls.
+        :type key: str
+        :param call: The function making the upstream call.
+        :type call: Callable[[], APIResponse]
+        :return: The response from the upstream call, or a copy of it for a waiter.
+        :rtype: APIResponse
+        """
+        with self._lock:
+            in_flight = self._calls.get(key)
+            is_leader = in_flight is None
+            if in_flight is None:
+                in_flight = _InFlightCall()
+                self._calls[key] = in_flight
+                self._leaders += 1
+            else:
+                self._coalesced += 1
+
+        if is_leader:
+            try:
+                ret_val = call()
+                # Share a decoded copy, so waiters never copy the leader's response while the leader is decoding or changing it.
+                in_flight.result = ret_val.Copy()
+            except BaseException as err:
+                in_flight.error = err
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                in_flight.done.set()
+            return ret_val
+
+        in_flight.done.wait()
+        if in_flight.error is not None:
+            raise in_flight.error
+        return in_flight.result.Copy() # type: ignore[union-attr]
+
+    async def DoAsync(self, key:str, call:Callable[[], Awaitable[APIResponse]]) -> APIResponse:
+        """Await `call`, unless an identical call is already in flight on this event loop, in which case await and share its result.
+
+        The upstream call runs as its own task, so cancelling one waiter (including the one that started it) does not cancel the others.
+
+        :param key: The key identifying identical calls.
+        :type key: str
+        :param call: The coroutine function making the upstream call.
+        :type call: Callable[[], Awaitable[APIResponse]]
+        :return: A copy of the response from the upstream call.
+        :rtype: APIResponse
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._async_calls.get((loop, key))
+            if task is None:
+                task = loop.create_task(self._runAsync(call))
+                task.add_done_callback(lambda _: self._finishAsync(loop, key))
+                self._async_calls[(loop, key)] = task
+                self._leaders += 1
+            else:
+                self._coalesced += 1
+
+        result = await asyncio.shield(task)
+        return result.Copy()
+
+    # *** PRIVATE METHODS ***
+
+    @staticmethod
+    async def _runAsync(call:Callable[[], Awaitable[APIResponse]]) -> APIResponse:
+        return await call()
+
+    def _finishAsync(self, loop:asyncio.AbstractEventLoop, key:str):
+        with self._lock:
+            self._async_calls.pop((loop, key), None)
@@ -0,0 +1,211 @@
+"""
+ResponseCache
+
+Contains a class for caching the decoded APIResponses of GET requests in memory,
+with a time-to-live, least-recently-used eviction, and revalidation through `ETag`/`Last-Modified` headers.
+"""
+
+# import standard libraries
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Final, Iterable, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+# import 3rd-party libraries
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.APIResponse import APIResponse
+
+class _CacheEntry:
+    """A cached response, along with the validators needed to revalidate it once it expires.
+    """
+    def __init__(self, response:APIResponse, etag:Optional[str], last_modified:Optional[str], expires_at:float):
+        self.response      : APIResponse   = response
+        self.etag          : Optional[str] = etag
+        self.last_modified : Optional[str] = last_modified
+        self.expires_at    : float         = expires_at
+
+class ResponseCache:
+    """In-memory cache of APIResponses to GET requests, keyed on URL and request params.
+
+    Entries are fresh for `ttl` seconds after they are stored, during which the cached response is returned without contacting the server.
+    Once an entry goes stale, the next request for it is sent with `If-None-Match`/`If-Modified-Since` headers,
+    and a `NOT_MODIFIED` reply counts as a cache hit, returning the cached response and refreshing its TTL.
+    When the cache holds more than `max_entries` entries, the least-recently-used entry is evicted.
+
+    Only OK responses are stored, and they are decoded once, as they are stored. Each caller gets its own copy of the cached APIResponse,
+    so changing it, including its `Value`, does not affect the cache or other callers.
+    """
+    _DEFAULT_TTL         : Final[float] = 60.0
+    _DEFAULT_MAX_ENTRIES : Final[int]   = 256
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, ttl:float=_DEFAULT_TTL, max_entries:int=_DEFAULT_MAX_ENTRIES):
+        """Constructor for a ResponseCache.
+
+        :param ttl: The number of seconds a stored response is used without revalidating it. Defaults to 60.0
+        :type ttl: float, optional
+        :param max_entries: The maximum number of responses to keep before evicting the least-recently-used. Defaults to 256
+        :type max_entries: int, optional
+        """
+        self._ttl           : float                         = ttl
+        self._max_entries   : int                           = max(1, max_entries)
+        self._entries       : OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock          : threading.Lock                = threading.Lock()
+        self._hits          : int                           = 0
+        self._misses        : int                           = 0
+        self._revalidations : int                           = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __str__(self) -> str:
+        return f"ResponseCache: {len(self._entries)}/{self._max_entries} entries, {self._hits} hits, {self._misses} misses"
+
+    @property
+    def Hits(self) -> int:
+        """Property for the number of requests answered from the cache, including those revalidated with the server.
+
+        :return: The number of cache hits.
+        :rtype: int
+        """
+        return self._hits
+
+    @property
+    def Misses(self) -> int:
+        """Property for the number of requests that needed a full response from the server.
+
+        :return: The number of cache misses.
+        :rtype: int
+        """
+        return self._misses
+
+    @property
+    def Revalidations(self) -> int:
+        """Property for the number of cache hits that came from a `NOT_MODIFIED` reply to a revalidation request.
+
+        :return: The number of successful revalidations.
+        :rtype: int
+        """
+        return self._revalidations
+
+    @property
+    def HitRate(self) -> float:
+        total = self._hits + self._misses
+        return self._hits / total if total > 0 else 0.0
+
+    @property
+    def AsDict(self) -> Dict[str, Any]:
+        return {
+            "entries"       : len(self._entries),
+            "hits"          : self._hits,
+            "misses"        : self._misses,
+            "revalidations" : self._revalidations,
+            "hit_rate"      : self.HitRate
+        }
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def Key(url:str, params:Iterable[Tuple[str, str]]) -> str:
+        """Get the cache key for a request, with params sorted so that their order does not matter.
+
+        :param url: The full URL of the request.
+        :type url: str
+        :param params: The request params, as key/value string pairs.
+        :type params: Iterable[Tuple[str, str]]
+        :return: The cache key for the request.
+        :rtype: str
+        """
+        query = urlencode(sorted(params))
+        return f"{url}?{query}" if query else url
+
+    # *** PUBLIC METHODS ***
+
+    def Get(self, key:str) -> Optional[APIResponse]:
+        """Get a fresh cached response, counting a hit if there is one.
+
+        :param key: The cache key of the request, from `ResponseCache.Key`.
+        :type key: str
+        :return: A copy of the cached response, or None if there is no fresh entry.
+        :rtype: Optional[APIResponse]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        # Stored responses are already decoded and never changed, so they can be copied outside the lock.
+        return entry.response.Copy()
+
+    def Validators(self, key:str) -> Dict[str, str]:
+        """Get the conditional request headers for revalidating a stale entry.
+
+        :param key: The cache key of the request, from `ResponseCache.Key`.
+        :type key: str
+        :return: The `If-None-Match` and/or `If-Modified-Since` headers for the entry, or an empty mapping if there is no entry to revalidate.
+        :rtype: Dict[str, str]
+        """
+        ret_val : Dict[str, str] = {}
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.etag:
+                    ret_val["If-None-Match"] = entry.etag
+                if entry.last_modified:
+                    ret_val["If-Modified-Since"] = entry.last_modified
+        return ret_val
+
+    def Resolve(self, key:str, response:APIResponse, headers:Mapping[str, str]) -> APIResponse:
+        """Update the cache with a response from the server, and get the response the caller should see.
+
+        A `NOT_MODIFIED` response refreshes the cached entry and returns a copy of it, counting as a hit.
+        Any other response counts as a miss, and is stored if it is OK.
+
+        :param key: The cache key of the request, from `ResponseCache.Key`.
+        :type key: str
+        :param response: The response decoded from the server's reply.
+        :type response: APIResponse
+        :param headers: The headers of the server's reply.
+        :type headers: Mapping[str, str]
+        :return: The response to return to the caller.
+        :rtype: APIResponse
+        """
+        # Decode the response, and store a copy of it, before taking the lock, so hits never have to decode or wait on decoding.
+        stored = response.Copy() if response.OK else None
+        with self._lock:
+            entry = self._entries.get(key)
+            if response.Status == ResponseStatus.NOT_MODIFIED and entry is not None:
+                entry.expires_at = time.monotonic() + self._ttl
+                self._entries.move_to_end(key)
+                self._hits          += 1
+                self._revalidations += 1
+            else:
+                entry = None
+                self._misses += 1
+                if stored is not None:
+                    self._entries[key] = _CacheEntry(response=stored, etag=headers.get("ETag"),
+                                                     last_modified=headers.get("Last-Modified"), expires_at=time.monotonic() + self._ttl)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self._max_entries:
+                        self._entries.popitem(last=False)
+        return entry.response.Copy() if entry is not None else response
+
+    def Invalidate(self, key:Optional[str]=None):
+        """Remove one entry, or every entry, from the cache.
+
+        :param key: The cache key to remove. Defaults to None, in which case the whole cache is cleared.
+        :type key: str, optional
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
@@ -0,0 +1,199 @@
+"""
+ResponseCodec
+
+Contains a class for encoding and decoding APIResponse envelopes in the formats of the ResponseEncoding enum,
+and for telling them apart by their mimetypes.
+"""
+
+# import standard libraries
+from typing import Any, Dict, Final, List, Optional, Tuple
+
+# import 3rd-party libraries
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.models.enums.ResponseEncoding import ResponseEncoding
+from ogd.apis.utils.JSONSerializer import JSONSerializer
+
+class ResponseCodec:
+    """Utility for encoding and decoding APIResponse envelopes as JSON, MessagePack, or columnar JSON.
+
+    In the columnar layout, a list of records that all have the same keys in the same order, either as the value itself or as a member of a dict value,
+    is replaced by `{"@columns" : {key : [values...]}}`, so each key is sent once rather than once per record.
+    Lists that aren't uniform records are left as they are.
+    So that real data can't be mistaken for columns, keys starting with `@` in the dicts that could hold columns are escaped with another `@`.
+    Decoding undoes both, restoring the value exactly, including the order of each record's keys.
+
+    JSON is always the default, and MessagePack is only used when the `msgpack` package is installed.
+    """
+    _COLUMNS_KEY : Final[str] = "@columns"
+    _ESCAPE      : Final[str] = "@"
+    _MIMETYPES   : Final[Dict[ResponseEncoding, Tuple[str, ...]]] = {
+        ResponseEncoding.JSON     : ("application/json",),
+        ResponseEncoding.MSGPACK  : ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack"),
+        ResponseEncoding.COLUMNAR : ("application/vnd.ogd.columnar+json",),
+    }
+
+    # *** PUBLIC STATICS ***
+
+    @staticmethod
+    def Available(encoding:ResponseEncoding) -> bool:
+        """Check whether an encoding can be used, which for MessagePack means the `msgpack` package is installed.
+
+        :param encoding: The encoding to check.
+        :type encoding: ResponseEncoding
+        :return: True if the encoding can be used, otherwise False.
+        :rtype: bool
+        """
+        return encoding != ResponseEncoding.MSGPACK or msgpack is not None
+
+    @staticmethod
+    def MimeType(encoding:ResponseEncoding) -> str:
+        """Get the mimetype to send a response in the given encoding with.
+
+        :param encoding: The encoding of the response.
+        :type encoding: ResponseEncoding
+        :return: The mimetype for the encoding.
+        :rtype: str
+        """
+        return ResponseCodec._MIMETYPES[encoding][0]
+
+    @staticmethod
+    def MimeTypes(encoding:ResponseEncoding) -> Tuple[str, ...]:
+        """Get every mimetype a response in the given encoding may be requested or sent with, starting with the one from `MimeType`.
+
+        :param encoding: The encoding of the response.
+        :type encoding: ResponseEncoding
+        :return: The mimetypes for the encoding.
+        :rtype: Tuple[str, ...]
+        """
+        return ResponseCodec._MIMETYPES[encoding]
+
+    @staticmethod
+    def FromMimeType(content_type:Optional[str]) -> Optional[ResponseEncoding]:
+        """Get the encoding of a response from its `Content-Type` header.
+
+        :param content_type: The `Content-Type` header, which may include parameters such as a charset.
+        :type content_type: Optional[str]
+        :return: The matching encoding, or None if the content type is not one of them.
+        :rtype: Optional[ResponseEncoding]
+        """
+        mimetype = (content_type or "").split(";")[0].strip().lower()
+        for encoding, mimetypes in ResponseCodec._MIMETYPES.items():
+            if mimetype in mimetypes:
+                return encoding
+        return None
+
+    @staticmethod
+    def Encode(envelope:Dict[str, Any], encoding:ResponseEncoding) -> bytes:
+        """Encode a response envelope.
+
+        :param envelope: The envelope, with `type`, `val` and `msg` members.
+        :type envelope: Dict[str, Any]
+        :param encoding: The encoding to use.
+        :type encoding: ResponseEncoding
+        :raises RuntimeError: If MessagePack is requested, but `msgpack` is not installed.
+        :raises TypeError: If the envelope contains a value that can't be encoded.
+        :return: The encoded envelope.
+        :rtype: bytes
+        """
+        match encoding:
+            case ResponseEncoding.MSGPACK:
+                if msgpack is None:
+                    raise RuntimeError("MessagePack encoding was requested, but msgpack is not installed.")
+                return msgpack.packb(envelope, use_bin_type=True)
+            case ResponseEncoding.COLUMNAR:
+                return JSONSerializer.Default().Dumps({**envelope, "val" : ResponseCodec.ToColumns(envelope.get("val"))})
+            case _:
+                return JSONSerializer.Default().Dumps(envelope)
+
+    @staticmethod
+    def Decode(data:bytes, encoding:ResponseEncoding) -> Any:
+        """Decode a response envelope.
+
+        :param data: The encoded envelope.
+        :type data: bytes
+        :param encoding: The encoding the envelope is in.
+        :type encoding: ResponseEncoding
+        :raises ValueError: If the data is not valid in the given encoding, or is MessagePack and `msgpack` is not installed.
+        :return: The decoded envelope, which should be a dict.
+        :rtype: Any
+        """
+        match encoding:
+            case ResponseEncoding.MSGPACK:
+                if msgpack is None:
+                    raise ValueError("Got a MessagePack response, but msgpack is not installed.")
+                try:
+                    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+                except (msgpack.UnpackException, msgpack.ExtraData, TypeError) as err:
+                    raise ValueError(f"Invalid MessagePack response: {err}") from err
+            case ResponseEncoding.COLUMNAR:
+                ret_val = JSONSerializer.Default().Loads(data)
+                if isinstance(ret_val, dict):
+                    ret_val["val"] = ResponseCodec.FromColumns(ret_val.get("val"))
+                return ret_val
+            case _:
+                return JSONSerializer.Default().Loads(data)
+
+    @staticmethod
+    def ToColumns(val:Any) -> Any:
+        """Lay out the lists of uniform records in a value as columns.
+
+        :param val: The value, which is laid out if it is a list of records, or a dict with lists of records as members.
+        :type val: Any
+        :return: The value, with each list of uniform records replaced by its columns.
+        :rtype: Any
+        """
+        if isinstance(val, dict):
+            return {ResponseCodec._escape(key) : ResponseCodec._columnsOf(member) for key, member in val.items()}
+        return ResponseCodec._columnsOf(val)
+
+    @staticmethod
+    def FromColumns(val:Any) -> Any:
+        """Restore the lists of records in a value laid out by `ToColumns`.
+
+        :param val: The columnar value.
+        :type val: Any
+        :return: The value, with each set of columns replaced by its list of records.
+        :rtype: Any
+        """
+        if isinstance(val, dict) and ResponseCodec._COLUMNS_KEY not in val:
+            return {ResponseCodec._unescape(key) : ResponseCodec._recordsOf(member) for key, member in val.items()}
+        return ResponseCodec._recordsOf(val)
+
+    # *** PRIVATE METHODS ***
+
+    @staticmethod
+    def _columnsOf(value:Any) -> Any:
+        if isinstance(value, dict):
+            return {ResponseCodec._escape(key) : member for key, member in value.items()}
+        if not isinstance(value, list) or not value or not isinstance(value[0], dict) or not value[0]:
+            return value
+        keys = tuple(value[0].keys())
+        # Records are only laid out as columns if their keys are in the same order, so each comes back exactly as it was.
+        if not all(isinstance(record, dict) and tuple(record.keys()) == keys for record in value):
+            return value
+        return {ResponseCodec._COLUMNS_KEY : {key : [record[key] for record in value] for key in keys}}
+
+    @staticmethod
+    def _recordsOf(value:Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        if ResponseCodec._COLUMNS_KEY not in value:
+            return {ResponseCodec._unescape(key) : member for key, member in value.items()}
+        columns : Dict[str, List[Any]] = value[ResponseCodec._COLUMNS_KEY]
+        keys = list(columns.keys())
+        return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+    @staticmethod
+    def _escape(key:Any) -> Any:
+        return ResponseCodec._ESCAPE + key if isinstance(key, str) and key.startswith(ResponseCodec._ESCAPE) else key
+
+    @staticmethod
+    def _unescape(key:Any) -> Any:
+        return key[len(ResponseCodec._ESCAPE):] if isinstance(key, str) and key.startswith(ResponseCodec._ESCAPE * 2) else key
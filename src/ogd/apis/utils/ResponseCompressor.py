@@ -0,0 +1,244 @@
+"""
+ResponseCompressor
+
+Contains a class for gzipping Flask responses for clients that accept it, as negotiated by their `Accept-Encoding` header.
+"""
+
+# import standard libraries
+import gzip
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Final, Iterable, Iterator, Optional
+
+# import 3rd-party libraries
+from flask import Response, request
+
+# import OGD libraries
+
+# import local files
+
+class ResponseCompressor:
+    """Compressor that gzips the bodies of Flask responses, for clients whose `Accept-Encoding` allows it.
+
+    Bodies under a minimum size are sent as-is, since gzip's overhead outweighs the savings on them.
+    Streamed responses, such as those from `APIResponse.AsFlaskStream`, are compressed on the fly as their chunks are sent.
+    File responses and responses that already have a `Content-Encoding` are left alone.
+
+    Since a body always compresses to the same bytes, compressed bodies are cached by content, up to a total size,
+    so that responses sent over and over, such as unchanged exports, are only compressed once.
+
+    The process-wide compressor used by `HelloAPI` is available from `ResponseCompressor.Default()`,
+    and can be replaced with `ResponseCompressor.Configure()`, such as from a ServerConfig's compression settings.
+    """
+    _DEFAULT_MIN_SIZE   : Final[int] = 1024
+    _DEFAULT_LEVEL      : Final[int] = 6
+    _DEFAULT_CACHE_SIZE : Final[int] = 16 * 1024 * 1024
+    # Statuses whose responses have no body to compress.
+    _BODILESS_STATUSES  : Final[frozenset[int]] = frozenset({204, 304})
+
+    _default      : Optional["ResponseCompressor"] = None
+    _default_lock : threading.Lock                 = threading.Lock()
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, min_size:int=_DEFAULT_MIN_SIZE, level:int=_DEFAULT_LEVEL, cache_size:int=_DEFAULT_CACHE_SIZE):
+        """Constructor for a ResponseCompressor.
+
+        :param min_size: The size, in bytes, under which bodies are not compressed. Defaults to 1024
+        :type min_size: int, optional
+        :param level: The gzip compression level, from 1 (fastest) to 9 (smallest), or 0 to never compress responses. Defaults to 6
+        :type level: int, optional
+        :param cache_size: The total size, in bytes, of the bodies and compressed bodies to keep cached, or 0 to cache nothing. Defaults to 16MiB
+        :type cache_size: int, optional
+        :raises ValueError: If the level is not between 0 and 9.
+        """
+        if not 0 <= level <= 9:
+            raise ValueError(f"gzip compression level must be between 0 and 9, got {level}")
+        self._min_size    : int                       = max(0, min_size)
+        self._level       : int                       = level
+        self._cache_size  : int                       = max(0, cache_size)
+        self._cache       : OrderedDict[bytes, bytes] = OrderedDict()
+        self._cache_bytes : int                       = 0
+        self._lock        : threading.Lock            = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"ResponseCompressor: gzip level {self._level} over {self._min_size}B, {len(self._cache)} cached"
+
+    @property
+    def MinSize(self) -> int:
+        return self._min_size
+
+    @property
+    def Level(self) -> int:
+        return self._level
+
+    # *** PUBLIC STATICS ***
+
+    @classmethod
+    def Default(cls) -> "ResponseCompressor":
+        """Get the shared, process-wide ResponseCompressor, creating it on first use.
+
+        :return: The shared ResponseCompressor instance.
+        :rtype: ResponseCompressor
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = ResponseCompressor()
+        return cls._default
+
+    @classmethod
+    def Configure(cls, min_size:int=_DEFAULT_MIN_SIZE, level:int=_DEFAULT_LEVEL, cache_size:int=_DEFAULT_CACHE_SIZE) -> "ResponseCompressor":
+        """Replace the shared, process-wide ResponseCompressor with one using the given settings.
+
+        :param min_size: The size, in bytes, under which bodies are not compressed. Defaults to 1024
+        :type min_size: int, optional
+        :param level: The gzip compression level, from 1 (fastest) to 9 (smallest), or 0 to never compress responses. Defaults to 6
+        :type level: int, optional
+        :param cache_size: The total size, in bytes, of the bodies and compressed bodies to keep cached. Defaults to 16MiB
+        :type cache_size: int, optional
+        :return: The new shared ResponseCompressor instance.
+        :rtype: ResponseCompressor
+        """
+        with cls._default_lock:
+            cls._default = ResponseCompressor(min_size=min_size, level=level, cache_size=cache_size)
+        return cls._default
+
+    @staticmethod
+    def AfterRequest(response:Response) -> Response:
+        """Compress a response to the current Flask request with the shared compressor, for use as an `after_request` handler.
+
+        :param response: The response to compress.
+        :type response: Response
+        :return: The response, compressed if the request accepts gzip.
+        :rtype: Response
+        """
+        return ResponseCompressor.Default().Apply(response, accept_encoding=request.headers.get("Accept-Encoding"))
+
+    @staticmethod
+    def AcceptsGzip(accept_encoding:Optional[str]) -> bool:
+        """Check whether an `Accept-Encoding` header allows a gzipped response.
+
+        :param accept_encoding: The value of the header, or None if there was no header.
+        :type accept_encoding: Optional[str]
+        :return: True if gzip, or any encoding, is accepted with a nonzero quality, otherwise False.
+        :rtype: bool
+        """
+        wildcard : bool = False
+
+        for coding in (accept_encoding or "").split(","):
+            name, _, params = coding.partition(";")
+            name    = name.strip().lower()
+            quality = 1.0
+            for param in params.split(";"):
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            if name in ("gzip", "x-gzip"):
+                # An explicit gzip entry wins over a wildcard, whatever order they come in.
+                return quality > 0
+            if name == "*":
+                wildcard = quality > 0
+        return wildcard
+
+    # *** PUBLIC METHODS ***
+
+    def Apply(self, response:Response, accept_encoding:Optional[str]) -> Response:
+        """Gzip a Flask response in place, if the client accepts it and the body is worth compressing.
+
+        :param response: The response to compress.
+        :type response: Response
+        :param accept_encoding: The value of the request's `Accept-Encoding` header, or None if there was none.
+        :type accept_encoding: Optional[str]
+        :return: The same response, compressed or not.
+        :rtype: Response
+        """
+        if self._level == 0 or response.direct_passthrough or "Content-Encoding" in response.headers \
+        or response.status_code < 200 or response.status_code in ResponseCompressor._BODILESS_STATUSES:
+            return response
+        response.vary.add("Accept-Encoding")
+        if not ResponseCompressor.AcceptsGzip(accept_encoding):
+            return response
+
+        if response.is_streamed:
+            response.response = self.CompressStream(response.response)
+            response.headers.pop("Content-Length", None)
+        else:
+            body = response.get_data()
+            if not self.ShouldCompress(size=len(body), accept_encoding=accept_encoding):
+                return response
+            response.set_data(self.Compress(body))
+        response.headers["Content-Encoding"] = "gzip"
+        return response
+
+    def ShouldCompress(self, size:int, accept_encoding:Optional[str]) -> bool:
+        """Check whether a body of a given size should be gzipped for a request.
+
+        :param size: The size of the body, in bytes.
+        :type size: int
+        :param accept_encoding: The value of the request's `Accept-Encoding` header, or None if there was none.
+        :type accept_encoding: Optional[str]
+        :return: True if compression is enabled, the body is at least the minimum size, and the request accepts gzip, otherwise False.
+        :rtype: bool
+        """
+        return self._level != 0 and size >= self._min_size and ResponseCompressor.AcceptsGzip(accept_encoding)
+
+    def Compress(self, body:bytes) -> bytes:
+        """Gzip a body, or get its compressed form from the cache.
+
+        :param body: The body to compress.
+        :type body: bytes
+        :return: The gzipped body.
+        :rtype: bytes
+        """
+        with self._lock:
+            ret_val = self._cache.get(body)
+            if ret_val is not None:
+                self._cache.move_to_end(body)
+                return ret_val
+        # mtime is fixed, so the same body always compresses to the same bytes.
+        ret_val = gzip.compress(body, compresslevel=self._level, mtime=0)
+        self._store(body, ret_val)
+        return ret_val
+
+    def CompressStream(self, chunks:Iterable[bytes | str]) -> Iterator[bytes]:
+        """Gzip a stream of chunks on the fly.
+
+        :param chunks: The chunks to compress, where `str` chunks are encoded as UTF-8 first, as Flask would when sending them.
+        :type chunks: Iterable[bytes | str]
+        :return: An iterator over the compressed chunks.
+        :rtype: Iterator[bytes]
+        """
+        compressor = zlib.compressobj(self._level, wbits=31)
+        try:
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8")
+                compressed = compressor.compress(chunk)
+                if compressed:
+                    yield compressed
+            yield compressor.flush()
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+    # *** PRIVATE METHODS ***
+
+    def _store(self, body:bytes, compressed:bytes):
+        size = len(body) + len(compressed)
+        # Leave bodies that would take up most of the cache uncached, rather than evicting everything else for them.
+        if size > self._cache_size // 4:
+            return
+        with self._lock:
+            if body in self._cache:
+                return
+            self._cache[body]  = compressed
+            self._cache_bytes += size
+            while self._cache_bytes > self._cache_size:
+                evicted, evicted_compressed = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted) + len(evicted_compressed)
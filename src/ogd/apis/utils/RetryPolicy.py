@@ -0,0 +1,195 @@
+"""
+RetryPolicy
+
+Contains a class describing when and how an APIRequest should retry a failed attempt,
+using exponential backoff with jitter, bounded by an overall deadline across all attempts.
+"""
+
+# import standard libraries
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Final, Optional, Set
+
+# import 3rd-party libraries
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+
+class RetryPolicy:
+    """Policy for retrying APIRequest attempts that timed out, or were turned away by a busy server.
+
+    Before retry number `n` (starting from 0), the request waits for a backoff of `base_delay * multiplier**n` seconds, capped at `max_delay`.
+    With jitter enabled, the actual wait is chosen uniformly between 0 and that backoff ("full jitter"), so that many clients
+    retrying at once spread out instead of retrying in lockstep.
+    When a response carries a `Retry-After` header, the request waits at least that long.
+
+    No retry is attempted once `max_retries` is reached, or if the wait would run past the overall `deadline`,
+    which is measured from the start of the first attempt. Each attempt's timeout is also trimmed to fit within the deadline.
+    By default there is no overall deadline, so each attempt gets the request's full timeout.
+    """
+    _DEFAULT_MAX_RETRIES : Final[int]   = 5
+    _DEFAULT_BASE_DELAY  : Final[float] = 0.1
+    _DEFAULT_MAX_DELAY   : Final[float] = 2.0
+    _DEFAULT_MULTIPLIER  : Final[float] = 2.0
+    _DEFAULT_DEADLINE    : Final[Optional[float]] = None
+    _DEFAULT_STATUSES    : Final[Set[ResponseStatus]] = {ResponseStatus.TOO_MANY_REQUESTS, ResponseStatus.UNAVAILABLE}
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, max_retries:int=_DEFAULT_MAX_RETRIES, base_delay:float=_DEFAULT_BASE_DELAY, max_delay:float=_DEFAULT_MAX_DELAY,
+                 multiplier:float=_DEFAULT_MULTIPLIER, jitter:bool=True, deadline:Optional[float]=_DEFAULT_DEADLINE,
+                 retry_statuses:Optional[Set[ResponseStatus]]=None):
+        """Constructor for a RetryPolicy.
+
+        :param max_retries: The maximum number of retries after the first attempt. Defaults to 5
+        :type max_retries: int, optional
+        :param base_delay: The backoff, in seconds, before the first retry. Defaults to 0.1
+        :type base_delay: float, optional
+        :param max_delay: The largest backoff, in seconds, before any one retry. Defaults to 2.0
+        :type max_delay: float, optional
+        :param multiplier: The factor by which the backoff grows with each retry. Defaults to 2.0
+        :type multiplier: float, optional
+        :param jitter: Whether to randomize each backoff between 0 and its full value. Defaults to True
+        :type jitter: bool, optional
+        :param deadline: The total number of seconds allowed across all attempts, or None for no overall limit. Defaults to None
+        :type deadline: float, optional
+        :param retry_statuses: The response statuses that should be retried. Defaults to None, in which case `TOO_MANY_REQUESTS` and `UNAVAILABLE` are retried.
+        :type retry_statuses: Set[ResponseStatus], optional
+        """
+        self._max_retries    : int                 = max(0, max_retries)
+        self._base_delay     : float               = max(0.0, base_delay)
+        self._max_delay      : float               = max(0.0, max_delay)
+        self._multiplier     : float               = max(1.0, multiplier)
+        self._jitter         : bool                = jitter
+        self._deadline       : Optional[float]     = deadline
+        self._retry_statuses : Set[ResponseStatus] = retry_statuses if retry_statuses is not None else set(RetryPolicy._DEFAULT_STATUSES)
+
+    def __str__(self) -> str:
+        return f"RetryPolicy: {self._max_retries} retries, backoff {self._base_delay}s x{self._multiplier} up to {self._max_delay}s, deadline {self._deadline}s"
+
+    @property
+    def MaxRetries(self) -> int:
+        return self._max_retries
+
+    @property
+    def Deadline(self) -> Optional[float]:
+        """Property for the total number of seconds allowed across all attempts.
+
+        :return: The total number of seconds allowed across all attempts, or None if there is no overall limit.
+        :rtype: Optional[float]
+        """
+        return self._deadline
+
+    @property
+    def RetryStatuses(self) -> Set[ResponseStatus]:
+        return self._retry_statuses
+
+    # *** PUBLIC STATICS ***
+
+    @classmethod
+    def Default(cls) -> "RetryPolicy":
+        return RetryPolicy()
+
+    @classmethod
+    def NoRetry(cls) -> "RetryPolicy":
+        """Get a policy that never retries, for requests that should fail on the first error.
+
+        :return: A RetryPolicy with no retries.
+        :rtype: RetryPolicy
+        """
+        return RetryPolicy(max_retries=0)
+
+    @staticmethod
+    def ParseRetryAfter(header:Optional[str]) -> Optional[float]:
+        """Parse the value of a `Retry-After` header into a number of seconds to wait.
+
+        The header may give either a number of seconds, or an HTTP date.
+
+        :param header: The raw value of the header, if any.
+        :type header: Optional[str]
+        :return: The number of seconds to wait, or None if the header was missing or invalid.
+        :rtype: Optional[float]
+        """
+        ret_val : Optional[float] = None
+
+        if header:
+            header = header.strip()
+            if header.isdigit():
+                ret_val = float(header)
+            else:
+                try:
+                    retry_at = parsedate_to_datetime(header)
+                except (TypeError, ValueError):
+                    pass
+                else:
+                    if retry_at.tzinfo is None:
+                        retry_at = retry_at.replace(tzinfo=timezone.utc)
+                    ret_val = max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        return ret_val
+
+    # *** PUBLIC METHODS ***
+
+    def StartDeadline(self, start:Optional[float]=None) -> Optional[float]:
+        """Get the absolute time, on the `time.monotonic()` clock, by which all attempts must finish.
+
+        :param start: The monotonic time at which the first attempt starts. Defaults to None, in which case the current time is used.
+        :type start: float, optional
+        :return: The monotonic time of the deadline, or None if there is no overall limit.
+        :rtype: Optional[float]
+        """
+        if self._deadline is None:
+            return None
+        return (start if start is not None else time.monotonic()) + self._deadline
+
+    def AttemptTimeout(self, timeout:float, deadline:Optional[float]) -> float:
+        """Get the timeout to use for the next attempt, trimmed so the attempt can't run past the deadline.
+
+        :param timeout: The request's usual per-attempt timeout, in seconds.
+        :type timeout: float
+        :param deadline: The monotonic time of the deadline, from `StartDeadline`, if any.
+        :type deadline: Optional[float]
+        :return: The timeout, in seconds, for the next attempt.
+        :rtype: float
+        """
+        if deadline is None:
+            return timeout
+        return max(0.001, min(timeout, deadline - time.monotonic()))
+
+    def ShouldRetryStatus(self, status:ResponseStatus | int) -> bool:
+        return status in self._retry_statuses
+
+    def Backoff(self, retry:int) -> float:
+        """Get the backoff before a given retry, including jitter if enabled.
+
+        :param retry: The index of the upcoming retry, starting from 0.
+        :type retry: int
+        :return: The number of seconds to wait before the retry.
+        :rtype: float
+        """
+        ret_val = min(self._max_delay, self._base_delay * (self._multiplier ** retry))
+        return random.uniform(0, ret_val) if self._jitter else ret_val
+
+    def NextDelay(self, retry:int, deadline:Optional[float], retry_after:Optional[float]=None) -> Optional[float]:
+        """Decide whether to make another attempt, and if so, how long to wait first.
+
+        :param retry: The index of the upcoming retry, starting from 0.
+        :type retry: int
+        :param deadline: The monotonic time of the deadline, from `StartDeadline`, if any.
+        :type deadline: Optional[float]
+        :param retry_after: The wait requested by the server through a `Retry-After` header, if any. Defaults to None
+        :type retry_after: float, optional
+        :return: The number of seconds to wait before retrying, or None if the request should not be retried.
+        :rtype: Optional[float]
+        """
+        if retry >= self._max_retries:
+            return None
+        ret_val = self.Backoff(retry)
+        if retry_after is not None:
+            ret_val = max(ret_val, retry_after)
+        if deadline is not None and time.monotonic() + ret_val >= deadline:
+            return None
+        return ret_val
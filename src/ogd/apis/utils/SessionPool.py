@@ -0,0 +1,377 @@
+"""
+SessionPool
+
+Contains a class for sharing keep-alive, connection-pooled `requests.Session` objects across APIRequests,
+so that repeated calls to the same OGD API reuse their TCP/TLS connections instead of opening new ones.
+When `aiohttp` is installed, the pool also hands out a connection-pooled `aiohttp.ClientSession` per event loop for async requests.
+"""
+
+# import standard libraries
+import asyncio
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Final, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+# import 3rd-party libraries
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.models.enums.LatencyPhase import LatencyPhase
+from ogd.apis.models.RequestTimings import RequestTimings
+from ogd.apis.utils.Transport import Transport
+
+# The RequestTimings of the request being sent on each thread, so that timed connections know where to record their connect time.
+_current_timings = threading.local()
+
+def _recordConnect(seconds:float):
+    timings : Optional[RequestTimings] = getattr(_current_timings, "timings", None)
+    if timings is not None:
+        timings.AddPhase(LatencyPhase.CONNECT, seconds)
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _recordConnect(time.perf_counter() - start)
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _recordConnect(time.perf_counter() - start)
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections record the time spent connecting to the RequestTimings passed to `SessionPool.Request`.
+    """
+    def init_poolmanager(self, *args:Any, **kwargs:Any):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _TimedHTTPConnectionPool, "https": _TimedHTTPSConnectionPool}
+
+async def _onConnectionCreateStart(session:Any, context:Any, params:Any):
+    context.connect_start = time.perf_counter()
+
+async def _onConnectionCreateEnd(session:Any, context:Any, params:Any):
+    if isinstance(context.trace_request_ctx, RequestTimings):
+        context.trace_request_ctx.AddPhase(LatencyPhase.CONNECT, time.perf_counter() - context.connect_start)
+
+async def _closeOnShutdown(session:Any):
+    """Wait until cancelled, then close an async session.
+
+    `asyncio.run` cancels every task still pending on its loop, and waits for them, before closing the loop,
+    so a session guarded by this task is closed while its loop can still close its connections.
+    """
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await session.close()
+
+class _PooledSession:
+    """Small record of a pooled session, and bookkeeping needed to decide when it has gone idle.
+    """
+    def __init__(self, session:requests.Session):
+        self.session   : requests.Session = session
+        self.last_used : float            = time.monotonic()
+        self.in_flight : int              = 0
+
+class SessionPool(Transport):
+    """Pool of keep-alive `requests.Session` objects, keyed by destination host.
+
+    Each host (scheme + network location) gets its own session, whose adapter holds up to `pool_size` open connections.
+    Sessions that have not been used for `idle_timeout` seconds, and have no requests in flight, are closed and evicted
+    the next time the pool is accessed, so long-lived workers do not hold sockets to hosts they no longer talk to.
+
+    A single process-wide pool is available from `SessionPool.Default()`, and is what APIRequest uses unless given a pool explicitly.
+
+    For async requests, `AsyncSession()` returns one `aiohttp.ClientSession` per event loop,
+    whose connector applies the same per-host pool size and idle timeout.
+    It is closed by `CloseAsync()`, or otherwise when its loop is shut down by `asyncio.run`.
+
+    Since a session is shared by every caller sending to its host, pooled sessions never store cookies from responses,
+    so that one caller's cookies are never sent with another's requests. Cookies given with a request are still sent.
+    """
+    _DEFAULT_POOL_SIZE    : Final[int]   = 10
+    _DEFAULT_IDLE_TIMEOUT : Final[float] = 60.0
+
+    _default      : Optional["SessionPool"] = None
+    _default_lock : threading.Lock          = threading.Lock()
+
+    # *** BUILT-INS & PROPERTIES ***
+
+    def __init__(self, pool_size:int=_DEFAULT_POOL_SIZE, idle_timeout:float=_DEFAULT_IDLE_TIMEOUT):
+        """Constructor for a SessionPool.
+
+        :param pool_size: The maximum number of connections to keep open to any one host. Defaults to 10
+        :type pool_size: int, optional
+        :param idle_timeout: Number of seconds a host's session may go unused before it is closed and evicted. Defaults to 60.0
+        :type idle_timeout: float, optional
+        """
+        self._pool_size      : int                                                       = max(1, pool_size)
+        self._idle_timeout   : float                                                     = idle_timeout
+        self._sessions       : Dict[str, _PooledSession]                                 = {}
+        # The async session for each event loop, along with the task that closes it when the loop shuts down.
+        self._async_sessions : Dict[asyncio.AbstractEventLoop, Tuple[Any, asyncio.Task]] = {}
+        self._lock           : threading.Lock                                            = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"SessionPool: {len(self._sessions)} hosts, pool size {self._pool_size}, idle timeout {self._idle_timeout}s"
+
+    @property
+    def PoolSize(self) -> int:
+        """Property for the maximum number of connections kept open to any one host.
+
+        :return: The maximum number of connections kept open to any one host.
+        :rtype: int
+        """
+        return self._pool_size
+
+    @property
+    def IdleTimeout(self) -> float:
+        """Property for the number of seconds a session may go unused before it is evicted.
+
+        :return: The number of seconds a session may go unused before it is evicted.
+        :rtype: float
+        """
+        return self._idle_timeout
+
+    @property
+    def Hosts(self) -> List[str]:
+        """Property for the list of hosts that currently have a pooled session.
+
+        :return: The list of host keys, in `scheme://netloc` form, with a pooled session.
+        :rtype: List[str]
+        """
+        with self._lock:
+            return list(self._sessions.keys())
+
+    # *** PUBLIC STATICS ***
+
+    @classmethod
+    def Default(cls) -> "SessionPool":
+        """Get the shared, process-wide SessionPool, creating it on first use.
+
+        :return: The shared SessionPool instance.
+        :rtype: SessionPool
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = SessionPool()
+        return cls._default
+
+    @classmethod
+    def Configure(cls, pool_size:int=_DEFAULT_POOL_SIZE, idle_timeout:float=_DEFAULT_IDLE_TIMEOUT) -> "SessionPool":
+        """Replace the shared, process-wide SessionPool with one using the given settings.
+
+        Any sessions held by the previous default pool are closed.
+
+        :param pool_size: The maximum number of connections to keep open to any one host. Defaults to 10
+        :type pool_size: int, optional
+        :param idle_timeout: Number of seconds a host's session may go unused before it is evicted. Defaults to 60.0
+        :type idle_timeout: float, optional
+        :return: The new shared SessionPool instance.
+        :rtype: SessionPool
+        """
+        with cls._default_lock:
+            old_pool, cls._default = cls._default, SessionPool(pool_size=pool_size, idle_timeout=idle_timeout)
+        if old_pool is not None:
+            old_pool.Close()
+        return cls._default
+
+    @staticmethod
+    def AsyncSupported() -> bool:
+        """Check whether async sessions are available, which requires the optional `aiohttp` package.
+
+        :return: True if `aiohttp` is installed, otherwise False.
+        :rtype: bool
+        """
+        return aiohttp is not None
+
+    @staticmethod
+    def HostKey(url:str) -> str:
+        """Get the key used to pool connections for a given URL.
+
+        :param url: A full URL, including scheme.
+        :type url: str
+        :return: The scheme and network location of the URL, in lowercase.
+        :rtype: str
+        """
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    # *** PUBLIC METHODS ***
+
+    def Session(self, url:str) -> requests.Session:
+        """Get the pooled session for the host of the given URL, creating it if needed.
+
+        :param url: A full URL, including scheme.
+        :type url: str
+        :return: The session used for requests to the URL's host.
+        :rtype: requests.Session
+        """
+        with self._lock:
+            return self._acquire(SessionPool.HostKey(url)).session
+
+    def Request(self, method:str, url:str, timings:Optional[RequestTimings]=None, **kwargs:Any) -> requests.Response:
+        """Send a request through the pooled session for the URL's host.
+
+        Keyword arguments are passed directly to `requests.Session.request`.
+
+        :param method: The HTTP method to use, such as "GET".
+        :type method: str
+        :param url: A full URL, including scheme.
+        :type url: str
+        :param timings: Timings to record the time spent opening new connections to. Defaults to None
+        :type timings: RequestTimings, optional
+        :return: The response to the request.
+        :rtype: requests.Response
+        """
+        key = SessionPool.HostKey(url)
+        with self._lock:
+            pooled = self._acquire(key)
+            pooled.in_flight += 1
+        _current_timings.timings = timings
+        try:
+            return pooled.session.request(method=method, url=url, **kwargs)
+        finally:
+            _current_timings.timings = None
+            with self._lock:
+                pooled.in_flight -= 1
+                pooled.last_used = time.monotonic()
+
+    async def RequestAsync(self, method:str, url:str, params:List[Tuple[str, str]], headers:Mapping[str, str], data:Optional[Any],
+                           timeout:float, timings:RequestTimings) -> Tuple[int, Mapping[str, str], bytes]:
+        """Send a request through the pooled async session for the running event loop, and read the whole response.
+
+        :raises RuntimeError: If `aiohttp` is not installed.
+        :return: The status code, headers and decoded body of the response.
+        :rtype: Tuple[int, Mapping[str, str], bytes]
+        """
+        start = time.perf_counter()
+        async with self.AsyncSession().request(method, url, params=params, headers=dict(headers), data=data,
+                                               timeout=aiohttp.ClientTimeout(total=timeout), trace_request_ctx=timings) as response:
+            headers_at = time.perf_counter()
+            timings.SetPhase(LatencyPhase.FIRST_BYTE, headers_at - start - (timings.Phase(LatencyPhase.CONNECT) or 0.0))
+            content = await response.read()
+            timings.SetPhase(LatencyPhase.DOWNLOAD, time.perf_counter() - headers_at)
+            timings.ResponseBytes     = len(content)
+            timings.ResponseWireBytes = SessionPool._wireSize(response, content)
+            return response.status, response.headers, content
+
+    def AsyncSession(self) -> "aiohttp.ClientSession":
+        """Get the pooled `aiohttp.ClientSession` for the running event loop, creating it if needed.
+
+        Must be called from within a running event loop.
+        The session is closed by `CloseAsync()`, or when `asyncio.run` shuts the loop down, whichever comes first.
+        Pass a RequestTimings as the `trace_request_ctx` of a request to record the time spent opening new connections for it.
+
+        :raises RuntimeError: If `aiohttp` is not installed, or there is no running event loop.
+        :return: The session used for async requests on the running event loop.
+        :rtype: aiohttp.ClientSession
+        """
+        if aiohttp is None:
+            raise RuntimeError("Async sessions require the optional aiohttp package, which is not installed.")
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            # Sessions belonging to loops that have since closed can't be reused, so drop them.
+            for closed_loop in [_loop for _loop in self._async_sessions if _loop.is_closed()]:
+                del self._async_sessions[closed_loop]
+            session, _ = self._async_sessions.get(loop, (None, None))
+            if session is None or session.closed:
+                connector = aiohttp.TCPConnector(limit=0, limit_per_host=self._pool_size, keepalive_timeout=self._idle_timeout)
+                tracing   = aiohttp.TraceConfig()
+                tracing.on_connection_create_start.append(_onConnectionCreateStart)
+                tracing.on_connection_create_end.append(_onConnectionCreateEnd)
+                session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar(), trace_configs=[tracing])
+                self._async_sessions[loop] = (session, loop.create_task(_closeOnShutdown(session)))
+            return session
+
+    async def CloseAsync(self):
+        """Close and remove the async session for the running event loop, if there is one.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            _, closer = self._async_sessions.pop(loop, (None, None))
+        if closer is not None:
+            closer.cancel()
+            await asyncio.wait({closer})
+
+    def EvictIdle(self) -> int:
+        """Close and remove any sessions that have gone idle.
+
+        :return: The number of sessions that were evicted.
+        :rtype: int
+        """
+        with self._lock:
+            evicted = self._evictIdle(now=time.monotonic())
+        for session in evicted:
+            session.close()
+        return len(evicted)
+
+    def Close(self):
+        """Close and remove every session in the pool.
+        """
+        with self._lock:
+            sessions = [pooled.session for pooled in self._sessions.values()]
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    # *** PRIVATE METHODS ***
+
+    def _acquire(self, key:str) -> _PooledSession:
+        """Get or create the pooled session for a host key. Must be called while holding `self._lock`.
+        """
+        now = time.monotonic()
+        for session in self._evictIdle(now=now, keep=key):
+            session.close()
+        pooled = self._sessions.get(key)
+        if pooled is None:
+            pooled = _PooledSession(session=self._newSession())
+            self._sessions[key] = pooled
+        pooled.last_used = now
+        return pooled
+
+    def _evictIdle(self, now:float, keep:Optional[str]=None) -> List[requests.Session]:
+        """Remove idle sessions from the pool, returning them so they can be closed outside the lock.
+        """
+        idle = [key for key, pooled in self._sessions.items()
+                if key != keep and pooled.in_flight == 0 and now - pooled.last_used > self._idle_timeout]
+        return [self._sessions.pop(key).session for key in idle]
+
+    @staticmethod
+    def _wireSize(response:"aiohttp.ClientResponse", content:bytes) -> int:
+        """Get the number of body bytes an `aiohttp` response took on the wire, before any decompression.
+        """
+        # Older aiohttp versions don't count compressed bytes, so fall back on the declared length of an encoded body.
+        raw_bytes = getattr(response.content, "total_raw_bytes", None)
+        if isinstance(raw_bytes, int):
+            return raw_bytes
+        if "Content-Encoding" in response.headers and "Content-Length" in response.headers:
+            return int(response.headers["Content-Length"])
+        return len(content)
+
+    def _newSession(self) -> requests.Session:
+        session = requests.Session()
+        # Reject every cookie set by a response, since the session is shared by unrelated callers.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = _TimedHTTPAdapter(pool_connections=1, pool_maxsize=self._pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
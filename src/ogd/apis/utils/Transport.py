@@ -0,0 +1,81 @@
+"""
+Transport
+
+Contains the abstract base class for whatever actually sends an APIRequest's HTTP traffic,
+so that a request can be sent over the network, recorded, or answered from recordings without changing the request itself.
+"""
+
+# import standard libraries
+import abc
+from typing import Any, List, Mapping, Optional, Tuple
+
+# import 3rd-party libraries
+import requests
+
+# import OGD libraries
+
+# import local files
+from ogd.apis.models.RequestTimings import RequestTimings
+
+class Transport(abc.ABC):
+    """Sender of the HTTP requests behind APIRequests.
+
+    `SessionPool` is the default transport, sending requests over pooled keep-alive connections.
+    Other transports, such as `RecordingTransport` and `ReplayTransport`, can be given to an APIRequest to change where its responses come from.
+
+    Sync requests return a streamed `requests.Response`, while async requests return the status, headers and full body of the response.
+    A transport signals timeouts by raising `requests.exceptions.Timeout` from `Request`, or `asyncio.TimeoutError` from `RequestAsync`.
+    """
+
+    # *** PUBLIC METHODS ***
+
+    @abc.abstractmethod
+    def Request(self, method:str, url:str, timings:Optional[RequestTimings]=None, **kwargs:Any) -> requests.Response:
+        """Send a request, and get the response.
+
+        Keyword arguments are those of `requests.Session.request`, such as `params`, `headers`, `data`, `timeout` and `stream`.
+
+        :param method: The HTTP method to use, such as "GET".
+        :type method: str
+        :param url: A full URL, including scheme.
+        :type url: str
+        :param timings: Timings to record the time spent opening new connections to. Defaults to None
+        :type timings: RequestTimings, optional
+        :return: The response to the request.
+        :rtype: requests.Response
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} has not implemented the Request function!")
+
+    @abc.abstractmethod
+    async def RequestAsync(self, method:str, url:str, params:List[Tuple[str, str]], headers:Mapping[str, str], data:Optional[Any],
+                           timeout:float, timings:RequestTimings) -> Tuple[int, Mapping[str, str], bytes]:
+        """Send a request from within an event loop, and get the response, recording its phase timings and byte counts.
+
+        :param method: The HTTP method to use, such as "GET".
+        :type method: str
+        :param url: A full URL, including scheme.
+        :type url: str
+        :param params: The request params, as key/value string pairs.
+        :type params: List[Tuple[str, str]]
+        :param headers: The request headers.
+        :type headers: Mapping[str, str]
+        :param data: The request body, if any.
+        :type data: Any, optional
+        :param timeout: The number of seconds to wait for the whole response.
+        :type timeout: float
+        :param timings: Timings to record the phases of the request to.
+        :type timings: RequestTimings
+        :return: The status code, headers and decoded body of the response.
+        :rtype: Tuple[int, Mapping[str, str], bytes]
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} has not implemented the RequestAsync function!")
+
+    def Close(self):
+        """Release any resources held by the transport. Does nothing by default.
+        """
+        pass
+
+    async def CloseAsync(self):
+        """Release any resources the transport holds for the running event loop. Does nothing by default.
+        """
+        pass
@@ -0,0 +1,114 @@
+"""
+APIRequestBenchmark
+
+Measures APIRequest client performance offline, against a local stand-in server that injects faults, and against recorded responses:
+* throughput: requests/sec against a healthy stand-in server, and replayed from a recording with no network at all,
+* retries: how often requests still succeed, and how many retries they take, when the server sends 429s, 503s and hangs,
+* tail latency: p50/p99 latency against a server with jittery latency and slow bodies, with and without hedging.
+
+Each scenario uses a fixed fault seed, so runs are comparable from one change to the next.
+
+Run from the repository root with:
+
+    python -m tests.benchmarks.APIRequestBenchmark [--requests N] [--threads N] [--seed N]
+"""
+
+# import standard libraries
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+# import 3rd-party libraries
+
+# import locals
+from ogd.apis.models.enums.LatencyPhase import LatencyPhase
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.utils.CircuitBreaker import CircuitBreaker
+from ogd.apis.utils.HedgePolicy import HedgePolicy
+from ogd.apis.utils.LatencyRecorder import LatencyRecorder
+from ogd.apis.utils.RecordingTransport import RecordingTransport
+from ogd.apis.utils.ReplayTransport import ReplayTransport
+from ogd.apis.utils.RetryPolicy import RetryPolicy
+from ogd.apis.utils.SessionPool import SessionPool
+from ogd.apis.utils.Transport import Transport
+from tests.utils.StandInServer import StandInServer
+
+def _run(make:Callable[[int], APIRequest], count:int, threads:int) -> Tuple[List[APIResponse], float]:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        responses = list(executor.map(lambda i: make(i).Execute(), range(count)))
+    return responses, time.perf_counter() - start
+
+def _percentile(values:List[float], percentile:float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))] if ordered else 0.0
+
+def _request(url:str, transport:Transport, timeout:float=1, policy:RetryPolicy=RetryPolicy.NoRetry(), hedge:Optional[HedgePolicy]=None) -> APIRequest:
+    # Each request gets a throwaway recorder and a disabled breaker, so scenarios don't affect each other.
+    return APIRequest(url=url, request_type=RESTType.GET, params={"session_id":"1234"}, timeout=timeout, transport=transport,
+                      retry_policy=policy, circuit_breaker=CircuitBreaker(failure_threshold=0),
+                      latency_recorder=LatencyRecorder(), hedge_policy=hedge)
+
+def throughput(count:int, threads:int):
+    pool     = SessionPool(pool_size=threads)
+    recorder = RecordingTransport(inner=pool)
+    with StandInServer(value={"features":list(range(100))}) as server:
+        url = f"{server.Address}/features"
+        _request(url, transport=pool).Execute()
+        _, live = _run(lambda _: _request(url, transport=pool), count=count, threads=threads)
+        _request(url, transport=recorder).Execute()
+    pool.Close()
+    replay = ReplayTransport(recorder.Exchanges)
+    _, replayed = _run(lambda _: _request(url, transport=replay), count=count, threads=threads)
+
+    print(f"throughput: {count} GET requests, {threads} threads")
+    print(f"   stand-in server : {count / live:8.1f} req/s")
+    print(f"   replayed        : {count / replayed:8.1f} req/s  (client overhead only)")
+
+def retries(count:int, threads:int, seed:int):
+    pool   = SessionPool(pool_size=threads)
+    policy = RetryPolicy(max_retries=3, base_delay=0.01, max_delay=0.1, deadline=5.0)
+    with StandInServer(value={"foo":"bar"}) as server:
+        server.InjectFaults(error_rate=0.2, timeout_rate=0.05, hang=0.5, seed=seed)
+        responses, elapsed = _run(lambda _: _request(f"{server.Address}/hello", transport=pool, timeout=0.2, policy=policy),
+                                  count=count, threads=threads)
+        sent = server.RequestCount
+    pool.Close()
+    succeeded = [response for response in responses if response.OK]
+    attempts  = [response.Timings.Retries for response in responses if response.Timings is not None]
+
+    print(f"retries: {count} GET requests, 20% 429/503, 5% hung, up to 3 retries")
+    print(f"   succeeded       : {len(succeeded) / count:8.1%}")
+    print(f"   mean retries    : {statistics.mean(attempts) if attempts else 0.0:8.2f}")
+    print(f"   server requests : {sent:8d}")
+    print(f"   elapsed         : {elapsed:8.2f}s")
+
+def tail_latency(count:int, threads:int, seed:int):
+    pool = SessionPool(pool_size=threads * 2)
+    with StandInServer(value={"foo":"bar"}) as server:
+        url = f"{server.Address}/hello"
+        print(f"tail latency: {count} GET requests, 5ms latency + up to 100ms jitter, 20ms slow body")
+        for label, hedge in (("unhedged", None), ("hedged  ", HedgePolicy(delay=0.05))):
+            server.InjectFaults(latency=0.005, jitter=0.1, body_delay=0.02, seed=seed)
+            responses, _ = _run(lambda _: _request(url, transport=pool, hedge=hedge), count=count, threads=threads)
+            totals = [response.Timings.Phase(LatencyPhase.TOTAL) or 0.0 for response in responses if response.Timings is not None]
+            print(f"   {label}        : p50 {_percentile(totals, 50) * 1000:7.1f}ms, p99 {_percentile(totals, 99) * 1000:7.1f}ms")
+    pool.Close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark APIRequest throughput, retries and tail latency offline.")
+    parser.add_argument("--requests", type=int, default=500, help="Number of requests to send in each scenario.")
+    parser.add_argument("--threads",  type=int, default=4,   help="Number of client threads sending requests.")
+    parser.add_argument("--seed",     type=int, default=42,  help="Seed for the stand-in server's injected faults.")
+    args = parser.parse_args()
+
+    throughput(count=args.requests, threads=args.threads)
+    retries(count=args.requests, threads=args.threads, seed=args.seed)
+    tail_latency(count=args.requests, threads=args.threads, seed=args.seed)
+
+if __name__ == "__main__":
+    main()
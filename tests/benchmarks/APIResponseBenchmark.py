@@ -0,0 +1,67 @@
+"""
+APIResponseBenchmark
+
+Compares sending a large APIResponse through Flask all at once with `AsFlaskResponse` against streaming it with `AsFlaskStream`,
+measuring the time to the first chunk of the body, the total time, and the peak memory allocated while encoding.
+
+Run from the repository root with:
+
+    python -m tests.benchmarks.APIResponseBenchmark [--rows N]
+"""
+
+# import standard libraries
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+# import 3rd-party libraries
+from flask import Response
+
+# import locals
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIResponse import APIResponse
+
+def _payload(rows:int) -> Dict[str, Any]:
+    return {
+        "columns" : ["session_id", "app_version", "event_count", "active_time", "completed"],
+        "rows"    : [[f"{23000000000000000 + i}", "1.2.3", i % 400, i * 0.37, i % 3 == 0] for i in range(rows)]
+    }
+
+def _drain(make:Callable[[], Response]) -> Tuple[float, float, int]:
+    """Drain a Flask response the way a WSGI server would, returning its time to first byte, total time and size.
+    """
+    start      = time.perf_counter()
+    first_byte = 0.0
+    size       = 0
+    body : Iterable[bytes] = make().response
+    for chunk in body:
+        if size == 0:
+            first_byte = time.perf_counter() - start
+        size += len(chunk)
+    return first_byte, time.perf_counter() - start, size
+
+def _peakMemory(make:Callable[[], Response]) -> int:
+    # Measured in a separate pass, since tracing allocations slows everything down.
+    tracemalloc.start()
+    _drain(make)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark buffered against streamed Flask responses for a large APIResponse.")
+    parser.add_argument("--rows", type=int, default=200000, help="Number of rows in the response's value.")
+    args = parser.parse_args()
+
+    response = APIResponse(req_type=RESTType.GET, val=_payload(args.rows), msg="Benchmark", status=ResponseStatus.OK)
+    print(f"{args.rows} rows")
+    for label, make in (("AsFlaskResponse", lambda: response.AsFlaskResponse), ("AsFlaskStream  ", lambda: response.AsFlaskStream())):
+        first_byte, total, size = _drain(make)
+        peak                    = _peakMemory(make)
+        print(f"   {label} : first byte {first_byte * 1000:8.1f}ms, total {total * 1000:8.1f}ms, "
+              f"{size / 1024 / 1024:6.1f}MiB sent, peak {peak / 1024 / 1024:6.1f}MiB allocated")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+JSONSerializerBenchmark
+
+Compares the time to encode and decode a large APIResponse with each available JSONSerializer backend,
+along with the old path of `json.dumps` to a `str` that is then encoded to bytes again.
+
+Run from the repository root with:
+
+    python -m tests.benchmarks.JSONSerializerBenchmark [--rows N] [--repeat N]
+"""
+
+# import standard libraries
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+# import 3rd-party libraries
+
+# import locals
+from ogd.apis.models.enums.JSONBackend import JSONBackend
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.utils.JSONSerializer import JSONSerializer
+
+def _payload(rows:int) -> Dict[str, Any]:
+    return {
+        "columns" : ["session_id", "app_version", "event_count", "active_time", "completed"],
+        "rows"    : [[f"{23000000000000000 + i}", "1.2.3", i % 400, i * 0.37, i % 3 == 0] for i in range(rows)]
+    }
+
+def _time(action:Callable[[], Any], repeat:int) -> float:
+    action()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    return (time.perf_counter() - start) / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSONSerializer backends on a large APIResponse.")
+    parser.add_argument("--rows",   type=int, default=50000, help="Number of rows in the response's value.")
+    parser.add_argument("--repeat", type=int, default=10,    help="Number of times to time each operation.")
+    args = parser.parse_args()
+
+    response = APIResponse(req_type=RESTType.GET, val=_payload(args.rows), msg="Benchmark", status=ResponseStatus.OK)
+    encoded  = json.dumps(response.AsDict).encode("utf-8")
+    print(f"{args.rows} rows, {len(encoded) / 1024 / 1024:.1f}MiB of JSON")
+    print(f"   {'json.dumps + encode':<20}: encode {_time(lambda: json.dumps(response.AsDict).encode('utf-8'), args.repeat) * 1000:8.1f}ms, "
+          f"decode {_time(lambda: json.loads(encoded), args.repeat) * 1000:8.1f}ms")
+
+    backends = [JSONBackend.STDLIB] + ([JSONBackend.ORJSON] if JSONSerializer.FastAvailable() else [])
+    for backend in backends:
+        serializer = JSONSerializer.Configure(backend=backend)
+        encode     = _time(lambda: response.AsJSONBytes, args.repeat)
+        decode     = _time(lambda: serializer.Loads(encoded), args.repeat)
+        print(f"   {str(backend):<20}: encode {encode * 1000:8.1f}ms, decode {decode * 1000:8.1f}ms")
+    if not JSONSerializer.FastAvailable():
+        print("   orjson is not installed; install the 'fast' extra to compare it.")
+
+if __name__ == "__main__":
+    main()
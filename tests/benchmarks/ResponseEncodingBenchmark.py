@@ -0,0 +1,61 @@
+"""
+ResponseEncodingBenchmark
+
+Compares the size of a large table of session features in each available ResponseEncoding, raw and gzipped,
+along with the time to encode it with `APIResponse.AsEncodedBytes`, and to decode it with `APIResponse.FromContent`.
+
+Run from the repository root with:
+
+    python -m tests.benchmarks.ResponseEncodingBenchmark [--rows N] [--repeat N]
+"""
+
+# import standard libraries
+import argparse
+import gzip
+import time
+from typing import Any, Callable, Dict, List
+
+# import 3rd-party libraries
+
+# import locals
+from ogd.apis.models.enums.ResponseEncoding import ResponseEncoding
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.utils.ResponseCodec import ResponseCodec
+
+def _payload(rows:int) -> Dict[str, List[Dict[str, Any]]]:
+    return {
+        "items" : [{"session_id":f"{23000000000000000 + i}", "app_version":"1.2.3", "event_count":i % 400,
+                    "active_time":i * 0.37, "completed":i % 3 == 0} for i in range(rows)]
+    }
+
+def _time(action:Callable[[], Any], repeat:int) -> float:
+    action()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    return (time.perf_counter() - start) / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the size and speed of each ResponseEncoding on a large table of features.")
+    parser.add_argument("--rows",   type=int, default=50000, help="Number of rows in the response's value.")
+    parser.add_argument("--repeat", type=int, default=10,    help="Number of times to time each operation.")
+    args = parser.parse_args()
+
+    response = APIResponse(req_type=RESTType.GET, val=_payload(args.rows), msg="Benchmark", status=ResponseStatus.OK)
+    print(f"{args.rows} rows of session features")
+    for encoding in ResponseEncoding:
+        if not ResponseCodec.Available(encoding):
+            print(f"   {str(encoding):<10}: not available; install the 'msgpack' extra to compare it.")
+            continue
+        encoded  = response.AsEncodedBytes(encoding)
+        mimetype = ResponseCodec.MimeType(encoding)
+        encode   = _time(lambda: response.AsEncodedBytes(encoding), args.repeat)
+        # Read the Value, so the lazily-decoded JSON body is actually decoded.
+        decode   = _time(lambda: APIResponse.FromContent(encoded, status_code=200, content_type=mimetype).Value, args.repeat)
+        print(f"   {str(encoding):<10}: {len(encoded) / 1024:9.1f}KiB, {len(gzip.compress(encoded)) / 1024:8.1f}KiB gzipped, "
+              f"encode {encode * 1000:7.1f}ms, decode {decode * 1000:7.1f}ms")
+
+if __name__ == "__main__":
+    main()
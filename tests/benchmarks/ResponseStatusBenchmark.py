@@ -0,0 +1,63 @@
+"""
+ResponseStatusBenchmark
+
+Measures how long it takes to check `APIResponse.OK`, and to classify statuses as client or server errors,
+over a large batch of responses, against the old approach of rebuilding each set of statuses from every member on every check.
+
+Exits with an error if checking `OK` takes longer than `--max-ns` per response, so it can guard against the tables being rebuilt again.
+
+Run from the repository root with:
+
+    python -m tests.benchmarks.ResponseStatusBenchmark [--responses N] [--repeat N] [--max-ns N]
+"""
+
+# import standard libraries
+import argparse
+import sys
+import time
+from typing import Any, Callable, List, Set
+
+# import 3rd-party libraries
+
+# import locals
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIResponse import APIResponse
+
+def _rebuilt(low:int, high:int) -> Set[ResponseStatus]:
+    return {status for status in set(ResponseStatus) if status in range(low, high)}
+
+def _time(action:Callable[[], Any], repeat:int) -> float:
+    action()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    return (time.perf_counter() - start) / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark classifying the statuses of many APIResponses.")
+    parser.add_argument("--responses", type=int,   default=10000, help="Number of responses to check.")
+    parser.add_argument("--repeat",    type=int,   default=10,    help="Number of times to time each check.")
+    parser.add_argument("--max-ns",    type=float, default=2000,  help="Slowest acceptable time to check OK, in nanoseconds per response.")
+    args = parser.parse_args()
+
+    statuses  = list(ResponseStatus)
+    responses : List[APIResponse] = [APIResponse(req_type=RESTType.GET, val=None, msg="", status=statuses[i % len(statuses)]) for i in range(args.responses)]
+    checks = {
+        "OK (rebuilt)"            : lambda: [response.Status in _rebuilt(200, 300) for response in responses],
+        "OK"                      : lambda: [response.OK for response in responses],
+        "client/server (rebuilt)" : lambda: [response.Status in _rebuilt(400, 500) or response.Status in _rebuilt(500, 600) for response in responses],
+        "client/server"           : lambda: [response.Status in ResponseStatus.ClientErrors() or response.Status in ResponseStatus.ServerErrors() for response in responses],
+        "Class"                   : lambda: [response.Status.Class for response in responses],
+    }
+    print(f"{args.responses} responses")
+    per_response = {}
+    for label, check in checks.items():
+        per_response[label] = _time(check, args.repeat) / args.responses * 1e9
+        print(f"   {label:<24}: {per_response[label]:9.1f}ns per response")
+    if per_response["OK"] > args.max_ns:
+        print(f"Checking OK took {per_response['OK']:.1f}ns per response, over the limit of {args.max_ns:.1f}ns.")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+SessionPoolBenchmark
+
+Compares requests/sec against a local stand-in server, when sending each request on a fresh connection
+(the old behaviour of `APIRequest.Execute`) versus through a keep-alive SessionPool.
+
+Run from the repository root with:
+
+    python -m tests.benchmarks.SessionPoolBenchmark [--requests N] [--threads N]
+"""
+
+# import standard libraries
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+# import 3rd-party libraries
+import requests
+
+# import locals
+from src.ogd.apis.utils.SessionPool import SessionPool
+from tests.utils.StandInServer import StandInServer
+
+def _rate(send:Callable[[], requests.Response], count:int, threads:int) -> float:
+    def _one(_:int):
+        send().close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(_one, range(count)))
+    return count / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs. unpooled HTTP sessions.")
+    parser.add_argument("--requests", type=int, default=2000, help="Number of requests to send in each run.")
+    parser.add_argument("--threads",  type=int, default=4,    help="Number of client threads sending requests.")
+    args = parser.parse_args()
+
+    with StandInServer(value={"version": "0.0.0-Testing"}) as server:
+        url  = f"{server.Address}/version"
+        pool = SessionPool(pool_size=args.threads)
+        # warm up both paths so neither pays one-time import/setup costs.
+        requests.get(url, timeout=1).close()
+        pool.Request("GET", url, timeout=1).close()
+
+        unpooled = _rate(lambda: requests.get(url, timeout=1),              count=args.requests, threads=args.threads)
+        pooled   = _rate(lambda: pool.Request("GET", url, timeout=1),       count=args.requests, threads=args.threads)
+        pool.Close()
+
+    print(f"{args.requests} GET requests, {args.threads} threads")
+    print(f"   unpooled (requests.get) : {unpooled:8.1f} req/s")
+    print(f"   pooled   (SessionPool)  : {pooled:8.1f} req/s")
+    print(f"   speedup                 : {pooled / unpooled:8.2f}x")
+
+if __name__ == "__main__":
+    main()
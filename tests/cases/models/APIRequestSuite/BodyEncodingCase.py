@@ -0,0 +1,91 @@
+# import libraries
+import gzip
+import json
+import logging
+from unittest import IsolatedAsyncioTestCase
+from urllib.parse import parse_qs
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.BodyEncoding import BodyEncoding
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.utils.RetryPolicy import RetryPolicy
+from ogd.apis.utils.SessionPool import SessionPool
+from tests.config.t_config import settings
+from tests.utils.StandInServer import StandInServer
+
+class BodyEncodingCase(IsolatedAsyncioTestCase):
+    BODY = {"events":[{"name":"click", "index":i} for i in range(200)]}
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="APIRequestTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def setUp(self):
+        self.server = StandInServer(value={"features":["x" * 50] * 100}, compress=True)
+        self.server.Start()
+        self.pool   = SessionPool()
+
+    async def asyncTearDown(self):
+        await self.pool.CloseAsync()
+        self.pool.Close()
+        self.server.Stop()
+
+    def _request(self, body, encoding:BodyEncoding=BodyEncoding.FORM, threshold=None) -> APIRequest:
+        return APIRequest(url=f"{self.server.Address}/hello", request_type=RESTType.POST, body=body, session_pool=self.pool,
+                          retry_policy=RetryPolicy.NoRetry(), body_encoding=encoding, compress_threshold=threshold)
+
+    def test_form_body(self):
+        response = self._request({"a":"1", "b":["2", "3"]}).Execute(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(parse_qs(self.server.LastBody.decode()), {"a":["1"], "b":["2", "3"]})
+        self.assertEqual(response.Timings.RequestBytes, len(self.server.LastBody))
+
+    def test_json_body(self):
+        response = self._request(self.BODY, encoding=BodyEncoding.JSON).Execute(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(self.server.LastHeaders["Content-Type"], "application/json")
+        self.assertNotIn("Content-Encoding", self.server.LastHeaders)
+        self.assertEqual(json.loads(self.server.LastBody), self.BODY)
+
+    def test_compressed_json_body(self):
+        response = self._request(self.BODY, encoding=BodyEncoding.JSON, threshold=1024).Execute(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(self.server.LastHeaders["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(self.server.LastBody)), self.BODY)
+
+        timings = response.Timings
+        self.assertEqual(timings.RequestWireBytes, len(self.server.LastBody))
+        self.assertLess(timings.RequestWireBytes, timings.RequestBytes)
+        # The stand-in server gzips its responses too, since the client asks for them.
+        self.assertIn("gzip", self.server.LastHeaders["Accept-Encoding"])
+        self.assertLess(timings.ResponseWireBytes, timings.ResponseBytes)
+
+    def test_small_body_not_compressed(self):
+        self._request({"a":"1"}, threshold=1024).Execute(logger=Logger.std_logger)
+        self.assertNotIn("Content-Encoding", self.server.LastHeaders)
+        self.assertEqual(self.server.LastBody, b"a=1")
+
+    def test_form_pairs_compressed(self):
+        pairs    = [("a", "1"), ("b", "2"), ("b", "3")] * 100
+        response = self._request(pairs, threshold=64).Execute(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(self.server.LastHeaders["Content-Encoding"], "gzip")
+        self.assertEqual(parse_qs(gzip.decompress(self.server.LastBody).decode()), {"a":["1"] * 100, "b":["2", "3"] * 100})
+
+    def test_form_list_not_pairs(self):
+        with self.assertRaises(TypeError):
+            self._request(["a", "b", "c"], threshold=64).Execute(logger=Logger.std_logger)
+
+    async def test_async_compressed(self):
+        if not SessionPool.AsyncSupported():
+            self.skipTest("aiohttp is not installed")
+        response = await self._request(self.BODY, encoding=BodyEncoding.JSON, threshold=1024).ExecuteAsync(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(json.loads(gzip.decompress(self.server.LastBody)), self.BODY)
+        self.assertLess(response.Timings.RequestWireBytes, response.Timings.RequestBytes)
+        self.assertLess(response.Timings.ResponseWireBytes, response.Timings.ResponseBytes)
@@ -0,0 +1,109 @@
+# import libraries
+import gzip
+import logging
+import mmap
+import tempfile
+import tracemalloc
+from unittest import IsolatedAsyncioTestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.models.ChunkedUpload import ChunkedUpload
+from ogd.apis.utils.RetryPolicy import RetryPolicy
+from ogd.apis.utils.SessionPool import SessionPool
+from tests.config.t_config import settings
+from tests.utils.StandInServer import StandInServer
+
+class ChunkedUploadCase(IsolatedAsyncioTestCase):
+    PAYLOAD = b"".join(f"{i:08d},session,click\n".encode() for i in range(20000))
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="APIRequestTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def setUp(self):
+        self.server = StandInServer(value={"foo":"bar"})
+        self.server.Start()
+        self.pool   = SessionPool()
+        self.file   = tempfile.TemporaryFile()
+        self.file.write(self.PAYLOAD)
+        self.file.seek(0)
+
+    async def asyncTearDown(self):
+        await self.pool.CloseAsync()
+        self.pool.Close()
+        self.server.Stop()
+        self.file.close()
+
+    def _request(self, body, policy:RetryPolicy=RetryPolicy.NoRetry(), threshold=None) -> APIRequest:
+        return APIRequest(url=f"{self.server.Address}/upload", request_type=RESTType.POST, body=body, session_pool=self.pool,
+                          retry_policy=policy, compress_threshold=threshold)
+
+    def test_IsStreamable(self):
+        async def _chunks():
+            yield b"chunk"
+        for body in (self.file, iter([b"chunk"]), (b"chunk" for _ in range(1)), _chunks(), ChunkedUpload(self.file)):
+            self.assertTrue(ChunkedUpload.IsStreamable(body), f"{type(body).__name__} should be streamed")
+        for body in (None, {"a":"1"}, "text", b"bytes", [("a", "1")], ("a", "b"), {"a", "b"}, range(3), {"a":"1"}.items()):
+            self.assertFalse(ChunkedUpload.IsStreamable(body), f"{type(body).__name__} should not be streamed")
+
+    def test_file_upload(self):
+        response = self._request(self.file).Execute(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(self.server.LastHeaders.get("Transfer-Encoding"), "chunked")
+        self.assertEqual(self.server.LastBody, self.PAYLOAD)
+        self.assertEqual(response.Timings.RequestBytes, len(self.PAYLOAD))
+
+    def test_generator_upload(self):
+        lines    = (f"{i},click\n" for i in range(1000))
+        response = self._request(lines).Execute(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(self.server.LastBody.decode(), "".join(f"{i},click\n" for i in range(1000)))
+
+    def test_mmap_upload_compressed(self):
+        with mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            response = self._request(mapped, threshold=1024).Execute(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(self.server.LastHeaders.get("Content-Encoding"), "gzip")
+        self.assertEqual(gzip.decompress(self.server.LastBody), self.PAYLOAD)
+        self.assertLess(response.Timings.RequestWireBytes, response.Timings.RequestBytes)
+
+    def test_retries(self):
+        policy = RetryPolicy(max_retries=1, base_delay=0.01, deadline=5.0)
+        self.server.QueueResponse(503)
+        response = self._request(self.file, policy=policy).Execute(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(self.server.RequestCount, 2)
+        self.assertEqual(self.server.LastBody, self.PAYLOAD)
+        # A generator can't be sent twice, so its request is not retried.
+        self.server.QueueResponse(503)
+        response = self._request(iter([b"once"]), policy=policy).Execute(logger=Logger.std_logger)
+        self.assertEqual(response.Status.value, 503)
+        self.assertEqual(self.server.RequestCount, 3)
+
+    def test_constant_memory(self):
+        with tempfile.TemporaryFile() as big:
+            big.truncate(32 * 1024 * 1024)
+            with mmap.mmap(big.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                upload = ChunkedUpload(mapped)
+                tracemalloc.start()
+                total = sum(len(chunk) for chunk in upload.Chunks())
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+        self.assertEqual(total, 32 * 1024 * 1024)
+        self.assertLess(peak, 1024 * 1024)
+
+    async def test_async_upload(self):
+        if not SessionPool.AsyncSupported():
+            self.skipTest("aiohttp is not installed")
+        async def _lines():
+            for i in range(100):
+                yield f"{i},click\n".encode()
+        response = await self._request(_lines()).ExecuteAsync(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(self.server.LastBody.decode(), "".join(f"{i},click\n" for i in range(100)))
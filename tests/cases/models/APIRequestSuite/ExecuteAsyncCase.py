@@ -0,0 +1,61 @@
+# import libraries
+import asyncio
+import logging
+from unittest import IsolatedAsyncioTestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.utils.SessionPool import SessionPool
+from tests.config.t_config import settings
+from tests.utils.StandInServer import StandInServer
+
+class ExecuteAsyncCase(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="APIRequestTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+        cls.server = StandInServer(value={"foo":"bar"})
+        cls.server.Start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.Stop()
+
+    def setUp(self):
+        self.pool = SessionPool()
+
+    async def asyncTearDown(self):
+        await self.pool.CloseAsync()
+        self.pool.Close()
+
+    async def test_get(self):
+        request = APIRequest(url=f"{self.server.Address}/hello", request_type=RESTType.GET, params={"ids":[1, 2], "skip":None}, session_pool=self.pool)
+        response : APIResponse = await request.ExecuteAsync(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(response.Type, RESTType.GET)
+        self.assertEqual(response.Value, {"foo":"bar"})
+
+    async def test_post(self):
+        request = APIRequest(url=f"{self.server.Address}/hello", request_type=RESTType.POST, body={"foo":"bar"}, session_pool=self.pool)
+        response : APIResponse = await request.ExecuteAsync(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(response.Type, RESTType.POST)
+
+    async def test_gather(self):
+        requests = [APIRequest(url=f"{self.server.Address}/hello/{i}", request_type=RESTType.GET, session_pool=self.pool) for i in range(10)]
+        responses = await asyncio.gather(*[request.ExecuteAsync(logger=Logger.std_logger) for request in requests])
+        self.assertEqual(len(responses), 10)
+        self.assertTrue(all(response.OK for response in responses))
+
+    async def test_unreachable(self):
+        # Nothing listens on port 9 locally, so this should fail with a connection error rather than a timeout.
+        request = APIRequest(url="http://127.0.0.1:9/hello", request_type=RESTType.GET, session_pool=self.pool)
+        response : APIResponse = await request.ExecuteAsync(logger=Logger.std_logger)
+        self.assertEqual(response.Status, ResponseStatus.INTERNAL_ERR)
@@ -0,0 +1,54 @@
+# import libraries
+import logging
+from unittest import TestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.BatchMode import BatchMode
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from tests.config.t_config import settings
+from tests.utils.StandInServer import StandInServer
+
+class ExecuteManyCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="APIRequestTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+        cls.server = StandInServer(value={"foo":"bar"})
+        cls.server.Start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.Stop()
+
+    def test_empty(self):
+        self.assertEqual(APIRequest.ExecuteMany([]), [])
+
+    def test_gather_all_preserves_order(self):
+        batch = [APIRequest(url=f"{self.server.Address}/item/{i}", request_type=RESTType.GET) for i in range(20)]
+        responses = APIRequest.ExecuteMany(batch, max_workers=8, max_per_host=3, logger=Logger.std_logger)
+        self.assertEqual(len(responses), 20)
+        for i, response in enumerate(responses):
+            self.assertTrue(response.OK, f"Bad status for request {i}: {response.Status}")
+            self.assertTrue(response.Message.endswith(f"/item/{i}"), f"Response {i} out of order: {response.Message}")
+
+    def test_gather_all_keeps_going(self):
+        batch = [APIRequest(url="http://127.0.0.1:9/broken", request_type=RESTType.GET)] \
+              + [APIRequest(url=f"{self.server.Address}/item/{i}", request_type=RESTType.GET) for i in range(3)]
+        responses = APIRequest.ExecuteMany(batch, max_workers=1, logger=Logger.std_logger)
+        self.assertEqual(responses[0].Status, ResponseStatus.INTERNAL_ERR)
+        self.assertTrue(all(response.OK for response in responses[1:]))
+
+    def test_fail_fast(self):
+        batch = [APIRequest(url="http://127.0.0.1:9/broken", request_type=RESTType.GET)] \
+              + [APIRequest(url=f"{self.server.Address}/item/{i}", request_type=RESTType.GET) for i in range(3)]
+        responses = APIRequest.ExecuteMany(batch, max_workers=1, mode=BatchMode.FAIL_FAST, logger=Logger.std_logger)
+        self.assertEqual(len(responses), 4)
+        self.assertEqual(responses[0].Status, ResponseStatus.INTERNAL_ERR)
+        for response in responses[1:]:
+            self.assertEqual(response.Status, ResponseStatus.FAILED_DEPENDENCY)
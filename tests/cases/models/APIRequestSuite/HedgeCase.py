@@ -0,0 +1,121 @@
+# import libraries
+import logging
+import time
+from typing import Optional
+from unittest import IsolatedAsyncioTestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.CircuitState import CircuitState
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.utils.CircuitBreaker import CircuitBreaker
+from ogd.apis.utils.HedgePolicy import HedgePolicy
+from ogd.apis.utils.LatencyRecorder import LatencyRecorder
+from ogd.apis.utils.RetryPolicy import RetryPolicy
+from ogd.apis.utils.SessionPool import SessionPool
+from tests.config.t_config import settings
+from tests.utils.StandInServer import StandInServer
+
+class HedgeCase(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="APIRequestTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def setUp(self):
+        self.server = StandInServer(value={"foo":"bar"})
+        self.server.Start()
+        self.pool   = SessionPool()
+        self.policy = RetryPolicy(max_retries=0, deadline=5.0)
+
+    async def asyncTearDown(self):
+        await self.pool.CloseAsync()
+        self.pool.Close()
+        self.server.Stop()
+
+    def _request(self, hedge:Optional[HedgePolicy], url:str, breaker:Optional[CircuitBreaker]=None) -> APIRequest:
+        return APIRequest(url=f"{url}/hello", request_type=RESTType.GET, timeout=5, session_pool=self.pool,
+                          retry_policy=self.policy, hedge_policy=hedge, circuit_breaker=breaker)
+
+    def _halfOpenBreaker(self) -> CircuitBreaker:
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        breaker.RecordFailure(f"{self.server.Address}/hello")
+        time.sleep(0.1)
+        self.assertEqual(breaker.State(self.server.Address), CircuitState.HALF_OPEN)
+        return breaker
+
+    def test_fast_response_not_hedged(self):
+        hedge = HedgePolicy(delay=1.0)
+        response = self._request(hedge, self.server.Address).Execute(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual((hedge.Requests, hedge.Hedged, hedge.Wins), (1, 0, 0))
+        self.assertEqual(self.server.RequestCount, 1)
+
+    def test_hedge_wins(self):
+        self.server.QueueResponse(200, delay=1.0)
+        hedge = HedgePolicy(delay=0.05)
+        start = time.perf_counter()
+        response = self._request(hedge, self.server.Address).Execute(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual((hedge.Requests, hedge.Hedged, hedge.Wins), (1, 1, 1))
+
+    def test_hedge_to_alternate(self):
+        with StandInServer(value={"from":"alternate"}) as alternate:
+            self.server.QueueResponse(200, delay=1.0)
+            hedge = HedgePolicy(delay=0.05, alternates=[alternate.Address])
+            response = self._request(hedge, self.server.Address).Execute(logger=Logger.std_logger)
+        self.assertEqual(response.Value, {"from":"alternate"})
+        self.assertEqual(hedge.Wins, 1)
+
+    def test_hedge_wins_half_open(self):
+        breaker = self._halfOpenBreaker()
+        with StandInServer(value={"from":"alternate"}) as alternate:
+            self.server.QueueResponse(200, delay=0.3)
+            hedge = HedgePolicy(delay=0.05, alternates=[alternate.Address])
+            response = self._request(hedge, self.server.Address, breaker=breaker).Execute(logger=Logger.std_logger)
+        self.assertEqual(response.Value, {"from":"alternate"})
+        # Once the losing attempt to the primary finishes, it must give up its trial slot, so later requests still reach the server.
+        time.sleep(0.5)
+        sent = self.server.RequestCount
+        response = self._request(None, self.server.Address, breaker=breaker).Execute(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(self.server.RequestCount, sent + 1)
+
+    def test_percentile_delay(self):
+        recorder = LatencyRecorder(bounds=[0.01, 0.1, 1.0])
+        hedge    = HedgePolicy(percentile=90, min_samples=3, max_delay=0.5)
+        url      = f"{self.server.Address}/hello"
+        self.assertEqual(hedge.Delay(url, recorder=recorder), 0.5)
+        for _ in range(3):
+            APIRequest(url=url, request_type=RESTType.GET, session_pool=self.pool, latency_recorder=recorder).Execute()
+        self.assertLessEqual(hedge.Delay(url, recorder=recorder), 0.1)
+
+    async def test_async_hedge_wins(self):
+        if not SessionPool.AsyncSupported():
+            self.skipTest("aiohttp is not installed")
+        with StandInServer(value={"from":"alternate"}) as alternate:
+            self.server.QueueResponse(200, delay=1.0)
+            hedge = HedgePolicy(delay=0.05, alternates=[alternate.Address])
+            response = await self._request(hedge, self.server.Address).ExecuteAsync(logger=Logger.std_logger)
+        self.assertEqual(response.Value, {"from":"alternate"})
+        self.assertEqual((hedge.Requests, hedge.Hedged, hedge.Wins), (1, 1, 1))
+
+    async def test_async_hedge_wins_half_open(self):
+        if not SessionPool.AsyncSupported():
+            self.skipTest("aiohttp is not installed")
+        breaker = self._halfOpenBreaker()
+        with StandInServer(value={"from":"alternate"}) as alternate:
+            self.server.QueueResponse(200, delay=0.3)
+            hedge = HedgePolicy(delay=0.05, alternates=[alternate.Address])
+            response = await self._request(hedge, self.server.Address, breaker=breaker).ExecuteAsync(logger=Logger.std_logger)
+        self.assertEqual(response.Value, {"from":"alternate"})
+        # The losing attempt to the primary is cancelled, which must free its trial slot.
+        sent = self.server.RequestCount
+        response = await self._request(None, self.server.Address, breaker=breaker).ExecuteAsync(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(self.server.RequestCount, sent + 1)
+        self.assertEqual(hedge.HedgeRate, 1.0)
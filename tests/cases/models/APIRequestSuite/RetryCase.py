@@ -0,0 +1,83 @@
+# import libraries
+import logging
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.utils.RetryPolicy import RetryPolicy
+from tests.config.t_config import settings
+from tests.utils.StandInServer import StandInServer
+
+class RetryCase(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="APIRequestTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def setUp(self):
+        self.server = StandInServer(value={"foo":"bar"})
+        self.server.Start()
+        self.policy = RetryPolicy(max_retries=3, base_delay=0.01, max_delay=0.05, deadline=5.0)
+
+    def tearDown(self):
+        self.server.Stop()
+
+    def test_retries_unavailable(self):
+        self.server.QueueResponse(503, count=2)
+        request = APIRequest(url=f"{self.server.Address}/hello", request_type=RESTType.GET, retry_policy=self.policy)
+        response = request.Execute(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(self.server.RequestCount, 3)
+
+    def test_gives_up_after_max_retries(self):
+        self.server.QueueResponse(429, count=10)
+        request = APIRequest(url=f"{self.server.Address}/hello", request_type=RESTType.GET, retry_policy=self.policy)
+        response = request.Execute(logger=Logger.std_logger)
+        self.assertEqual(response.Status, ResponseStatus.TOO_MANY_REQUESTS)
+        self.assertEqual(self.server.RequestCount, 4)
+
+    def test_retry_after_past_deadline(self):
+        self.server.QueueResponse(503, count=1, headers={"Retry-After":"60"})
+        request = APIRequest(url=f"{self.server.Address}/hello", request_type=RESTType.GET, retry_policy=self.policy)
+        response = request.Execute(logger=Logger.std_logger)
+        self.assertEqual(response.Status, ResponseStatus.UNAVAILABLE)
+        self.assertEqual(self.server.RequestCount, 1)
+
+    def test_long_timeout_not_capped(self):
+        request = APIRequest(url=f"{self.server.Address}/hello", request_type=RESTType.GET, timeout=30, retry_policy=RetryPolicy.Default())
+        timeouts = []
+        send = request._send
+        def _spy(url, timeout, **kwargs):
+            timeouts.append(timeout)
+            return send(url, timeout=timeout, **kwargs)
+        with patch.object(request, "_send", side_effect=_spy):
+            response = request.Execute(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(timeouts, [30])
+
+    def test_no_retry(self):
+        self.server.QueueResponse(503, count=1)
+        request = APIRequest(url=f"{self.server.Address}/hello", request_type=RESTType.GET, retry_policy=RetryPolicy.NoRetry())
+        response = request.Execute(logger=Logger.std_logger)
+        self.assertEqual(response.Status, ResponseStatus.UNAVAILABLE)
+        self.assertEqual(self.server.RequestCount, 1)
+
+    async def test_async_retries_unavailable(self):
+        self.server.QueueResponse(503, count=2)
+        request = APIRequest(url=f"{self.server.Address}/hello", request_type=RESTType.GET, retry_policy=self.policy)
+        response = await request.ExecuteAsync(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(self.server.RequestCount, 3)
+
+    async def test_async_retries_timeout(self):
+        self.server.QueueResponse(200, count=1, delay=1.5)
+        request = APIRequest(url=f"{self.server.Address}/hello", request_type=RESTType.GET, timeout=1, retry_policy=self.policy)
+        response = await request.ExecuteAsync(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(self.server.RequestCount, 2)
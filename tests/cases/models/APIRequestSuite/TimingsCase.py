@@ -0,0 +1,81 @@
+# import libraries
+import logging
+from unittest import IsolatedAsyncioTestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.LatencyPhase import LatencyPhase
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.utils.LatencyRecorder import LatencyRecorder
+from ogd.apis.utils.RetryPolicy import RetryPolicy
+from ogd.apis.utils.SessionPool import SessionPool
+from tests.config.t_config import settings
+from tests.utils.StandInServer import StandInServer
+
+class TimingsCase(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="APIRequestTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def setUp(self):
+        self.server   = StandInServer(value={"foo":"bar"})
+        self.server.Start()
+        self.pool     = SessionPool()
+        self.recorder = LatencyRecorder()
+        self.policy   = RetryPolicy(max_retries=3, base_delay=0.01, max_delay=0.05, deadline=5.0)
+
+    async def asyncTearDown(self):
+        await self.pool.CloseAsync()
+        self.pool.Close()
+        self.server.Stop()
+
+    def _request(self, body=None) -> APIRequest:
+        return APIRequest(url=f"{self.server.Address}/hello", request_type=RESTType.POST if body else RESTType.GET, body=body,
+                          session_pool=self.pool, retry_policy=self.policy, latency_recorder=self.recorder)
+
+    def test_phases(self):
+        first  = self._request().Execute(logger=Logger.std_logger)
+        second = self._request(body={"a":"1"}).Execute(logger=Logger.std_logger)
+        self.assertTrue(first.OK, f"Bad status: {first.Status}")
+
+        timings = first.Timings
+        self.assertIsNotNone(timings)
+        for phase in LatencyPhase:
+            self.assertIsNotNone(timings.Phase(phase), f"Missing {phase} timing")
+        self.assertGreaterEqual(timings.Phase(LatencyPhase.TOTAL), timings.Phase(LatencyPhase.FIRST_BYTE))
+        self.assertGreater(timings.ResponseBytes, 0)
+        # The second request reuses the pooled connection, so has no connect time.
+        self.assertIsNone(second.Timings.Phase(LatencyPhase.CONNECT))
+        self.assertEqual(second.Timings.RequestBytes, len("a=1"))
+
+        self.assertEqual(self.recorder.Histogram(self.server.Address, LatencyPhase.TOTAL).Count, 2)
+        self.assertEqual(self.recorder.Histogram(self.server.Address, LatencyPhase.CONNECT).Count, 1)
+
+    def test_lazy_decode_recorded(self):
+        response = self._request().Execute()
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(self.recorder.Histogram(self.server.Address, LatencyPhase.TOTAL).Count, 1)
+        self.assertEqual(self.recorder.Histogram(self.server.Address, LatencyPhase.DECODE).Count, 0)
+        self.assertEqual(response.Value, {"foo":"bar"})
+        self.assertEqual(self.recorder.Histogram(self.server.Address, LatencyPhase.DECODE).Count, 1)
+        self.assertIsNotNone(response.Message)
+        self.assertEqual(self.recorder.Histogram(self.server.Address, LatencyPhase.DECODE).Count, 1)
+
+    def test_retries_counted(self):
+        self.server.QueueResponse(503, count=2)
+        response = self._request().Execute(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(response.Timings.Retries, 2)
+        self.assertEqual(self.recorder.AsDict[SessionPool.HostKey(self.server.Address)]["retries"], 2)
+
+    async def test_async_phases(self):
+        if not SessionPool.AsyncSupported():
+            self.skipTest("aiohttp is not installed")
+        response = await self._request().ExecuteAsync(logger=Logger.std_logger)
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        for phase in LatencyPhase:
+            self.assertIsNotNone(response.Timings.Phase(phase), f"Missing {phase} timing")
@@ -0,0 +1,68 @@
+# import libraries
+import io
+import json
+import logging
+from unittest import TestCase
+# import 3rd-party libraries
+import requests
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.models.APIResponseStream import APIResponseStream
+from ogd.apis.utils.RetryPolicy import RetryPolicy
+from tests.config.t_config import settings
+from tests.utils.StandInServer import StandInServer
+
+def _fakeResponse(body:bytes, status:int=200) -> requests.Response:
+    ret_val = requests.Response()
+    ret_val.status_code = status
+    ret_val.raw         = io.BytesIO(body)
+    return ret_val
+
+class BasicCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="APIResponseStreamTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def test_envelope_before_val(self):
+        body = json.dumps({"type":"GET", "msg":"hi", "val":{"a":1, "b":[1, 2], "c":"x"}}).encode("utf-8")
+        stream = APIResponseStream.FromResponse(_fakeResponse(body), chunk_size=3)
+        self.assertEqual(stream.Status, ResponseStatus.OK)
+        self.assertEqual(stream.Type, RESTType.GET)
+        self.assertEqual(stream.Message, "hi")
+        self.assertEqual(list(stream.IterValue()), [("a", 1), ("b", [1, 2]), ("c", "x")])
+
+    def test_list_val_with_message_after(self):
+        body = json.dumps({"type":"GET", "val":[10, 2.5, "é", None, {"k":12345}], "msg":"later"}).encode("utf-8")
+        stream = APIResponseStream.FromResponse(_fakeResponse(body), chunk_size=2)
+        self.assertIsNone(stream.Message)
+        self.assertEqual(list(stream.IterValue()), [10, 2.5, "é", None, {"k":12345}])
+        self.assertEqual(stream.Message, "later")
+        with self.assertRaises(RuntimeError):
+            list(stream.IterValue())
+
+    def test_iter_chunks(self):
+        body = json.dumps({"type":"GET", "val":list(range(100)), "msg":""}).encode("utf-8")
+        stream = APIResponseStream.FromResponse(_fakeResponse(body), chunk_size=7)
+        self.assertEqual(b"".join(stream.IterChunks()), body)
+
+    def test_not_json(self):
+        stream = APIResponseStream.FromResponse(_fakeResponse(b"Internal Server Error", status=500), chunk_size=4)
+        self.assertEqual(stream.Status, ResponseStatus.INTERNAL_ERR)
+        self.assertEqual(stream.Message, "Internal Server Error")
+        self.assertIsNone(stream.Value)
+
+    def test_execute_stream(self):
+        with StandInServer(value={"foo":"bar", "baz":[1, 2, 3]}) as server:
+            request = APIRequest(url=f"{server.Address}/hello", request_type=RESTType.GET, retry_policy=RetryPolicy.NoRetry())
+            with request.ExecuteStream(logger=Logger.std_logger, chunk_size=8) as stream:
+                response = stream.ToAPIResponse()
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(response.Value, {"foo":"bar", "baz":[1, 2, 3]})
+        self.assertEqual(response.Message, "Stand-in server handled GET /hello")
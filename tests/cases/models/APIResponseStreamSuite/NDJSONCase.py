@@ -0,0 +1,77 @@
+# import libraries
+import logging
+from typing import Iterator
+from unittest import TestCase
+# import 3rd-party libraries
+from flask import Flask
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.models.RecordedExchange import RecordedExchange
+from ogd.apis.utils.CircuitBreaker import CircuitBreaker
+from ogd.apis.utils.ReplayTransport import ReplayTransport
+from ogd.apis.utils.RetryPolicy import RetryPolicy
+from tests.config.t_config import settings
+
+def _rows(count:int, fail_at:int=-1) -> Iterator[dict]:
+    for i in range(count):
+        if i == fail_at:
+            raise RuntimeError("Lost connection to the database")
+        yield {"session_id":f"session{i}", "events":i}
+
+class NDJSONCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="APIResponseStreamTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+        cls.application = Flask(__name__)
+        cls.application.add_url_rule("/sessions", "sessions", lambda: cls._response().AsNegotiatedResponse(rows=_rows(500)))
+        cls.server = cls.application.test_client()
+
+    @staticmethod
+    def _response() -> APIResponse:
+        return APIResponse(req_type=RESTType.GET, val=None, msg="Sessions", status=ResponseStatus.OK)
+
+    def _stream(self, body:bytes):
+        exchange = RecordedExchange(method="GET", url="http://exports.test/sessions", params=[], status=200,
+                                    headers={"Content-Type":"application/x-ndjson"}, body=body)
+        request  = APIRequest(url="http://exports.test/sessions", request_type=RESTType.GET, transport=ReplayTransport([exchange]),
+                              retry_policy=RetryPolicy.NoRetry(), circuit_breaker=CircuitBreaker(failure_threshold=0))
+        return request.ExecuteStream(chunk_size=100, accept="application/x-ndjson")
+
+    def test_Negotiated(self):
+        ndjson = self.server.get("/sessions", headers={"Accept":"application/x-ndjson"})
+        self.assertEqual(ndjson.mimetype, "application/x-ndjson")
+        self.assertEqual(len(ndjson.data.splitlines()), 502)
+        envelope = self.server.get("/sessions", headers={"Accept":"application/json, */*;q=0.1"})
+        self.assertEqual(envelope.mimetype, "application/json")
+        self.assertEqual(len(envelope.json["val"]), 500)
+
+    def test_RowByRow(self):
+        body = b"".join(self._response().IterNDJSONBytes(rows=_rows(500), chunk_size=256))
+        with self._stream(body) as stream:
+            self.assertEqual(stream.Type, RESTType.GET)
+            rows = stream.IterValue()
+            self.assertEqual(next(rows), {"session_id":"session0", "events":0})
+            self.assertEqual(sum(1 for _ in rows), 499)
+            self.assertEqual(stream.Status, ResponseStatus.OK)
+
+    def test_FailedPartway(self):
+        body = b"".join(self._response().IterNDJSONBytes(rows=_rows(500, fail_at=300)))
+        with self._stream(body) as stream:
+            self.assertEqual(len(stream.Value), 300)
+            self.assertEqual(stream.Status, ResponseStatus.INTERNAL_ERR)
+            self.assertIn("300 rows", stream.Message)
+
+    def test_Truncated(self):
+        body = b"".join(self._response().IterNDJSONBytes(rows=_rows(10)))
+        with self._stream(body[:body.rindex(b'{"status"')]) as stream:
+            with self.assertRaises(ValueError):
+                list(stream.IterValue())
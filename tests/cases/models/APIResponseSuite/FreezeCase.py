@@ -0,0 +1,52 @@
+# import libraries
+import gzip
+import json
+import logging
+from unittest import TestCase
+# import 3rd-party libraries
+from flask import Flask
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIResponse import APIResponse
+from tests.config.t_config import settings
+
+
+class FreezeCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="APIResponseTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+        cls.application = Flask(__name__)
+
+    def setUp(self):
+        self.response : APIResponse = APIResponse(req_type=RESTType.GET, val={"rows":list(range(1000))}, msg="Complete", status=ResponseStatus.OK).Freeze()
+
+    def test_Memoized(self):
+        self.assertTrue(self.response.Frozen)
+        encoded = self.response.AsJSONBytes
+        self.assertEqual(self.response.Value["rows"][-1], 999)
+        self.assertIs(self.response.AsJSONBytes, encoded)
+
+    def test_Invalidated(self):
+        encoded = self.response.AsJSONBytes
+        self.response.RequestSucceeded(msg="Updated", val={"rows":[]})
+        self.assertIsNot(self.response.AsJSONBytes, encoded)
+        self.assertEqual(json.loads(self.response.AsJSONBytes)["msg"], "SUCCESS: Updated")
+        self.response.ServerErrored(msg="Broken")
+        self.assertEqual(self.response.AsFlaskResponse.status_code, 500)
+        self.assertEqual(json.loads(self.response.AsJSONBytes)["msg"], "SERVER ERROR: Broken")
+
+    def test_CompressedOnce(self):
+        with self.application.test_request_context(headers={"Accept-Encoding":"gzip"}):
+            first  = self.response.AsFlaskResponse
+            second = self.response.AsFlaskResponse
+        self.assertEqual(first.headers.get("Content-Encoding"), "gzip")
+        self.assertIs(first.response[0], second.response[0])
+        self.assertEqual(gzip.decompress(first.get_data()), self.response.AsJSONBytes)
+        with self.application.test_request_context():
+            self.assertEqual(self.response.AsFlaskResponse.get_data(), self.response.AsJSONBytes)
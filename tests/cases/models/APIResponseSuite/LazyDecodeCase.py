@@ -0,0 +1,65 @@
+# import libraries
+import logging
+from unittest import TestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.LatencyPhase import LatencyPhase
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.models.RequestTimings import RequestTimings
+from tests.config.t_config import settings
+
+
+class LazyDecodeCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="APIResponseTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def setUp(self):
+        self.body     : bytes          = b'{"type": "GET", "val": {"foo": "bar"}, "msg": "Complete", "extra": 1}'
+        self.timings  : RequestTimings = RequestTimings()
+        self.response : APIResponse    = APIResponse.FromContent(self.body, status_code=200, timings=self.timings)
+
+    def test_Slots(self):
+        with self.assertRaises(AttributeError):
+            self.response.__dict__
+
+    def test_StatusWithoutDecoding(self):
+        self.assertTrue(self.response.OK)
+        self.assertIsNone(self.timings.Phase(LatencyPhase.DECODE))
+
+    def test_PassThrough(self):
+        self.assertEqual(self.response.Type, RESTType.GET)
+        self.assertEqual(self.response.Message, "Complete")
+        self.assertIs(self.response.AsJSONBytes, self.response.AsJSONBytes)
+        self.assertEqual(self.response.AsJSONBytes, self.body)
+        self.assertIsNotNone(self.timings.Phase(LatencyPhase.DECODE))
+
+    def test_ReencodedAfterChange(self):
+        self.response.RequestErrored("bad input")
+        self.assertNotIn(b"extra", self.response.AsJSONBytes)
+        self.assertEqual(self.response.Value, {"foo":"bar"})
+        self.assertEqual(self.response.Message, "ERROR: bad input")
+
+    def test_InvalidBody(self):
+        _response = APIResponse.FromContent(b'{"unterminated": ', status_code=502)
+        self.assertEqual(_response.Message, '{"unterminated": ')
+        self.assertIsNone(_response.Value)
+        self.assertNotEqual(_response.AsJSONBytes, b'{"unterminated": ')
+
+    def test_MalformedBody(self):
+        # Bodies that look like a JSON object, but aren't a well-formed envelope, are never passed through.
+        _response = APIResponse.FromContent(b'{"val": }', status_code=200)
+        self.assertNotEqual(_response.AsJSONBytes, b'{"val": }')
+        self.assertEqual(_response.Message, '{"val": }')
+        _response = APIResponse.FromContent(b'{"foo": "bar"}', status_code=200)
+        self.assertNotIn(b"foo", b"".join(_response.IterJSONBytes()))
+
+    def test_StringValue(self):
+        _response = APIResponse(req_type=RESTType.GET, val='{"foo": "bar"}', msg="Complete", status=ResponseStatus.OK)
+        self.assertEqual(_response.Value, {"foo":"bar"})
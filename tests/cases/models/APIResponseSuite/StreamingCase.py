@@ -0,0 +1,43 @@
+# import libraries
+import json
+import logging
+from unittest import TestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIResponse import APIResponse
+from tests.config.t_config import settings
+
+
+class StreamingCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="APIResponseTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def setUp(self):
+        self.val      : dict        = {"columns":["id", "count"], "rows":[[f"session{i}", i] for i in range(5000)], 1:{"nested":True}}
+        self.response : APIResponse = APIResponse(req_type=RESTType.GET, val=self.val, msg="Complete", status=ResponseStatus.OK)
+
+    def test_IterJSONBytes(self):
+        chunks = list(self.response.IterJSONBytes(chunk_size=4096))
+        self.assertGreater(len(chunks), 10)
+        self.assertTrue(all(len(chunk) < 2 * 4096 for chunk in chunks))
+        body = b"".join(chunks)
+        self.assertEqual(json.loads(body), json.loads(self.response.AsJSONBytes))
+        self.assertLess(body.index(b'"msg"'), body.index(b'"val"'))
+
+    def test_AsFlaskStream(self):
+        flask_response = self.response.AsFlaskStream(chunk_size=4096)
+        self.assertTrue(flask_response.is_streamed)
+        self.assertEqual(flask_response.status_code, 200)
+        self.assertEqual(json.loads(b"".join(flask_response.response))["val"]["rows"][-1], ["session4999", 4999])
+
+    def test_PassThrough(self):
+        body      = self.response.AsJSONBytes
+        _response = APIResponse.FromContent(body, status_code=200)
+        self.assertEqual(b"".join(_response.IterJSONBytes(chunk_size=1000)), body)
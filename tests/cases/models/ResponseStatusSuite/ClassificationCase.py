@@ -0,0 +1,35 @@
+# import libraries
+import logging
+from unittest import TestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.StatusClass import StatusClass
+from tests.config.t_config import settings
+
+
+class ClassificationCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="ResponseStatusTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def test_Class(self):
+        self.assertEqual(ResponseStatus.NONE.Class,          StatusClass.NONE)
+        self.assertEqual(ResponseStatus.EARLY_HINTS.Class,   StatusClass.INFORMATIONAL)
+        self.assertEqual(ResponseStatus.IM_USED.Class,       StatusClass.SUCCESS)
+        self.assertEqual(ResponseStatus.NOT_MODIFIED.Class,  StatusClass.REDIRECT)
+        self.assertEqual(ResponseStatus.ILLEGAL.Class,       StatusClass.CLIENT_ERROR)
+        self.assertEqual(ResponseStatus.LOOP_DETECTED.Class, StatusClass.SERVER_ERROR)
+
+    def test_Tables(self):
+        for status in ResponseStatus:
+            self.assertEqual(status in ResponseStatus.SuccessStatuses(), 200 <= status.value < 300)
+            self.assertEqual(status in ResponseStatus.ClientErrors(),    400 <= status.value < 500)
+            self.assertEqual(status in ResponseStatus.ServerErrors(),    500 <= status.value < 600)
+        # The tables are built once, and shared rather than rebuilt on each call.
+        self.assertIs(ResponseStatus.SuccessStatuses(), ResponseStatus.SuccessStatuses())
+        self.assertIsInstance(ResponseStatus.ServerErrors(), frozenset)
@@ -0,0 +1,39 @@
+# import libraries
+import logging
+from unittest import TestCase
+# import 3rd-party libraries
+from flask import Flask
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.configs.ServerConfig import ServerConfig
+from ogd.apis.utils.APIUtils import configure_app
+from ogd.apis.utils.ResponseCompressor import ResponseCompressor
+from ogd.apis.HelloAPI import HelloAPI
+from tests.config.t_config import settings
+
+class ConfigureAppCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="APIUtilsTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+        cls.server_config = ServerConfig.FromDict(name="ConfigureAppTestServer", unparsed_elements={"API_VERSION":"0.0.0-Testing", "COMPRESS_MIN_SIZE":123})
+
+    def tearDown(self):
+        ResponseCompressor.Configure()
+
+    def test_register_has_no_side_effects(self):
+        compressor  = ResponseCompressor.Default()
+        application = Flask(__name__)
+        HelloAPI.register(app=application, server_config=self.server_config)
+        self.assertNotIn(ResponseCompressor.AfterRequest, application.after_request_funcs.get(None, []))
+        self.assertIs(ResponseCompressor.Default(), compressor)
+
+    def test_configure_app(self):
+        application = Flask(__name__)
+        configure_app(app=application, server_config=self.server_config)
+        configure_app(app=application, server_config=self.server_config)
+        self.assertEqual(application.after_request_funcs.get(None, []).count(ResponseCompressor.AfterRequest), 1)
+        self.assertEqual(ResponseCompressor.Default().MinSize, 123)
@@ -0,0 +1,111 @@
+# import libraries
+import logging
+import time
+from unittest import TestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.CircuitState import CircuitState
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.utils.CircuitBreaker import CircuitBreaker
+from ogd.apis.utils.RetryPolicy import RetryPolicy
+from tests.config.t_config import settings
+
+class BasicCase(TestCase):
+    URL = "https://host.one/path/to/endpoint"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="CircuitBreakerTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def setUp(self):
+        self.breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=0.1)
+
+    def test_starts_closed(self):
+        self.assertEqual(self.breaker.State(self.URL), CircuitState.CLOSED)
+        self.assertTrue(self.breaker.Allow(self.URL))
+
+    def test_opens_after_threshold(self):
+        for _ in range(3):
+            self.breaker.RecordFailure(self.URL)
+        self.assertEqual(self.breaker.State(self.URL), CircuitState.OPEN)
+        self.assertFalse(self.breaker.Allow(self.URL))
+        self.assertEqual(self.breaker.States, {"https://host.one": CircuitState.OPEN})
+        self.assertEqual(self.breaker.AsDict["https://host.one"]["state"], "OPEN")
+
+    def test_success_resets_failures(self):
+        self.breaker.RecordFailure(self.URL)
+        self.breaker.RecordFailure(self.URL)
+        self.breaker.RecordResult(self.URL, status=ResponseStatus.OK)
+        self.breaker.RecordFailure(self.URL)
+        self.assertEqual(self.breaker.State(self.URL), CircuitState.CLOSED)
+
+    def test_half_open_trial(self):
+        for _ in range(3):
+            self.breaker.RecordResult(self.URL, status=ResponseStatus.UNAVAILABLE)
+        time.sleep(0.15)
+        self.assertEqual(self.breaker.State(self.URL), CircuitState.HALF_OPEN)
+        permit = self.breaker.Allow(self.URL)
+        self.assertTrue(permit is not None and permit.Trial)
+        # only one trial at a time by default
+        self.assertIsNone(self.breaker.Allow(self.URL))
+        self.breaker.RecordSuccess(self.URL, permit=permit)
+        self.assertEqual(self.breaker.State(self.URL), CircuitState.CLOSED)
+
+    def test_half_open_counts_only_trials(self):
+        straggler = self.breaker.Allow(self.URL)
+        for _ in range(3):
+            self.breaker.RecordFailure(self.URL)
+        time.sleep(0.15)
+        trial = self.breaker.Allow(self.URL)
+        # A request let through before the circuit opened, or recorded without its permit, is not a trial.
+        self.breaker.RecordSuccess(self.URL, permit=straggler)
+        self.breaker.RecordResult(self.URL, status=ResponseStatus.OK)
+        self.assertEqual(self.breaker.State(self.URL), CircuitState.HALF_OPEN)
+        self.assertIsNone(self.breaker.Allow(self.URL))
+        self.breaker.RecordSuccess(self.URL, permit=trial)
+        self.assertEqual(self.breaker.State(self.URL), CircuitState.CLOSED)
+
+    def test_stale_trial_not_counted(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.1, half_open_max_calls=2)
+        breaker.RecordFailure(self.URL)
+        time.sleep(0.15)
+        stale = breaker.Allow(self.URL)
+        breaker.RecordFailure(self.URL, permit=breaker.Allow(self.URL))
+        time.sleep(0.15)
+        trial = breaker.Allow(self.URL)
+        # The first trial belongs to the earlier half-open period, so neither counts nor frees a slot of this one.
+        breaker.RecordSuccess(self.URL, permit=stale)
+        breaker.Release(self.URL, permit=stale)
+        self.assertEqual(breaker.State(self.URL), CircuitState.HALF_OPEN)
+        self.assertIsNotNone(breaker.Allow(self.URL))
+        self.assertIsNone(breaker.Allow(self.URL))
+        breaker.RecordSuccess(self.URL, permit=trial)
+        self.assertEqual(breaker.State(self.URL), CircuitState.CLOSED)
+
+    def test_half_open_failure_reopens(self):
+        for _ in range(3):
+            self.breaker.RecordFailure(self.URL)
+        time.sleep(0.15)
+        self.assertTrue(self.breaker.Allow(self.URL))
+        self.breaker.RecordFailure(self.URL)
+        self.assertEqual(self.breaker.State(self.URL), CircuitState.OPEN)
+
+    def test_disabled(self):
+        breaker = CircuitBreaker(failure_threshold=0)
+        for _ in range(10):
+            breaker.RecordFailure(self.URL)
+        self.assertTrue(breaker.Allow(self.URL))
+
+    def test_request_fails_fast(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+        url = "http://127.0.0.1:9/hello"
+        first = APIRequest(url=url, request_type=RESTType.GET, retry_policy=RetryPolicy.NoRetry(), circuit_breaker=breaker).Execute(logger=Logger.std_logger)
+        self.assertEqual(first.Status, ResponseStatus.INTERNAL_ERR)
+        second = APIRequest(url=url, request_type=RESTType.GET, retry_policy=RetryPolicy.NoRetry(), circuit_breaker=breaker).Execute(logger=Logger.std_logger)
+        self.assertEqual(second.Status, ResponseStatus.UNAVAILABLE)
@@ -0,0 +1,78 @@
+# import libraries
+import logging
+from datetime import datetime, timezone
+from unittest import TestCase
+# import 3rd-party libraries
+from flask import Flask
+from werkzeug.http import http_date
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.configs.ServerConfig import ServerConfig
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.utils.ConditionalResponse import ConditionalResponse
+from ogd.apis.HelloAPI import HelloAPI
+from tests.config.t_config import settings
+
+
+class BasicCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="ConditionalResponseTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+        cls.modified = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        cls.builds   = 0
+        cls.application = Flask(__name__)
+        cls.application.add_url_rule("/index", "index", methods=["GET", "POST"], view_func=lambda: ConditionalResponse.Respond(build=cls._build, version=cls.modified.timestamp(), last_modified=cls.modified))
+        cls.application.add_url_rule("/hashed", "hashed", methods=["GET", "POST"], view_func=lambda: ConditionalResponse.Respond(build=cls._build))
+        HelloAPI.register(app=cls.application, server_config=ServerConfig.FromDict(name="ConditionalTestServer", unparsed_elements={"API_VERSION":"1.2.3"}))
+        cls.server = cls.application.test_client()
+
+    @classmethod
+    def _build(cls) -> APIResponse:
+        cls.builds += 1
+        return APIResponse(req_type=RESTType.GET, val={"sessions":[1, 2, 3]}, msg="Index", status=ResponseStatus.OK)
+
+    def test_VersionToken(self):
+        full = self.server.get("/index")
+        self.assertEqual(full.status_code, 200)
+        self.assertIsNotNone(full.headers.get("ETag"))
+        builds = BasicCase.builds
+        current = self.server.get("/index", headers={"If-None-Match":full.headers["ETag"]})
+        self.assertEqual(current.status_code, ResponseStatus.NOT_MODIFIED.value)
+        self.assertEqual(current.data, b"")
+        self.assertEqual(BasicCase.builds, builds)
+        stale = self.server.get("/index", headers={"If-None-Match":'W/"outdated"'})
+        self.assertEqual(stale.status_code, 200)
+
+    def test_IfModifiedSince(self):
+        current = self.server.get("/index", headers={"If-Modified-Since":http_date(self.modified)})
+        self.assertEqual(current.status_code, ResponseStatus.NOT_MODIFIED.value)
+        stale = self.server.get("/index", headers={"If-Modified-Since":http_date(datetime(2025, 1, 1, tzinfo=timezone.utc))})
+        self.assertEqual(stale.status_code, 200)
+
+    def test_HashedETag(self):
+        full    = self.server.get("/hashed")
+        current = self.server.get("/hashed", headers={"If-None-Match":full.headers["ETag"]})
+        self.assertEqual(current.status_code, ResponseStatus.NOT_MODIFIED.value)
+
+    def test_PostNotConditional(self):
+        for path in ("/index", "/hashed"):
+            full = self.server.get(path)
+            post = self.server.post(path, headers={"If-None-Match":full.headers["ETag"]})
+            self.assertEqual(post.status_code, 200, f"Bad status for {path}")
+            self.assertIsNone(post.headers.get("ETag"))
+            self.assertEqual(post.json["val"], {"sessions":[1, 2, 3]})
+        with self.application.test_request_context("/index", method="POST", headers={"If-None-Match":'W/"current"'}):
+            self.assertTrue(ConditionalResponse.IsModified(etag="current", last_modified=None))
+
+    def test_Version(self):
+        full    = self.server.get("/version")
+        current = self.server.get("/version", headers={"If-None-Match":full.headers["ETag"], "Accept-Encoding":"gzip"})
+        self.assertEqual(full.json["val"]["version"], "1.2.3")
+        self.assertEqual(current.status_code, ResponseStatus.NOT_MODIFIED.value)
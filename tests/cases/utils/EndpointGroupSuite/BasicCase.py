@@ -0,0 +1,74 @@
+# import libraries
+import logging
+import time
+from unittest import IsolatedAsyncioTestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.BalanceStrategy import BalanceStrategy
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.utils.CircuitBreaker import CircuitBreaker
+from ogd.apis.utils.EndpointGroup import EndpointGroup
+from ogd.apis.utils.RetryPolicy import RetryPolicy
+from ogd.apis.utils.SessionPool import SessionPool
+from tests.config.t_config import settings
+from tests.utils.StandInServer import StandInServer
+
+class BasicCase(IsolatedAsyncioTestCase):
+    ONE = "https://host.one/path/to/app.wsgi"
+    TWO = "https://host.two/path/to/app.wsgi"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="EndpointGroupTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def test_url(self):
+        self.assertEqual(EndpointGroup.URL(self.ONE, "hello"), "https://host.one/path/to/app.wsgi/hello")
+
+    def test_least_outstanding(self):
+        group = EndpointGroup(base_urls=[self.ONE, self.TWO])
+        first = group.Choose()
+        group.Begin(first)
+        second = group.Choose()
+        self.assertNotEqual(first, second)
+        group.Begin(second)
+        group.End(second, failed=False)
+        self.assertEqual(group.Choose(), second)
+        self.assertEqual(group.Choose(exclude=second), first)
+
+    def test_ewma_latency(self):
+        group = EndpointGroup(base_urls=[self.ONE, self.TWO], strategy=BalanceStrategy.EWMA_LATENCY)
+        for base_url, latency in ((self.ONE, 0.5), (self.TWO, 0.05)):
+            group.Begin(base_url)
+            group.End(base_url, failed=False, latency=latency)
+        self.assertEqual([group.Choose() for _ in range(4)], [self.TWO] * 4)
+
+    def test_ejection(self):
+        group = EndpointGroup(base_urls=[self.ONE, self.TWO], failure_threshold=2, ejection_time=0.1)
+        for _ in range(2):
+            group.Begin(self.ONE)
+            group.End(self.ONE, failed=True)
+        self.assertEqual(group.Healthy, [self.TWO])
+        self.assertEqual({group.Choose() for _ in range(4)}, {self.TWO})
+        time.sleep(0.15)
+        self.assertEqual(group.Healthy, [self.ONE, self.TWO])
+
+    def test_request_avoids_failing_replica(self):
+        with StandInServer(value={"from":"bad"}) as bad, StandInServer(value={"from":"good"}) as good:
+            bad.QueueResponse(503, count=10)
+            group   = EndpointGroup(base_urls=[bad.Address, good.Address], failure_threshold=1, ejection_time=30.0)
+            pool    = SessionPool()
+            policy  = RetryPolicy(max_retries=0)
+            breaker = CircuitBreaker(failure_threshold=0)
+            for _ in range(4):
+                APIRequest(url="hello", request_type=RESTType.GET, session_pool=pool, retry_policy=policy,
+                           circuit_breaker=breaker, endpoint_group=group).Execute(logger=Logger.std_logger)
+            pool.Close()
+        self.assertEqual(bad.RequestCount, 1)
+        self.assertEqual(good.RequestCount, 3)
+        self.assertEqual(group.Healthy, [good.Address])
+        self.assertEqual(group.AsDict[good.Address]["outstanding"], 0)
@@ -0,0 +1,71 @@
+# import libraries
+import json
+import logging
+from unittest import TestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.configs.ServerConfig import ServerConfig
+from ogd.apis.models.enums.JSONBackend import JSONBackend
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.utils.JSONSerializer import JSONSerializer
+from tests.config.t_config import settings
+
+class BasicCase(TestCase):
+    DOC = {"type":"GET", "val":{"sessions":[{"id":i, "name":"é", "score":i / 3} for i in range(10)], "none":None}, "msg":"ok"}
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="JSONSerializerTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def tearDown(self):
+        JSONSerializer.Configure()
+
+    def test_stdlib_matches_json(self):
+        serializer = JSONSerializer(backend=JSONBackend.STDLIB)
+        self.assertEqual(serializer.Backend, JSONBackend.STDLIB)
+        self.assertEqual(serializer.Dumps(self.DOC), json.dumps(self.DOC).encode("utf-8"))
+        self.assertEqual(serializer.Loads(serializer.Dumps(self.DOC)), self.DOC)
+        with self.assertRaises(ValueError):
+            serializer.Loads(b"{not json")
+        with self.assertRaises(TypeError):
+            serializer.Dumps({"x":object()})
+
+    def test_default_backend(self):
+        self.assertEqual(JSONSerializer().Backend, JSONBackend.STDLIB)
+        self.assertEqual(JSONSerializer.Default().Dumps(self.DOC), json.dumps(self.DOC).encode("utf-8"))
+
+    def test_auto_backend(self):
+        serializer = JSONSerializer(backend=JSONBackend.AUTO)
+        expected   = JSONBackend.ORJSON if JSONSerializer.FastAvailable() else JSONBackend.STDLIB
+        self.assertEqual(serializer.Backend, expected)
+        self.assertEqual(serializer.Loads(serializer.Dumps(self.DOC)), self.DOC)
+        # Asking for orjson when it isn't installed falls back to the standard library.
+        if not JSONSerializer.FastAvailable():
+            self.assertEqual(JSONSerializer(backend=JSONBackend.ORJSON).Backend, JSONBackend.STDLIB)
+
+    def test_large_integers(self):
+        doc = {"session_id":2**70}
+        for backend in (JSONBackend.STDLIB, JSONBackend.ORJSON):
+            serializer = JSONSerializer(backend=backend)
+            self.assertEqual(serializer.Loads(serializer.Dumps(doc)), doc)
+
+    def test_response_round_trip(self):
+        JSONSerializer.Configure(backend=JSONBackend.STDLIB)
+        response = APIResponse(req_type=RESTType.GET, val=self.DOC["val"], msg="ok", status=ResponseStatus.OK)
+        body     = response.AsJSONBytes
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(response.AsFlaskResponse.get_data(), body)
+        parsed = APIResponse.FromContent(body, status_code=200)
+        self.assertEqual(parsed.Value, self.DOC["val"])
+
+    def test_server_config(self):
+        config = ServerConfig.FromDict(name="JSONServer", unparsed_elements={"API_VERSION":"1.0.0", "JSON_BACKEND":"stdlib"})
+        self.assertEqual(config.SerializerBackend, JSONBackend.STDLIB)
+        self.assertEqual(config.AsDict["JSON_BACKEND"], "STDLIB")
+        self.assertEqual(ServerConfig.Default().SerializerBackend, JSONBackend.STDLIB)
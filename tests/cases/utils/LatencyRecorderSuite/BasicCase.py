@@ -0,0 +1,65 @@
+# import libraries
+import logging
+import math
+from unittest import TestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.LatencyPhase import LatencyPhase
+from ogd.apis.models.RequestTimings import RequestTimings
+from ogd.apis.utils.LatencyHistogram import LatencyHistogram
+from ogd.apis.utils.LatencyRecorder import LatencyRecorder
+from tests.config.t_config import settings
+
+class BasicCase(TestCase):
+    URL = "https://host.one/path/to/endpoint"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="LatencyRecorderTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def test_histogram_buckets(self):
+        histogram = LatencyHistogram(bounds=[0.01, 0.1, 1.0])
+        for seconds in [0.005, 0.01, 0.05, 0.5, 5.0]:
+            histogram.Record(seconds)
+        self.assertEqual(histogram.Buckets, [(0.01, 2), (0.1, 1), (1.0, 1), (math.inf, 1)])
+        self.assertEqual(histogram.Count, 5)
+        self.assertAlmostEqual(histogram.Mean, 5.565 / 5)
+        self.assertEqual(histogram.Min, 0.005)
+
+    def test_histogram_percentiles(self):
+        histogram = LatencyHistogram(bounds=[0.01, 0.1, 1.0])
+        self.assertEqual(histogram.Percentile(50), 0.0)
+        for _ in range(90):
+            histogram.Record(0.005)
+        for _ in range(10):
+            histogram.Record(0.2)
+        self.assertEqual(histogram.Percentile(50), 0.01)
+        self.assertEqual(histogram.Percentile(90), 0.01)
+        # The top bucket is capped at the largest sample.
+        self.assertEqual(histogram.Percentile(99), 0.2)
+
+    def test_records_per_host(self):
+        recorder = LatencyRecorder()
+        timings = RequestTimings()
+        timings.SetPhase(LatencyPhase.FIRST_BYTE, 0.02)
+        timings.SetPhase(LatencyPhase.DECODE, 0.001)
+        timings.Retries       = 2
+        timings.ResponseBytes = 100
+        recorder.Record(self.URL, timings)
+        recorder.Record("https://HOST.one/other", timings)
+
+        self.assertEqual(recorder.Hosts, ["https://host.one"])
+        first_byte = recorder.Histogram(self.URL, LatencyPhase.FIRST_BYTE)
+        self.assertIsNotNone(first_byte)
+        self.assertEqual(first_byte.Count, 2)
+        self.assertEqual(recorder.Histogram(self.URL, LatencyPhase.CONNECT).Count, 0)
+        summary = recorder.AsDict["https://host.one"]
+        self.assertEqual(summary["requests"], 2)
+        self.assertEqual(summary["retries"], 4)
+        self.assertEqual(summary["response_bytes"], 200)
+        self.assertIn("FIRST_BYTE", recorder.Dump())
+        self.assertIsNone(recorder.Histogram("https://host.two", LatencyPhase.TOTAL))
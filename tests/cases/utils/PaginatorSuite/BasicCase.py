@@ -0,0 +1,67 @@
+# import libraries
+import logging
+from typing import Dict, List, Optional
+from unittest import TestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.models.RecordedExchange import RecordedExchange
+from ogd.apis.utils.CircuitBreaker import CircuitBreaker
+from ogd.apis.utils.Paginator import Paginator
+from ogd.apis.utils.ReplayTransport import ReplayTransport
+from ogd.apis.utils.RetryPolicy import RetryPolicy
+from tests.config.t_config import settings
+
+class BasicCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="PaginatorTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def setUp(self):
+        self.paginator : Paginator = Paginator(default_limit=40, max_limit=100)
+        self.items     : List[int] = list(range(250))
+        self.url       : str       = "http://exports.test/sessions"
+
+    def _replay(self) -> ReplayTransport:
+        """Record every page the paginator serves for the items, following its cursors, as a server would.
+        """
+        exchanges : List[RecordedExchange] = []
+        args      : Dict[str, str]         = {}
+        while True:
+            page = self.paginator.PageSequence(req_type=RESTType.GET, items=self.items, msg="Sessions", args=args)
+            exchanges.append(RecordedExchange(method="GET", url=self.url, params=args.items(), status=page.Status.value,
+                                              headers={"Content-Type":"application/json"}, body=page.AsJSONBytes))
+            if page.NextCursor is None:
+                return ReplayTransport(exchanges)
+            args = {"cursor":page.NextCursor}
+
+    def test_Page(self):
+        first = self.paginator.PageSequence(req_type=RESTType.GET, items=self.items, msg="Sessions", args={"limit":"500"})
+        self.assertEqual(first.Status, ResponseStatus.PARTIAL)
+        self.assertEqual(len(first.Value["items"]), 100)
+        last = self.paginator.PageSequence(req_type=RESTType.GET, items=self.items[:140], msg="Sessions", args={"cursor":first.NextCursor})
+        self.assertEqual(last.Status, ResponseStatus.OK)
+        self.assertIsNone(last.NextCursor)
+        self.assertEqual(last.Value["items"], list(range(100, 140)))
+
+    def test_BadParams(self):
+        for args in ({"cursor":"not-a-cursor!"}, {"limit":"ten"}, {"limit":"0"}, {"cursor":Paginator.EncodeCursor("abc")}):
+            self.assertEqual(self.paginator.PageSequence(req_type=RESTType.GET, items=self.items, msg="Sessions", args=args).Status,
+                             ResponseStatus.BAD_REQUEST)
+
+    def test_IterPages(self):
+        transport = self._replay()
+        for prefetch in (False, True):
+            request = APIRequest(url=self.url, request_type=RESTType.GET, transport=transport, retry_policy=RetryPolicy.NoRetry(),
+                                 circuit_breaker=CircuitBreaker(failure_threshold=0))
+            pages   = list(request.IterPages(prefetch=prefetch))
+            self.assertEqual(len(pages), 7)
+            self.assertEqual([item for page in pages for item in page.Value["items"]], self.items)
+            self.assertEqual(pages[-1].Status, ResponseStatus.OK)
+        self.assertEqual(transport.Misses, 0)
@@ -0,0 +1,74 @@
+# import libraries
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import IsolatedAsyncioTestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.utils.RateLimiter import RateLimiter
+from ogd.apis.utils.RetryPolicy import RetryPolicy
+from tests.config.t_config import settings
+from tests.utils.StandInServer import StandInServer
+
+class BasicCase(IsolatedAsyncioTestCase):
+    URL = "https://host.one/path/to/endpoint"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="RateLimiterTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def test_burst_then_wait(self):
+        limiter = RateLimiter(rate=20, burst=3)
+        for _ in range(3):
+            self.assertTrue(limiter.TryAcquire(self.URL))
+        self.assertFalse(limiter.TryAcquire(self.URL))
+        # Other hosts have their own buckets.
+        self.assertTrue(limiter.TryAcquire("https://host.two/"))
+        start = time.monotonic()
+        self.assertTrue(limiter.Acquire(self.URL))
+        self.assertGreaterEqual(time.monotonic() - start, 0.03)
+
+    def test_timeout(self):
+        limiter = RateLimiter(rate=1, burst=1)
+        self.assertTrue(limiter.Acquire(self.URL, timeout=0))
+        self.assertFalse(limiter.Acquire(self.URL, timeout=0.1))
+
+    def test_shared_across_threads(self):
+        limiter = RateLimiter(rate=50, burst=5)
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: limiter.Acquire(self.URL), range(20)))
+        # 5 tokens up front, then 15 more at 50/s.
+        self.assertGreaterEqual(time.monotonic() - start, 0.28)
+        self.assertEqual(limiter.AsDict["granted"], 20)
+
+    def test_host_limit(self):
+        limiter = RateLimiter(rate=100, burst=10)
+        limiter.SetLimit(self.URL, rate=1, burst=1)
+        self.assertTrue(limiter.TryAcquire(self.URL))
+        self.assertFalse(limiter.TryAcquire(self.URL))
+
+    async def test_async_wait(self):
+        limiter = RateLimiter(rate=20, burst=1)
+        start = time.monotonic()
+        results = await asyncio.gather(*[limiter.AcquireAsync(self.URL) for _ in range(3)])
+        self.assertEqual(results, [True, True, True])
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_request_rate_limited(self):
+        with StandInServer(value={"foo":"bar"}) as server:
+            limiter = RateLimiter(rate=1, burst=1)
+            policy  = RetryPolicy(max_retries=0, deadline=0.2)
+            request = APIRequest(url=f"{server.Address}/hello", request_type=RESTType.GET, retry_policy=policy, rate_limiter=limiter)
+            self.assertTrue(request.Execute(logger=Logger.std_logger).OK)
+            response = request.Execute(logger=Logger.std_logger)
+            self.assertEqual(response.Status, ResponseStatus.TOO_MANY_REQUESTS)
+            self.assertEqual(server.RequestCount, 1)
@@ -0,0 +1,102 @@
+# import libraries
+import logging
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.LatencyPhase import LatencyPhase
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.utils.CircuitBreaker import CircuitBreaker
+from ogd.apis.utils.RecordingTransport import RecordingTransport
+from ogd.apis.utils.ReplayTransport import ReplayTransport
+from ogd.apis.utils.RetryPolicy import RetryPolicy
+from ogd.apis.utils.SessionPool import SessionPool
+from tests.config.t_config import settings
+from tests.utils.StandInServer import StandInServer
+
+class BasicCase(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="ReplayTransportTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def setUp(self):
+        self.pool    = SessionPool()
+        self.breaker = CircuitBreaker(failure_threshold=0)
+        handle, self.path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(handle)
+
+    def tearDown(self):
+        self.pool.Close()
+        os.remove(self.path)
+
+    def _request(self, transport, url:str, params=None, timeout:int=1, policy:RetryPolicy=RetryPolicy.NoRetry()) -> APIRequest:
+        return APIRequest(url=url, request_type=RESTType.GET, params=params, timeout=timeout, transport=transport,
+                          retry_policy=policy, circuit_breaker=self.breaker)
+
+    def _record(self) -> str:
+        """Record a short session against a stand-in server, returning the server's address.
+        """
+        with StandInServer(value={"foo":"bar"}, compress=True) as server:
+            recorder = RecordingTransport(inner=self.pool)
+            self.assertTrue(self._request(recorder, f"{server.Address}/hello", params={"b":"2", "a":"1"}).Execute().OK)
+            server.QueueResponse(503)
+            self.assertFalse(self._request(recorder, f"{server.Address}/flaky").Execute().OK)
+            self.assertTrue(self._request(recorder, f"{server.Address}/flaky").Execute().OK)
+            recorder.Save(self.path)
+            self.assertEqual(len(recorder), 3)
+            return server.Address
+
+    def test_record_and_replay(self):
+        address = self._record()
+        replay  = ReplayTransport.FromFile(self.path)
+        # Param order doesn't matter, and the server is gone, so these can only come from the recording.
+        response = self._request(replay, f"{address}/hello", params={"a":"1", "b":"2"}).Execute(logger=Logger.std_logger)
+        self.assertEqual(response.Value, {"foo":"bar"})
+        self.assertEqual(response.Timings.ResponseBytes, response.Timings.ResponseWireBytes)
+        statuses = [self._request(replay, f"{address}/flaky").Execute().Status for _ in range(3)]
+        self.assertEqual(statuses, [ResponseStatus.UNAVAILABLE, ResponseStatus.OK, ResponseStatus.OK])
+        self.assertEqual(self._request(replay, f"{address}/missing").Execute().Status, ResponseStatus.INTERNAL_ERR)
+        self.assertEqual((replay.Replayed, replay.Misses), (4, 1))
+
+    def test_replay_retries(self):
+        address  = self._record()
+        policy   = RetryPolicy(max_retries=2, base_delay=0.01, deadline=5.0)
+        response = self._request(ReplayTransport.FromFile(self.path), f"{address}/flaky", policy=policy).Execute()
+        self.assertTrue(response.OK, f"Bad status: {response.Status}")
+        self.assertEqual(response.Timings.Retries, 1)
+
+    def test_replay_latency_timeout(self):
+        with StandInServer(value={"foo":"bar"}, delay=0.3) as server:
+            recorder = RecordingTransport(inner=self.pool)
+            self._request(recorder, f"{server.Address}/slow").Execute()
+        replay = ReplayTransport(recorder.Exchanges, replay_latency=True)
+        response = self._request(replay, f"{server.Address}/slow", timeout=0.1).Execute()
+        self.assertEqual(response.Status, ResponseStatus.GATEWAY_TIMEOUT)
+        response = self._request(replay, f"{server.Address}/slow", timeout=1).Execute()
+        self.assertGreaterEqual(response.Timings.Phase(LatencyPhase.TOTAL), 0.3)
+
+    async def test_replay_async(self):
+        address  = self._record()
+        response = await self._request(ReplayTransport.FromFile(self.path), f"{address}/hello", params={"a":"1", "b":"2"}).ExecuteAsync()
+        self.assertEqual(response.Value, {"foo":"bar"})
+
+    def test_injected_faults(self):
+        with StandInServer(value={"foo":"bar"}) as server:
+            server.InjectFaults(error_rate=1.0, error_statuses=(503,), seed=1)
+            policy   = RetryPolicy(max_retries=2, base_delay=0.01, deadline=5.0)
+            response = APIRequest(url=f"{server.Address}/hello", request_type=RESTType.GET, session_pool=self.pool,
+                                  retry_policy=policy, circuit_breaker=self.breaker).Execute()
+            self.assertEqual(response.Status, ResponseStatus.UNAVAILABLE)
+            self.assertEqual(server.RequestCount, 3)
+            server.InjectFaults(body_delay=0.2)
+            response = APIRequest(url=f"{server.Address}/hello", request_type=RESTType.GET, session_pool=self.pool,
+                                  circuit_breaker=self.breaker).Execute()
+            self.assertTrue(response.OK, f"Bad status: {response.Status}")
+            self.assertGreaterEqual(response.Timings.Phase(LatencyPhase.DOWNLOAD), 0.15)
@@ -0,0 +1,115 @@
+# import libraries
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import IsolatedAsyncioTestCase
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.utils.RequestCoalescer import RequestCoalescer
+from tests.config.t_config import settings
+from tests.utils.StandInServer import StandInServer
+
+class BasicCase(IsolatedAsyncioTestCase):
+    THREADS = 10
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="RequestCoalescerTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def setUp(self):
+        self.server = StandInServer(value={"foo":"bar"}, delay=0.2)
+        self.server.Start()
+        self.coalescer = RequestCoalescer()
+
+    def tearDown(self):
+        self.server.Stop()
+
+    def test_threaded_gets_coalesce(self):
+        barrier = threading.Barrier(self.THREADS)
+        def _get(_:int) -> APIResponse:
+            request = APIRequest(url=f"{self.server.Address}/version", request_type=RESTType.GET, params={"a":1}, coalescer=self.coalescer)
+            barrier.wait()
+            return request.Execute(logger=Logger.std_logger)
+
+        with ThreadPoolExecutor(max_workers=self.THREADS) as pool:
+            responses = list(pool.map(_get, range(self.THREADS)))
+        self.assertTrue(all(response.OK for response in responses))
+        self.assertTrue(all(response.Value == {"foo":"bar"} for response in responses))
+        self.assertEqual(self.coalescer.Leaders + self.coalescer.Coalesced, self.THREADS)
+        self.assertEqual(self.server.RequestCount, self.coalescer.Leaders)
+        self.assertLess(self.server.RequestCount, self.THREADS)
+        self.assertEqual(self.coalescer.InFlight, 0)
+
+    def test_different_params_not_coalesced(self):
+        def _get(i:int) -> APIResponse:
+            return APIRequest(url=f"{self.server.Address}/version", request_type=RESTType.GET, params={"a":i}, coalescer=self.coalescer).Execute()
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            list(pool.map(_get, range(3)))
+        self.assertEqual(self.coalescer.Coalesced, 0)
+        self.assertEqual(self.server.RequestCount, 3)
+
+    def test_leader_exception_shared(self):
+        started = threading.Event()
+        release = threading.Event()
+        def _fail() -> APIResponse:
+            started.set()
+            release.wait()
+            raise RuntimeError("upstream exploded")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(self.coalescer.Do, "key", _fail)
+            started.wait()
+            waiter = pool.submit(self.coalescer.Do, "key", _fail)
+            while self.coalescer.Coalesced == 0:
+                pass
+            release.set()
+            self.assertRaises(RuntimeError, leader.result)
+            self.assertRaises(RuntimeError, waiter.result)
+
+    async def test_async_gets_coalesce(self):
+        requests = [APIRequest(url=f"{self.server.Address}/version", request_type=RESTType.GET, coalescer=self.coalescer) for _ in range(self.THREADS)]
+        responses = await asyncio.gather(*[request.ExecuteAsync(logger=Logger.std_logger) for request in requests])
+        self.assertTrue(all(response.OK for response in responses))
+        self.assertEqual(self.server.RequestCount, 1)
+        self.assertEqual(self.coalescer.Coalesced, self.THREADS - 1)
+
+    def test_callers_get_independent_copies(self):
+        started = threading.Event()
+        release = threading.Event()
+        def _get() -> APIResponse:
+            started.set()
+            release.wait()
+            return APIResponse(req_type=RESTType.GET, val={"foo":"bar"}, msg="ok", status=ResponseStatus.OK)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            leader = pool.submit(self.coalescer.Do, "key", _get)
+            started.wait()
+            waiters = [pool.submit(self.coalescer.Do, "key", _get) for _ in range(2)]
+            while self.coalescer.Coalesced < 2:
+                pass
+            release.set()
+            responses = [leader.result()] + [waiter.result() for waiter in waiters]
+        self.assertEqual(len({id(response) for response in responses}), 3)
+        for response in responses:
+            self.assertEqual(response.Message, "ok")
+        responses[0].Value["foo"] = "changed"
+        self.assertEqual(responses[1].Value, {"foo":"bar"})
+        self.assertEqual(responses[2].Value, {"foo":"bar"})
+
+    async def test_async_callers_get_independent_copies(self):
+        requests = [APIRequest(url=f"{self.server.Address}/version", request_type=RESTType.GET, coalescer=self.coalescer) for _ in range(3)]
+        responses = await asyncio.gather(*[request.ExecuteAsync(logger=Logger.std_logger) for request in requests])
+        self.assertEqual(self.server.RequestCount, 1)
+        responses[0].Value["foo"] = "changed"
+        self.assertEqual(responses[1].Value, {"foo":"bar"})
+        self.assertIsNot(responses[1].Timings, responses[2].Timings)
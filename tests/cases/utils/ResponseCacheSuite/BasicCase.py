@@ -0,0 +1,128 @@
+# import libraries
+import logging
+import time
+from typing import Dict
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIRequest import APIRequest
+from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.utils.ResponseCache import ResponseCache
+from ogd.apis.utils.ResponseCodec import ResponseCodec
+from tests.config.t_config import settings
+from tests.utils.StandInServer import StandInServer
+
+class _EvictingCache(ResponseCache):
+    """Cache whose entries are evicted as soon as their validators are read, as if evicted while the revalidation is in flight.
+    """
+    def Validators(self, key:str) -> Dict[str, str]:
+        ret_val = super().Validators(key)
+        self.Invalidate(key)
+        return ret_val
+
+class BasicCase(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="ResponseCacheTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+    def setUp(self):
+        self.server = StandInServer(value={"version":"1.0"}, etag='"v1"')
+        self.server.Start()
+
+    def tearDown(self):
+        self.server.Stop()
+
+    def test_Key_ignores_param_order(self):
+        self.assertEqual(ResponseCache.Key("https://host/x", [("b","2"), ("a","1")]), ResponseCache.Key("https://host/x", [("a","1"), ("b","2")]))
+        self.assertEqual(ResponseCache.Key("https://host/x", []), "https://host/x")
+
+    def test_fresh_hit(self):
+        cache = ResponseCache(ttl=60)
+        request = APIRequest(url=f"{self.server.Address}/version", request_type=RESTType.GET, cache=cache)
+        first  = request.Execute(logger=Logger.std_logger)
+        second = request.Execute(logger=Logger.std_logger)
+        self.assertTrue(first.OK)
+        self.assertEqual(second.Value, {"version":"1.0"})
+        self.assertEqual(self.server.RequestCount, 1)
+        self.assertEqual((cache.Hits, cache.Misses), (1, 1))
+
+    def test_revalidation_not_modified(self):
+        cache = ResponseCache(ttl=0)
+        request = APIRequest(url=f"{self.server.Address}/version", request_type=RESTType.GET, cache=cache)
+        request.Execute(logger=Logger.std_logger)
+        second = request.Execute(logger=Logger.std_logger)
+        self.assertEqual(second.Status, ResponseStatus.OK)
+        self.assertEqual(second.Value, {"version":"1.0"})
+        self.assertEqual(self.server.RequestCount, 2)
+        self.assertEqual((cache.Hits, cache.Misses, cache.Revalidations), (1, 1, 1))
+
+    def test_evicted_during_revalidation(self):
+        cache = _EvictingCache(ttl=0)
+        request = APIRequest(url=f"{self.server.Address}/version", request_type=RESTType.GET, cache=cache)
+        request.Execute(logger=Logger.std_logger)
+        second = request.Execute(logger=Logger.std_logger)
+        self.assertEqual(second.Status, ResponseStatus.OK)
+        self.assertEqual(second.Value, {"version":"1.0"})
+        self.assertEqual(self.server.RequestCount, 3)
+        self.assertNotIn("If-None-Match", self.server.LastHeaders)
+
+    def test_hits_decoded_once_and_independent(self):
+        cache = ResponseCache(ttl=60)
+        response = APIResponse.FromContent(b'{"type":"GET","val":{"version":"1.0"},"msg":"ok"}', status_code=200)
+        self.assertIs(cache.Resolve("key", response, headers={}), response)
+        with patch.object(ResponseCodec, "Decode", wraps=ResponseCodec.Decode) as decode:
+            first  = cache.Get("key")
+            second = cache.Get("key")
+            first.Value["version"] = "2.0"
+            self.assertEqual(second.Value, {"version":"1.0"})
+            self.assertEqual(second.Message, "ok")
+            self.assertEqual(cache.Get("key").Value, {"version":"1.0"})
+        decode.assert_not_called()
+
+    def test_post_not_cached(self):
+        cache = ResponseCache(ttl=60)
+        request = APIRequest(url=f"{self.server.Address}/version", request_type=RESTType.POST, cache=cache)
+        request.Execute(logger=Logger.std_logger)
+        request.Execute(logger=Logger.std_logger)
+        self.assertEqual(self.server.RequestCount, 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(ttl=60, max_entries=2)
+        ok = APIResponse(req_type=RESTType.GET, val={}, msg="", status=ResponseStatus.OK)
+        for key in ["a", "b"]:
+            cache.Resolve(key, ok, headers={})
+        cache.Get("a")
+        cache.Resolve("c", ok, headers={})
+        self.assertIsNotNone(cache.Get("a"))
+        self.assertIsNone(cache.Get("b"))
+
+    def test_ttl_expiry(self):
+        cache = ResponseCache(ttl=0.05)
+        cache.Resolve("a", APIResponse(req_type=RESTType.GET, val={}, msg="", status=ResponseStatus.OK), headers={})
+        self.assertIsNotNone(cache.Get("a"))
+        time.sleep(0.1)
+        self.assertIsNone(cache.Get("a"))
+
+    async def test_async_revalidation(self):
+        cache = ResponseCache(ttl=0)
+        request = APIRequest(url=f"{self.server.Address}/version", request_type=RESTType.GET, cache=cache)
+        await request.ExecuteAsync(logger=Logger.std_logger)
+        second = await request.ExecuteAsync(logger=Logger.std_logger)
+        self.assertEqual(second.Value, {"version":"1.0"})
+        self.assertEqual(cache.Revalidations, 1)
+
+    async def test_async_evicted_during_revalidation(self):
+        cache = _EvictingCache(ttl=0)
+        request = APIRequest(url=f"{self.server.Address}/version", request_type=RESTType.GET, cache=cache)
+        await request.ExecuteAsync(logger=Logger.std_logger)
+        second = await request.ExecuteAsync(logger=Logger.std_logger)
+        self.assertEqual(second.Value, {"version":"1.0"})
+        self.assertEqual(self.server.RequestCount, 3)
@@ -0,0 +1,91 @@
+# import libraries
+import logging
+from unittest import TestCase, skipUnless
+# import 3rd-party libraries
+from flask import Flask
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.models.enums.ResponseEncoding import ResponseEncoding
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.utils.ResponseCodec import ResponseCodec
+from tests.config.t_config import settings
+
+
+class RoundTripCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="ResponseCodecTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+        cls.rows = [{"session_id":f"2300{i}", "event_count":i, "active_time":i * 0.5, "completed":i % 2 == 0} for i in range(20)]
+        cls.application = Flask(__name__)
+        cls.application.add_url_rule("/features", "features",
+                                     lambda: APIResponse(req_type=RESTType.GET, val={"items":cls.rows}, msg="Features", status=ResponseStatus.OK).AsNegotiatedResponse())
+        cls.server = cls.application.test_client()
+
+    def _roundTrip(self, encoding:ResponseEncoding):
+        response = APIResponse(req_type=RESTType.GET, val={"items":self.rows, "total":20}, msg="Features", status=ResponseStatus.OK, next_cursor="abc")
+        decoded  = APIResponse.FromContent(response.AsEncodedBytes(encoding), status_code=200, content_type=ResponseCodec.MimeType(encoding))
+        self.assertEqual(decoded.Type, RESTType.GET)
+        self.assertEqual(decoded.Message, "Features")
+        self.assertEqual(decoded.NextCursor, "abc")
+        self.assertEqual(decoded.Value, {"items":self.rows, "total":20})
+        self.assertEqual(decoded.AsJSONBytes, response.AsJSONBytes)
+
+    def test_ColumnarRoundTrip(self):
+        self._roundTrip(ResponseEncoding.COLUMNAR)
+
+    def test_ColumnarLayout(self):
+        columns = ResponseCodec.ToColumns(self.rows)
+        self.assertEqual(list(columns["@columns"].keys()), ["session_id", "event_count", "active_time", "completed"])
+        self.assertEqual(columns["@columns"]["event_count"], list(range(20)))
+        self.assertEqual(ResponseCodec.FromColumns(columns), self.rows)
+        # Lists that aren't uniform records are left as they are.
+        ragged = [{"a":1}, {"b":2}]
+        self.assertEqual(ResponseCodec.ToColumns(ragged), ragged)
+        self.assertEqual(ResponseCodec.ToColumns([1, 2, 3]), [1, 2, 3])
+        self.assertEqual(ResponseCodec.ToColumns({"items":[], "total":0}), {"items":[], "total":0})
+
+    def test_ColumnarLossless(self):
+        # Real data shaped like columns, or with keys that start with the escape character, comes back as it was.
+        lookalikes = [
+            {"@columns":{"a":[1, 2]}},
+            {"items":{"@columns":{"a":[1, 2]}}, "@@meta":1},
+            {"items":[{"@columns":1, "b":2}, {"@columns":3, "b":4}]},
+        ]
+        for val in lookalikes:
+            self.assertEqual(ResponseCodec.FromColumns(ResponseCodec.ToColumns(val)), val)
+        # Records with the same keys in different orders keep their own order.
+        shuffled = [{"a":1, "b":2}, {"b":3, "a":4}]
+        decoded  = ResponseCodec.FromColumns(ResponseCodec.ToColumns({"items":shuffled}))["items"]
+        self.assertEqual([list(record.keys()) for record in decoded], [["a", "b"], ["b", "a"]])
+        response = APIResponse(req_type=RESTType.GET, val=lookalikes[1], msg="Lookalike", status=ResponseStatus.OK)
+        encoded  = response.AsEncodedBytes(ResponseEncoding.COLUMNAR)
+        self.assertEqual(APIResponse.FromContent(encoded, status_code=200, content_type=ResponseCodec.MimeType(ResponseEncoding.COLUMNAR)).Value, lookalikes[1])
+
+    @skipUnless(ResponseCodec.Available(ResponseEncoding.MSGPACK), "msgpack is not installed")
+    def test_MessagePackRoundTrip(self):
+        self._roundTrip(ResponseEncoding.MSGPACK)
+        invalid = APIResponse.FromContent(b"\xc1", status_code=200, content_type="application/msgpack")
+        self.assertIsNone(invalid.Value)
+
+    def test_JSONByDefault(self):
+        for accept in (None, "*/*", "application/json", "text/html"):
+            response = self.server.get("/features", headers={"Accept":accept} if accept else {})
+            self.assertEqual(response.mimetype, "application/json")
+            self.assertEqual(APIResponse.FromContent(response.data, status_code=200).Value, {"items":self.rows})
+
+    def test_Negotiated(self):
+        response = self.server.get("/features", headers={"Accept":"application/vnd.ogd.columnar+json, application/json;q=0.5"})
+        self.assertEqual(response.mimetype, "application/vnd.ogd.columnar+json")
+        self.assertIn(b"@columns", response.data)
+        self.assertEqual(APIResponse.FromContent(response.data, status_code=200, content_type=response.content_type).Value, {"items":self.rows})
+        response = self.server.get("/features", headers={"Accept":"application/msgpack, application/json;q=0.5"})
+        expected = "application/msgpack" if ResponseCodec.Available(ResponseEncoding.MSGPACK) else "application/json"
+        self.assertEqual(response.mimetype, expected)
+        self.assertEqual(APIResponse.FromContent(response.data, status_code=200, content_type=response.content_type).Value, {"items":self.rows})
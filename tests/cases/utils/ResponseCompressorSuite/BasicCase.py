@@ -0,0 +1,77 @@
+# import libraries
+import gzip
+import json
+import logging
+from unittest import TestCase
+# import 3rd-party libraries
+from flask import Flask, Response
+# import ogd libraries
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from ogd.apis.configs.ServerConfig import ServerConfig
+from ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from ogd.apis.models.enums.RESTType import RESTType
+from ogd.apis.models.APIResponse import APIResponse
+from ogd.apis.utils.APIUtils import configure_app
+from ogd.apis.utils.ResponseCompressor import ResponseCompressor
+from ogd.apis.HelloAPI import HelloAPI
+from tests.config.t_config import settings
+
+
+class BasicCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="ResponseCompressorTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+        cls.response = APIResponse(req_type=RESTType.GET, val={"rows":[[i, "1.2.3"] for i in range(1000)]}, msg="Complete", status=ResponseStatus.OK)
+        cls.application = Flask(__name__)
+        cls.application.add_url_rule("/export", "export", lambda: cls.response.AsFlaskResponse)
+        cls.application.add_url_rule("/stream", "stream", lambda: cls.response.AsFlaskStream(chunk_size=1024))
+        cls.application.add_url_rule("/text", "text", lambda: Response((f"line {i}\n" for i in range(100)), mimetype="text/plain"))
+        _server_cfg = ServerConfig.FromDict(name="CompressorTestServer", unparsed_elements={"API_VERSION":"0.0.0-Testing", "COMPRESS_MIN_SIZE":200})
+        HelloAPI.register(app=cls.application, server_config=_server_cfg)
+        configure_app(app=cls.application, server_config=_server_cfg)
+        cls.server = cls.application.test_client()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        ResponseCompressor.Configure()
+
+    def test_AcceptsGzip(self):
+        self.assertTrue(ResponseCompressor.AcceptsGzip("gzip, deflate, br"))
+        self.assertTrue(ResponseCompressor.AcceptsGzip("*;q=0.5"))
+        self.assertFalse(ResponseCompressor.AcceptsGzip("gzip;q=0, *"))
+        self.assertFalse(ResponseCompressor.AcceptsGzip("br"))
+        self.assertFalse(ResponseCompressor.AcceptsGzip(None))
+
+    def test_Negotiated(self):
+        compressed = self.server.get("/export", headers={"Accept-Encoding":"gzip"})
+        self.assertEqual(compressed.headers.get("Content-Encoding"), "gzip")
+        self.assertIn("Accept-Encoding", compressed.headers.get("Vary", ""))
+        self.assertEqual(json.loads(gzip.decompress(compressed.data)), self.response.AsDict)
+        plain = self.server.get("/export")
+        self.assertIsNone(plain.headers.get("Content-Encoding"))
+        self.assertGreater(len(plain.data), 5 * len(compressed.data))
+
+    def test_Streamed(self):
+        compressed = self.server.get("/stream", headers={"Accept-Encoding":"gzip"})
+        self.assertEqual(compressed.headers.get("Content-Encoding"), "gzip")
+        self.assertEqual(json.loads(gzip.decompress(compressed.data)), self.response.AsDict)
+
+    def test_StreamedText(self):
+        compressed = self.server.get("/text", headers={"Accept-Encoding":"gzip"})
+        self.assertEqual(compressed.headers.get("Content-Encoding"), "gzip")
+        self.assertEqual(gzip.decompress(compressed.data).decode("utf-8"), "".join(f"line {i}\n" for i in range(100)))
+
+    def test_UnderMinSize(self):
+        hello = self.server.get("/hello", headers={"Accept-Encoding":"gzip"})
+        self.assertIsNone(hello.headers.get("Content-Encoding"))
+        self.assertEqual(hello.json["msg"], "Hello! You GETted successfully!")
+
+    def test_Cached(self):
+        compressor = ResponseCompressor(min_size=0)
+        body       = self.response.AsJSONBytes
+        self.assertIs(compressor.Compress(body), compressor.Compress(bytes(body)))
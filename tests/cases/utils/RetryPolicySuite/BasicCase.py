@@ -0,0 +1,62 @@
+# import libraries
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import TestCase
+# import locals
+from src.ogd.apis.models.enums.ResponseStatus import ResponseStatus
+from src.ogd.apis.utils.RetryPolicy import RetryPolicy
+
+class BasicCase(TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(max_retries=3, base_delay=0.1, max_delay=0.5, multiplier=2.0, jitter=False, deadline=5.0)
+
+    def test_Backoff_grows_and_caps(self):
+        self.assertAlmostEqual(self.policy.Backoff(0), 0.1)
+        self.assertAlmostEqual(self.policy.Backoff(1), 0.2)
+        self.assertAlmostEqual(self.policy.Backoff(2), 0.4)
+        self.assertAlmostEqual(self.policy.Backoff(3), 0.5)
+
+    def test_Backoff_jitter_in_range(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.5, jitter=True)
+        for retry in range(10):
+            delay = policy.Backoff(retry)
+            self.assertGreaterEqual(delay, 0.0)
+            self.assertLessEqual(delay, 0.5)
+
+    def test_NextDelay_stops_at_max_retries(self):
+        deadline = self.policy.StartDeadline()
+        self.assertIsNotNone(self.policy.NextDelay(2, deadline=deadline))
+        self.assertIsNone(self.policy.NextDelay(3, deadline=deadline))
+
+    def test_NextDelay_respects_retry_after(self):
+        self.assertAlmostEqual(self.policy.NextDelay(0, deadline=None, retry_after=2.0) or 0, 2.0)
+
+    def test_NextDelay_respects_deadline(self):
+        deadline = time.monotonic() + 1.0
+        self.assertIsNone(self.policy.NextDelay(0, deadline=deadline, retry_after=3.0))
+
+    def test_AttemptTimeout(self):
+        self.assertEqual(self.policy.AttemptTimeout(1.0, deadline=None), 1.0)
+        self.assertLessEqual(self.policy.AttemptTimeout(1.0, deadline=time.monotonic() + 0.25), 0.25)
+
+    def test_default_keeps_long_timeout(self):
+        policy = RetryPolicy()
+        self.assertIsNone(policy.Deadline)
+        self.assertEqual(policy.AttemptTimeout(30.0, deadline=policy.StartDeadline()), 30.0)
+
+    def test_ParseRetryAfter(self):
+        self.assertEqual(RetryPolicy.ParseRetryAfter("3"), 3.0)
+        self.assertIsNone(RetryPolicy.ParseRetryAfter(None))
+        self.assertIsNone(RetryPolicy.ParseRetryAfter("not a date"))
+        later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        parsed = RetryPolicy.ParseRetryAfter(later)
+        self.assertIsNotNone(parsed)
+        if parsed is not None:
+            self.assertTrue(25 <= parsed <= 30, f"Parsed Retry-After of {parsed}")
+
+    def test_ShouldRetryStatus(self):
+        self.assertTrue(self.policy.ShouldRetryStatus(ResponseStatus.TOO_MANY_REQUESTS))
+        self.assertTrue(self.policy.ShouldRetryStatus(503))
+        self.assertFalse(self.policy.ShouldRetryStatus(ResponseStatus.INTERNAL_ERR))
+        self.assertFalse(self.policy.ShouldRetryStatus(ResponseStatus.OK))
@@ -0,0 +1,100 @@
+# import libraries
+import asyncio
+import logging
+from unittest import TestCase
+# import ogd libraries.
+from ogd.common.configs.TestConfig import TestConfig
+from ogd.common.utils.Logger import Logger
+# import locals
+from src.ogd.apis.models.RequestTimings import RequestTimings
+from src.ogd.apis.utils.SessionPool import SessionPool
+from tests.config.t_config import settings
+from tests.utils.StandInServer import StandInServer
+
+class BasicCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _config = TestConfig.FromDict(name="SessionPoolTestConfig", unparsed_elements=settings)
+        _level = logging.DEBUG if _config.Verbose else logging.INFO
+        Logger.InitializeLogger(level=_level, use_logfile=False)
+
+        cls.server = StandInServer(value={"foo":"bar"})
+        cls.server.Start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.Stop()
+
+    def setUp(self):
+        self.pool = SessionPool(pool_size=2, idle_timeout=60)
+
+    def tearDown(self):
+        self.pool.Close()
+
+    def test_HostKey(self):
+        self.assertEqual(SessionPool.HostKey("https://OGD-Services.example.edu/path/app.wsgi/hello?x=1"), "https://ogd-services.example.edu")
+        self.assertEqual(SessionPool.HostKey("http://127.0.0.1:5000/hello"), "http://127.0.0.1:5000")
+
+    def test_Session_shared_per_host(self):
+        first  = self.pool.Session("https://host.one/path/a")
+        second = self.pool.Session("https://host.one/path/b")
+        other  = self.pool.Session("https://host.two/path/a")
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(sorted(self.pool.Hosts), ["https://host.one", "https://host.two"])
+
+    def test_EvictIdle(self):
+        pool = SessionPool(pool_size=1, idle_timeout=0)
+        pool.Session("https://host.one/path")
+        self.assertEqual(pool.EvictIdle(), 1)
+        self.assertEqual(pool.Hosts, [])
+
+    def test_Request(self):
+        response = self.pool.Request("GET", f"{self.server.Address}/hello", timeout=1)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json().get("val"), {"foo":"bar"})
+        self.assertEqual(self.pool.Hosts, [SessionPool.HostKey(self.server.Address)])
+
+    def test_cookies_not_shared(self):
+        self.server.QueueResponse(200, headers={"Set-Cookie":"session=first-caller; Path=/"})
+        self.pool.Request("GET", f"{self.server.Address}/login", timeout=1)
+        self.pool.Request("GET", f"{self.server.Address}/hello", timeout=1)
+        self.assertNotIn("Cookie", self.server.LastHeaders)
+        self.pool.Request("GET", f"{self.server.Address}/hello", timeout=1, cookies={"own":"cookie"})
+        self.assertEqual(self.server.LastHeaders.get("Cookie"), "own=cookie")
+
+    def test_async_cookies_not_shared(self):
+        if not SessionPool.AsyncSupported():
+            self.skipTest("aiohttp is not installed")
+        # aiohttp never stores cookies from IP addresses, so send to the server by name.
+        address = self.server.Address.replace("127.0.0.1", "localhost")
+        async def _requests():
+            self.server.QueueResponse(200, headers={"Set-Cookie":"session=first-caller; Path=/"})
+            for path in ("/login", "/hello"):
+                await self.pool.RequestAsync("GET", f"{address}{path}", params=[], headers={}, data=None,
+                                             timeout=1, timings=RequestTimings())
+        asyncio.run(_requests())
+        self.assertNotIn("Cookie", self.server.LastHeaders)
+
+    def test_Configure_replaces_default(self):
+        old_default = SessionPool.Default()
+        new_default = SessionPool.Configure(pool_size=3, idle_timeout=5)
+        self.assertIsNot(old_default, new_default)
+        self.assertIs(SessionPool.Default(), new_default)
+        self.assertEqual(new_default.PoolSize, 3)
+        self.assertEqual(new_default.IdleTimeout, 5)
+
+    def test_AsyncSession_closed_with_loop(self):
+        if not SessionPool.AsyncSupported():
+            self.skipTest("aiohttp is not installed")
+        async def _request():
+            status, _, _ = await self.pool.RequestAsync("GET", f"{self.server.Address}/hello", params=[], headers={}, data=None,
+                                                        timeout=1, timings=RequestTimings())
+            self.assertEqual(status, 200)
+            return self.pool.AsyncSession()
+        # Neither run calls CloseAsync, so each session must be closed as its loop shuts down.
+        first  = asyncio.run(_request())
+        self.assertTrue(first.closed)
+        second = asyncio.run(_request())
+        self.assertIsNot(first, second)
+        self.assertTrue(second.closed)
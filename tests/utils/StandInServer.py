@@ -0,0 +1,259 @@
+"""
+StandInServer
+
+Contains a small, in-process HTTP server that answers every request with an OGD-style API response envelope.
+Used to exercise APIRequest locally, without needing a live server at `REMOTE_ADDRESS`.
+The server can also inject faults, such as extra latency, hung requests, error statuses and slow bodies, for testing and benchmarking resilience.
+"""
+
+# import standard libraries
+import gzip
+import json
+import random
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, Optional, Self, Sequence, Tuple
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so that clients can keep connections alive between requests.
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, so avoid Nagle/delayed-ACK stalls on kept-alive connections.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._respond("GET")
+
+    def do_POST(self):
+        self._respond("POST")
+
+    def do_PUT(self):
+        self._respond("PUT")
+
+    def log_message(self, format:str, *args:Any) -> None: # pylint: disable=redefined-builtin
+        # Keep test and benchmark output quiet.
+        pass
+
+    def _readBody(self) -> bytes:
+        if "chunked" not in self.headers.get("Transfer-Encoding", ""):
+            length = int(self.headers.get("Content-Length", 0))
+            return self.rfile.read(length) if length > 0 else b""
+        chunks = []
+        while (size := int(self.rfile.readline().split(b";")[0].strip(), 16)) > 0:
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+        self.rfile.readline()
+        return b"".join(chunks)
+
+    def _respond(self, req_type:str):
+        body   = self._readBody()
+        server : "_StandInHTTPServer" = self.server # type: ignore[assignment]
+        server.request_count += 1
+        server.last_headers   = dict(self.headers.items())
+        server.last_body      = body
+        status, headers, delay = server.NextResponse()
+        delay = server.delay if delay is None else delay
+        if delay > 0:
+            time.sleep(delay)
+        if server.etag is not None:
+            if status == 200 and self.headers.get("If-None-Match") == server.etag:
+                self.send_response(304)
+                self.send_header("ETag", server.etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            headers = {"ETag": server.etag, **headers}
+        payload = json.dumps({
+            "type" : req_type,
+            "val"  : server.value if status == 200 else None,
+            "msg"  : f"Stand-in server handled {req_type} {self.path}"
+        }).encode("utf-8")
+        if server.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+            payload = gzip.compress(payload)
+            headers = {"Content-Encoding": "gzip", **headers}
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if server.faults.body_delay > 0:
+            # Dribble the body out in pieces, so clients see a slow download rather than a slow first byte.
+            piece = max(1, len(payload) // _FaultProfile.BODY_PIECES)
+            for offset in range(0, len(payload), piece):
+                self.wfile.write(payload[offset:offset + piece])
+                self.wfile.flush()
+                time.sleep(server.faults.body_delay / _FaultProfile.BODY_PIECES)
+        else:
+            self.wfile.write(payload)
+
+class _FaultProfile:
+    """Settings for the faults a stand-in server injects into responses that were not queued explicitly.
+    """
+    BODY_PIECES = 8
+
+    def __init__(self, error_rate:float=0.0, error_statuses:Sequence[int]=(429, 503), timeout_rate:float=0.0, hang:float=5.0,
+                 latency:float=0.0, jitter:float=0.0, body_delay:float=0.0, seed:Optional[int]=None):
+        self.error_rate     : float         = error_rate
+        self.error_statuses : Sequence[int] = error_statuses
+        self.timeout_rate   : float         = timeout_rate
+        self.hang           : float         = hang
+        self.latency        : float         = latency
+        self.jitter         : float         = jitter
+        self.body_delay     : float         = body_delay
+        self.rng            : random.Random = random.Random(seed)
+
+    def Roll(self) -> Tuple[int, Dict[str, str], Optional[float]]:
+        """Pick the status, headers and delay of the next response. Must be called while holding the server's queue lock.
+        """
+        roll  = self.rng.random()
+        delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter > 0 else 0.0)
+        if roll < self.timeout_rate:
+            return 200, {}, delay + self.hang
+        if roll < self.timeout_rate + self.error_rate:
+            status = self.rng.choice(list(self.error_statuses))
+            return status, ({"Retry-After": "0"} if status == 429 else {}), delay
+        return 200, {}, delay if delay > 0 else None
+
+class _StandInHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, value:Optional[Dict[str, Any]], etag:Optional[str], delay:float, compress:bool):
+        super().__init__(address, _StandInHandler)
+        self.value         : Optional[Dict[str, Any]]                           = value
+        self.etag          : Optional[str]                                      = etag
+        self.delay         : float                                              = delay
+        self.compress      : bool                                               = compress
+        self.request_count : int                                                = 0
+        self.last_headers  : Dict[str, str]                                     = {}
+        self.last_body     : bytes                                              = b""
+        self.faults        : _FaultProfile                                      = _FaultProfile()
+        self._queued       : Deque[Tuple[int, Dict[str, str], Optional[float]]] = deque()
+        self._queue_lock   : threading.Lock                                     = threading.Lock()
+
+    def handle_error(self, request:Any, client_address:Any) -> None:
+        # Clients that time out or cancel a hedged request hang up mid-response, which is expected here.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    def Queue(self, status:int, headers:Optional[Dict[str, str]]=None, delay:Optional[float]=None):
+        with self._queue_lock:
+            self._queued.append((status, headers or {}, delay))
+
+    def NextResponse(self) -> Tuple[int, Dict[str, str], Optional[float]]:
+        with self._queue_lock:
+            return self._queued.popleft() if self._queued else self.faults.Roll()
+
+class StandInServer:
+    """In-process HTTP server that stands in for an OGD API during tests and benchmarks.
+
+    Usable as a context manager, which starts the server on entry and stops it on exit:
+
+    ```python
+    with StandInServer() as server:
+        APIRequest(url=f"{server.Address}/hello", request_type="GET").Execute()
+    ```
+    """
+    def __init__(self, host:str="127.0.0.1", port:int=0, value:Optional[Dict[str, Any]]=None, etag:Optional[str]=None, delay:float=0.0,
+                 compress:bool=False):
+        self._server : _StandInHTTPServer         = _StandInHTTPServer((host, port), value=value, etag=etag, delay=delay, compress=compress)
+        self._thread : Optional[threading.Thread] = None
+
+    def __enter__(self) -> Self:
+        self.Start()
+        return self
+
+    def __exit__(self, *args:Any) -> None:
+        self.Stop()
+
+    @property
+    def Address(self) -> str:
+        """Property for the base URL of the server, including scheme.
+
+        :return: The base URL of the server, such as `http://127.0.0.1:5000`.
+        :rtype: str
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def RequestCount(self) -> int:
+        """Property for the number of requests the server has handled since it was created.
+
+        :return: The number of requests the server has handled.
+        :rtype: int
+        """
+        return self._server.request_count
+
+    @property
+    def LastHeaders(self) -> Dict[str, str]:
+        """Property for the headers of the most recent request the server handled.
+
+        :return: The request headers.
+        :rtype: Dict[str, str]
+        """
+        return self._server.last_headers
+
+    @property
+    def LastBody(self) -> bytes:
+        """Property for the body of the most recent request the server handled, exactly as it was received.
+
+        :return: The raw request body.
+        :rtype: bytes
+        """
+        return self._server.last_body
+
+    def QueueResponse(self, status:int, count:int=1, headers:Optional[Dict[str, str]]=None, delay:Optional[float]=None):
+        """Make the next `count` requests get the given status, instead of a normal 200 response.
+
+        :param status: The HTTP status code to respond with.
+        :type status: int
+        :param count: The number of upcoming requests that should get the status. Defaults to 1
+        :type count: int, optional
+        :param headers: Extra headers to send with the response, such as `Retry-After`. Defaults to None
+        :type headers: Dict[str, str], optional
+        :param delay: Seconds to wait before responding, instead of the server's usual delay. Defaults to None
+        :type delay: float, optional
+        """
+        for _ in range(count):
+            self._server.Queue(status=status, headers=headers, delay=delay)
+
+    def InjectFaults(self, error_rate:float=0.0, error_statuses:Sequence[int]=(429, 503), timeout_rate:float=0.0, hang:float=5.0,
+                     latency:float=0.0, jitter:float=0.0, body_delay:float=0.0, seed:Optional[int]=None):
+        """Make responses that were not queued with `QueueResponse` fail or slow down at random, replacing any faults set before.
+
+        Call with no arguments to stop injecting faults.
+
+        :param error_rate: The fraction of responses that get one of `error_statuses`. Defaults to 0.0
+        :type error_rate: float, optional
+        :param error_statuses: The statuses to pick from for error responses. 429 responses include `Retry-After: 0`. Defaults to (429, 503)
+        :type error_statuses: Sequence[int], optional
+        :param timeout_rate: The fraction of responses that hang for `hang` seconds first, so that clients time out. Defaults to 0.0
+        :type timeout_rate: float, optional
+        :param hang: The number of seconds a hung response waits. Defaults to 5.0
+        :type hang: float, optional
+        :param latency: Seconds to wait before every response, instead of the server's usual delay. Defaults to 0.0
+        :type latency: float, optional
+        :param jitter: The maximum random seconds added on top of `latency`. Defaults to 0.0
+        :type jitter: float, optional
+        :param body_delay: Seconds spent sending each response body, spread over several pieces. Defaults to 0.0
+        :type body_delay: float, optional
+        :param seed: A seed for the fault randomness, to make runs reproducible. Defaults to None
+        :type seed: int, optional
+        """
+        self._server.faults = _FaultProfile(error_rate=error_rate, error_statuses=error_statuses, timeout_rate=timeout_rate, hang=hang,
+                                            latency=latency, jitter=jitter, body_delay=body_delay, seed=seed)
+
+    def Start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+
+    def Stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._thread = None